@@ -59,6 +59,83 @@ class ECSPulseConfiguration(object):
         self.database_retentionPolicyDuration = parser[DATABASE_CONNECTION_CONFIG]['RetentionPolicyDuration']
         self.database_retentionPolicyReplicationFactor = parser[DATABASE_CONNECTION_CONFIG]['RetentionPolicyReplicationFactor']
 
+        # Precision of the integer epoch timestamps written to Influx
+        self.database_time_precision = parser[DATABASE_CONNECTION_CONFIG].get('timePrecision') or "s"
+        if self.database_time_precision not in ['s', 'ms']:
+            raise InvalidConfigurationException("Influx time precision can be only one of ['s', 'ms']")
+
+        # Optional direct line protocol serialization of the points written to Influx
+        line_protocol_writes_raw = parser[DATABASE_CONNECTION_CONFIG].get('lineProtocolWrites') or "false"
+        if line_protocol_writes_raw.lower() not in ['true', 'false']:
+            raise InvalidConfigurationException("Influx line protocol writes can be only one of ['true', 'false']")
+        self.database_line_protocol_writes = line_protocol_writes_raw.lower() == 'true'
+
+        # Transport the points of every measurement are written to Influx with
+        self.database_write_transport = parser[DATABASE_CONNECTION_CONFIG].get('writeTransport') or "http"
+        self.database_measurement_transports = parser[DATABASE_CONNECTION_CONFIG].get('measurementTransports') or {}
+        self.database_udp_port = parser[DATABASE_CONNECTION_CONFIG].get('udpPort') or "8089"
+        self.database_udp_payload_size = parser[DATABASE_CONNECTION_CONFIG].get('udpPayloadSize') or "1400"
+
+        if self.database_write_transport not in ['http', 'gzip', 'udp']:
+            raise InvalidConfigurationException("The Influx write transport can be only one of ['http', 'gzip', 'udp']")
+        for i, j in self.database_measurement_transports.items():
+            if j not in ['http', 'gzip', 'udp']:
+                raise InvalidConfigurationException("The Influx write transport of " + j + " for measurement " + i +
+                                                    " can be only one of ['http', 'gzip', 'udp']")
+        if not self.database_udp_port.isnumeric():
+            raise InvalidConfigurationException("The Influx UDP port of " + self.database_udp_port + " is not numeric.")
+        if not self.database_udp_payload_size.isnumeric() or int(self.database_udp_payload_size) < 1:
+            raise InvalidConfigurationException("The Influx UDP payload size of " + self.database_udp_payload_size +
+                                                " is not a number greater than 0.")
+
+        # Optional shared background writer that batches the points of all collectors
+        async_writes_raw = parser[DATABASE_CONNECTION_CONFIG].get('asyncWrites') or "false"
+        if async_writes_raw.lower() not in ['true', 'false']:
+            raise InvalidConfigurationException("Influx async writes can be only one of ['true', 'false']")
+        self.database_async_writes = async_writes_raw.lower() == 'true'
+
+        self.database_write_batch_size = parser[DATABASE_CONNECTION_CONFIG].get('writeBatchSize') or "5000"
+        self.database_write_flush_interval = parser[DATABASE_CONNECTION_CONFIG].get('writeFlushInterval') or "1"
+        self.database_write_queue_size = parser[DATABASE_CONNECTION_CONFIG].get('writeQueueSize') or "100000"
+        self.database_write_queue_full_policy = parser[DATABASE_CONNECTION_CONFIG].get('writeQueueFullPolicy') or \
+            "block"
+
+        if not self.database_write_batch_size.isnumeric() or int(self.database_write_batch_size) < 1:
+            raise InvalidConfigurationException("The Influx write batch size of " + self.database_write_batch_size +
+                                                " is not a number greater than 0.")
+        if not self.database_write_flush_interval.isnumeric():
+            raise InvalidConfigurationException("The Influx write flush interval of " +
+                                                self.database_write_flush_interval + " is not numeric.")
+        if not self.database_write_queue_size.isnumeric() or int(self.database_write_queue_size) < 1:
+            raise InvalidConfigurationException("The Influx write queue size of " + self.database_write_queue_size +
+                                                " is not a number greater than 0.")
+        if self.database_write_queue_full_policy not in ['block', 'drop']:
+            raise InvalidConfigurationException("The Influx write queue full policy can be only one of "
+                                                "['block', 'drop']")
+
+        # Optional durable spool for the points that can not be written while Influx is unavailable
+        self.database_spool_directory = parser[DATABASE_CONNECTION_CONFIG].get('spoolDirectory') or None
+        self.database_spool_segment_size = parser[DATABASE_CONNECTION_CONFIG].get('spoolSegmentSize') or "16"
+        self.database_spool_max_size = parser[DATABASE_CONNECTION_CONFIG].get('spoolMaxSize') or "1024"
+        self.database_spool_replay_max_points_per_second = \
+            parser[DATABASE_CONNECTION_CONFIG].get('spoolReplayMaxPointsPerSecond') or "5000"
+        self.database_spool_replay_interval = parser[DATABASE_CONNECTION_CONFIG].get('spoolReplayInterval') or "10"
+
+        if not self.database_spool_segment_size.isnumeric() or int(self.database_spool_segment_size) < 1:
+            raise InvalidConfigurationException("The Influx spool segment size of " +
+                                                self.database_spool_segment_size + " is not a number greater than 0.")
+        if not self.database_spool_max_size.isnumeric() or \
+                int(self.database_spool_max_size) < int(self.database_spool_segment_size):
+            raise InvalidConfigurationException("The Influx spool maximum size of " + self.database_spool_max_size +
+                                                " is not a number at least as large as the spool segment size.")
+        if not self.database_spool_replay_max_points_per_second.isnumeric():
+            raise InvalidConfigurationException("The Influx spool replay maximum points per second of " +
+                                                self.database_spool_replay_max_points_per_second + " is not numeric.")
+        if not self.database_spool_replay_interval.isnumeric() or int(self.database_spool_replay_interval) < 1:
+            raise InvalidConfigurationException("The Influx spool replay interval of " +
+                                                self.database_spool_replay_interval +
+                                                " is not a number greater than 0.")
+
         # Set default retention policy and duration if not set properly
         if not self.database_retentionPolicyName:
             self.database_retentionPolicyName = "ecsdashboarddataretention"
@@ -70,6 +147,84 @@ class ECSPulseConfiguration(object):
         # Grab ECS API Polling Intervals
         self.modules_intervals = parser[ECS_API_POLLING_INTERVALS]
 
+        # Capture raw billing responses to the temporary directory for debugging
+        billing_debug_capture_raw = parser[BASE_CONFIG].get('billingDebugCapture') or "false"
+        if billing_debug_capture_raw.lower() not in ['true', 'false']:
+            raise InvalidConfigurationException("Billing debug capture can be only one of ['true', 'false']")
+        self.billing_debug_capture = billing_debug_capture_raw.lower() == 'true'
+
+        # Optional on disk cache of ECS Management tokens
+        self.token_cache_file = parser[BASE_CONFIG].get('tokenCacheFile') or None
+
+        # Startup deadline for authenticating to all ECS and the retry interval for the ones that are unreachable
+        self.startup_deadline = parser[BASE_CONFIG].get('startupDeadline') or "30"
+        self.connect_retry_interval = parser[BASE_CONFIG].get('connectRetryInterval') or "60"
+
+        if not self.startup_deadline.isnumeric():
+            raise InvalidConfigurationException("The startup deadline of " + self.startup_deadline + " is not numeric.")
+        if not self.connect_retry_interval.isnumeric():
+            raise InvalidConfigurationException("The connect retry interval of " + self.connect_retry_interval +
+                                                " is not numeric.")
+
+        # Only write the dashboard history samples that are newer than the ones already written
+        incremental_ingestion_raw = parser[BASE_CONFIG].get('incrementalIngestion') or "false"
+        if incremental_ingestion_raw.lower() not in ['true', 'false']:
+            raise InvalidConfigurationException("Incremental ingestion can be only one of ['true', 'false']")
+        self.incremental_ingestion = incremental_ingestion_raw.lower() == 'true'
+
+        # A batch the background writer fails to write is gone once its samples have been marked as written
+        if self.incremental_ingestion and self.database_async_writes and not self.database_spool_directory:
+            raise InvalidConfigurationException("Incremental ingestion with Influx async writes requires an Influx "
+                                                "spool directory so that failed writes are not lost")
+
+        # Optional file the incremental ingestion watermarks are persisted to across restarts
+        self.watermark_file = parser[BASE_CONFIG].get('watermarkFile') or None
+
+        # Backfill of the history samples missed while ecs-pulse was down or an ECS or Influx was unreachable
+        backfill_raw = parser[BASE_CONFIG].get('backfill') or "false"
+        if backfill_raw.lower() not in ['true', 'false']:
+            raise InvalidConfigurationException("Backfill can be only one of ['true', 'false']")
+        self.backfill = backfill_raw.lower() == 'true'
+
+        if self.backfill and not self.incremental_ingestion:
+            raise InvalidConfigurationException("Backfill requires incremental ingestion to be enabled")
+
+        self.backfill_batch_size = parser[BASE_CONFIG].get('backfillBatchSize') or "5000"
+        self.backfill_max_points_per_second = parser[BASE_CONFIG].get('backfillMaxPointsPerSecond') or "2000"
+
+        if not self.backfill_batch_size.isnumeric() or int(self.backfill_batch_size) < 1:
+            raise InvalidConfigurationException("The backfill batch size of " + self.backfill_batch_size +
+                                                " is not a number greater than 0.")
+        if not self.backfill_max_points_per_second.isnumeric():
+            raise InvalidConfigurationException("The backfill maximum points per second of " +
+                                                self.backfill_max_points_per_second + " is not numeric.")
+
+        # Collection engine used to drive the ECS API polling
+        self.collection_engine = parser[BASE_CONFIG].get('collectionEngine') or "thread"
+        if self.collection_engine not in ['thread', 'asyncio']:
+            raise InvalidConfigurationException("The collection engine can be only one of ['thread', 'asyncio']")
+
+        # Optional asynchronous logging through a bounded in memory queue drained by a background thread
+        async_logging_raw = parser[BASE_CONFIG].get('asyncLogging') or "false"
+        if async_logging_raw.lower() not in ['true', 'false']:
+            raise InvalidConfigurationException("Async logging can be only one of ['true', 'false']")
+        self.async_logging = async_logging_raw.lower() == 'true'
+
+        self.log_queue_size = parser[BASE_CONFIG].get('logQueueSize') or "10000"
+        if not self.log_queue_size.isnumeric() or int(self.log_queue_size) < 1:
+            raise InvalidConfigurationException("The log queue size of " + self.log_queue_size +
+                                                " is not a number greater than 0.")
+
+        self.log_queue_full_policy = parser[BASE_CONFIG].get('logQueueFullPolicy') or "drop"
+        if self.log_queue_full_policy not in ['drop', 'block']:
+            raise InvalidConfigurationException("The log queue full policy can be only one of ['drop', 'block']")
+
+        # Identical errors logged within this many seconds are collapsed into a single line with a count
+        self.error_suppression_window = parser[BASE_CONFIG].get('errorSuppressionWindow') or "60"
+        if not self.error_suppression_window.isnumeric():
+            raise InvalidConfigurationException("The error suppression window of " + self.error_suppression_window +
+                                                " is not numeric.")
+
         # Validate logging level
         if logging_level_raw not in ['debug', 'info', 'warning', 'error']:
             raise InvalidConfigurationException(
@@ -103,8 +258,101 @@ class ECSPulseConfiguration(object):
             if not ecsconnection['category']:
                 ecsconnection['category'] = "default"
 
+            if ecsconnection['dataType'] not in ['default', 'current', 'history']:
+                raise InvalidConfigurationException("The ECS dashboard dataType can be only one of "
+                                                    "['default', 'current', 'history']")
+
             if not ecsconnection['connectTimeout']:
                 ecsconnection['connectTimeout'] = "15"
 
             if not ecsconnection['readTimeout']:
                 ecsconnection['readTimeout'] = "60"
+
+            # Validate proactive token refresh age
+            if not ecsconnection.get('tokenMaxAge'):
+                ecsconnection['tokenMaxAge'] = "25200"
+
+            if not ecsconnection['tokenMaxAge'].isnumeric():
+                raise InvalidConfigurationException("The ECS Management token maximum age of " +
+                                                    ecsconnection['tokenMaxAge'] + " is not numeric.")
+
+            # Validate connection pool settings
+            if not ecsconnection.get('poolSize'):
+                ecsconnection['poolSize'] = "10"
+
+            if not ecsconnection.get('poolKeepAlive'):
+                ecsconnection['poolKeepAlive'] = "true"
+
+            if not ecsconnection.get('poolMaxIdle'):
+                ecsconnection['poolMaxIdle'] = "300"
+
+            if not ecsconnection['poolSize'].isnumeric() or int(ecsconnection['poolSize']) < 1:
+                raise InvalidConfigurationException("The ECS Management connection pool size of " +
+                                                    ecsconnection['poolSize'] + " is not a number greater than 0.")
+
+            if ecsconnection['poolKeepAlive'].lower() not in ['true', 'false']:
+                raise InvalidConfigurationException("The ECS Management connection pool keep alive "
+                                                    "setting can be only one of ['true', 'false']")
+
+            if not ecsconnection['poolMaxIdle'].isnumeric():
+                raise InvalidConfigurationException("The ECS Management connection pool maximum idle time of " +
+                                                    ecsconnection['poolMaxIdle'] + " is not numeric.")
+
+            # Validate billing crawl concurrency
+            if not ecsconnection.get('billingMaxInFlight'):
+                ecsconnection['billingMaxInFlight'] = "1"
+
+            if not ecsconnection['billingMaxInFlight'].isnumeric() or int(ecsconnection['billingMaxInFlight']) < 1:
+                raise InvalidConfigurationException("The ECS billing maximum in flight request count of " +
+                                                    ecsconnection['billingMaxInFlight'] +
+                                                    " is not a number greater than 0.")
+
+            # Validate billing collection mode
+            if not ecsconnection.get('billingMode'):
+                ecsconnection['billingMode'] = "bucket"
+
+            if ecsconnection['billingMode'] not in ['bucket', 'namespace']:
+                raise InvalidConfigurationException("The ECS billing mode can be only one of ['bucket', 'namespace']")
+
+            # Validate namespace and bucket enumeration page size
+            if not ecsconnection.get('enumerationPageSize'):
+                ecsconnection['enumerationPageSize'] = "1000"
+
+            if not ecsconnection['enumerationPageSize'].isnumeric() or int(ecsconnection['enumerationPageSize']) < 1:
+                raise InvalidConfigurationException("The ECS enumeration page size of " +
+                                                    ecsconnection['enumerationPageSize'] +
+                                                    " is not a number greater than 0.")
+
+            # Validate namespace and bucket metadata cache settings
+            if not ecsconnection.get('metadataCacheTTL'):
+                ecsconnection['metadataCacheTTL'] = "0"
+
+            if not ecsconnection.get('metadataCacheSize'):
+                ecsconnection['metadataCacheSize'] = "1000"
+
+            if not ecsconnection['metadataCacheTTL'].isnumeric():
+                raise InvalidConfigurationException("The ECS metadata cache time to live of " +
+                                                    ecsconnection['metadataCacheTTL'] + " is not numeric.")
+
+            if not ecsconnection['metadataCacheSize'].isnumeric() or int(ecsconnection['metadataCacheSize']) < 1:
+                raise InvalidConfigurationException("The ECS metadata cache size of " +
+                                                    ecsconnection['metadataCacheSize'] +
+                                                    " is not a number greater than 0.")
+
+            # Validate the limit of concurrent requests against this ECS used by the asyncio collection engine
+            if not ecsconnection.get('maxConcurrentRequests'):
+                ecsconnection['maxConcurrentRequests'] = "4"
+
+            if not ecsconnection['maxConcurrentRequests'].isnumeric() or \
+                    int(ecsconnection['maxConcurrentRequests']) < 1:
+                raise InvalidConfigurationException("The ECS max concurrent requests of " +
+                                                    ecsconnection['maxConcurrentRequests'] +
+                                                    " is not a number greater than 0.")
+
+            # Validate the time allowed for a single poll of this ECS before its data points are skipped for the cycle
+            if not ecsconnection.get('pollTimeout'):
+                ecsconnection['pollTimeout'] = "90"
+
+            if not ecsconnection['pollTimeout'].isnumeric() or int(ecsconnection['pollTimeout']) < 1:
+                raise InvalidConfigurationException("The ECS poll timeout of " + ecsconnection['pollTimeout'] +
+                                                    " is not a number greater than 0.")
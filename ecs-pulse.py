@@ -4,26 +4,47 @@ DELL EMC ECS API Data Collection Module.
 
 from configuration.ecs_pulse_configuration import ECSPulseConfiguration
 from logger import ecs_logger
+from ecs.ecs import ECS_ENDPOINTS
+from ecs.ecs import ECSException
 from ecs.ecs import ECSAuthentication
 from ecs.ecs import ECSManagementAPI
+from ecs.ecs import ECSTokenCache
 from ecs.ecs import ECSUtility
+from ecs.ecs import ECSWatermarks
+from influx.influx import InfluxBatchWriter
+from influx.influx import InfluxException
+from influx.influx import InfluxSpool
+from influx.influx import InfluxLineProtocolWriter
+from influx.influx import InfluxTransportRouter
+from influx.influx import InfluxUDPWriter
 from influx.influx import InfluxUtility
 from influxdb import InfluxDBClient
-import errno
-import datetime
+import asyncio
+import collections
+import concurrent.futures
 import os
 import traceback
 import signal
 import time
 import logging
 import threading
-import xml.etree.ElementTree as ET
+
+# The asyncio collection engine is optional and requires aiohttp
+try:
+    from ecs.ecs_async import ECSAsyncManagementAPI
+except ImportError:
+    ECSAsyncManagementAPI = None
 
 # Constants
 MODULE_NAME = "ECS_Data_Collection_Module"                  # Module Name
 INTERVAL = 30                                               # In seconds
 CONFIG_FILE = 'ecs_pulse_config.json'                       # Default Configuration File
 VDC_LOOKUP_FILE = 'ecs_vdc_lookup.json'                     # VDC ID Lookup File
+TIME_PRECISION_MULTIPLIERS = {'s': 1, 'ms': 1000}           # Epoch seconds to Influx time precision
+
+# Dashboard polling methods keyed by their configured name with the ECS endpoint each of them polls
+ECS_DASHBOARD_COLLECTORS = dict(('ecs_collect_' + name + '_data()', endpoint)
+                                for name, endpoint in ECS_ENDPOINTS.items() if endpoint.measurement is not None)
 
 # Globals
 _configuration = None
@@ -33,8 +54,14 @@ _ecsManagementUserPassword = None
 _logger = None
 _ecsAuthentication = list()
 _influxClient = None
+_influxWriter = None
+_influxSpool = None
+_influxRouter = None
 _ecsVDCLookup = None
 _ecsManagmentAPI = list()
+_ecsTokenCache = None
+_ecsWatermarks = None
+_ecsBackfill = None
 
 """
 Class to listen for signal termination for controlled shutdown
@@ -46,11 +73,21 @@ class ECSDataCollectionShutdown:
     kill_now = False
 
     def __init__(self):
+        # Set on shutdown so that threads waiting out an interval wake up right away.  Only other threads wait
+        # on it, the main thread must not as it also runs the signal handler.
+        self.event = threading.Event()
         signal.signal(signal.SIGINT, self.controlled_shutdown)
         signal.signal(signal.SIGTERM, self.controlled_shutdown)
 
     def controlled_shutdown(self, signum, frame):
         self.kill_now = True
+        self.event.set()
+
+    def wait(self, timeout):
+        """
+        Waits up to timeout seconds for a shutdown request.  Returns True if a shutdown was requested.
+        """
+        return self.event.wait(timeout)
 
 
 class ECSDataCollection(threading.Thread):
@@ -63,41 +100,206 @@ class ECSDataCollection(threading.Thread):
         self.pollinginterval = pollinginterval
         self.tempdir = tempdir
 
-        logger.info(MODULE_NAME + '::ECSDataCollection()::init method of class called')
+        logger.info('%s::ECSDataCollection()::init method of class called', MODULE_NAME)
 
     def run(self):
         try:
-            self.logger.info(MODULE_NAME + '::ECSDataCollection()::Starting thread with method: ' + self.method)
-
-            if self.method == 'ecs_collect_capacity_data()':
-                ecs_collect_capacity_data(self.influxclient, self.logger, self.ecsmanagmentapi, self.pollinginterval)
+            self.logger.info('%s::ECSDataCollection()::Starting thread with method: %s', MODULE_NAME, self.method)
+
+            if self.method in ECS_DASHBOARD_COLLECTORS:
+                ecs_collect_dashboard_data(self.influxclient, self.logger, self.ecsmanagmentapi, self.pollinginterval,
+                                           self.method, ECS_DASHBOARD_COLLECTORS[self.method])
+            elif self.method == 'ecs_collect_namespace_billing_data()':
+                ecs_collect_namespace_billing_data(self.influxclient, self.logger, self.ecsmanagmentapi,
+                                                   self.pollinginterval, self.tempdir)
             else:
-                if self.method == 'ecs_collect_local_zone_data()':
-                    ecs_collect_local_zone_data(self.influxclient, self.logger, self.ecsmanagmentapi, self.pollinginterval)
-                else:
-                    if self.method == 'ecs_collect_local_zone_node_data()':
-                        ecs_collect_local_zone_node_data(self.influxclient, self.logger, self.ecsmanagmentapi, self.pollinginterval)
-                    else:
-                        if self.method == 'ecs_collect_local_zone_disk_data()':
-                            ecs_collect_local_zone_disk_data(self.influxclient, self.logger, self.ecsmanagmentapi, self.pollinginterval)
-                        else:
-                            if self.method == 'ecs_collect_local_zone_replication_data()':
-                                ecs_collect_local_zone_replication_data(self.influxclient, self.logger, self.ecsmanagmentapi, self.pollinginterval)
-                            else:
-                                if self.method == 'ecs_collect_local_zone_replication_failure_data()':
-                                    ecs_collect_local_zone_replication_failure_data(self.influxclient, self.logger, self.ecsmanagmentapi, self.pollinginterval)
-                                else:
-                                    if self.method == 'ecs_collect_local_zone_bootstrap_data()':
-                                        ecs_collect_local_zone_bootstrap_data(self.influxclient, self.logger, self.ecsmanagmentapi, self.pollinginterval)
-                                    else:
-                                        if self.method == 'ecs_collect_namespace_billing_data()':
-                                            ecs_collect_namespace_billing_data(self.influxclient, self.logger, self.ecsmanagmentapi, self.pollinginterval, self.tempdir)
-                                        else:
-                                            self.logger.info(MODULE_NAME + '::ECSDataCollection()::Requested method ' +
-                                                             self.method + ' is not supported.')
+                self.logger.info('%s::ECSDataCollection()::Requested method %s is not supported.', MODULE_NAME,
+                                 self.method)
         except Exception as e:
-            _logger.error(MODULE_NAME + 'ECSDataCollection::run()::The following unexpected '
-                                        'exception occured: ' + str(e) + "\n" + traceback.format_exc())
+            _logger.error('%s::ECSDataCollection::run()::The following unexpected exception occured: %s', MODULE_NAME,
+                          e, exc_info=True)
+
+
+class ECSBackfill(threading.Thread):
+    """
+    Writes the dashboard history samples that were missed while ecs-pulse was down or while an ECS or Influx
+    could not be reached.  Every ECS is backfilled once it is first authenticated and again once it is polled
+    successfully after a failed poll.  The history is requested from ECS and the samples newer than the
+    watermarks from before the gap are written in large batches at a limited rate so the live collectors are
+    not starved.
+    """
+    def __init__(self, influxclient, logger, ecsmanagmentapi, endpoints, batchsize, maxpointspersecond):
+        threading.Thread.__init__(self)
+        self.influxclient = influxclient
+        self.logger = logger
+        self.ecsmanagmentapi = ecsmanagmentapi
+        self.endpoints = endpoints
+        self.batchsize = int(batchsize)
+        self.maxpointspersecond = float(maxpointspersecond)
+        self.lock = threading.Lock()
+        self.pending = collections.deque()
+        self.floors = {}
+        self.running = {}
+        self.seen = set()
+
+        # Watermarks from before startup.  They are the floor of the startup backfill of every ECS.
+        self.startup_watermarks = _ecsWatermarks.snapshot()
+
+        logger.info('%s::ECSBackfill()::init method of class called', MODULE_NAME)
+
+    def poll_failed(self, ecsconnection):
+        """
+        Remembers the watermarks of an ECS as they were before its first failed poll.  A poll that fails while
+        the ECS is backfilled starts a new gap that is backfilled after the running backfill.
+        """
+        with self.lock:
+            if ecsconnection not in self.floors or \
+                    self.floors[ecsconnection] is self.running.get(ecsconnection):
+                self.floors[ecsconnection] = _ecsWatermarks.snapshot(ecsconnection.authentication.host)
+
+    def poll_succeeded(self, ecsconnection):
+        """
+        Queues the backfill of an ECS that was polled successfully after a failed poll.  An ECS that is being
+        backfilled right now is not queued again.
+        """
+        with self.lock:
+            if ecsconnection in self.floors and ecsconnection not in self.pending and \
+                    ecsconnection not in self.running:
+                self.pending.append(ecsconnection)
+
+    def run(self):
+        self.logger.info('%s::ECSBackfill::run()::Starting gap backfill thread', MODULE_NAME)
+
+        while not controlledShutdown.kill_now:
+            # Queue the startup backfill of every ECS that has been authenticated since we last looked
+            for ecsconnection in list(self.ecsmanagmentapi):
+                if ecsconnection not in self.seen:
+                    self.seen.add(ecsconnection)
+                    prefix = ecsconnection.authentication.host + '|'
+                    with self.lock:
+                        self.floors.setdefault(ecsconnection, dict(
+                            (key, watermark) for key, watermark in self.startup_watermarks.items()
+                            if key.startswith(prefix)))
+                        if ecsconnection not in self.pending:
+                            self.pending.append(ecsconnection)
+
+            with self.lock:
+                ecsconnection = self.pending.popleft() if self.pending else None
+                floor = self.floors.get(ecsconnection)
+
+                # An ECS without a floor has been backfilled since it was queued
+                if floor is not None:
+                    self.running[ecsconnection] = floor
+
+            if ecsconnection is None:
+                controlledShutdown.wait(1)
+                continue
+
+            if floor is None:
+                continue
+
+            try:
+                if self.backfill(ecsconnection, floor):
+                    with self.lock:
+                        if self.floors.get(ecsconnection) is floor:
+                            self.floors.pop(ecsconnection, None)
+            except Exception as e:
+                # The floor is kept so the backfill is attempted again after the next successful poll
+                self.logger.error('%s::ECSBackfill::run()::Unable to backfill host %s. Cause: %s', MODULE_NAME,
+                                  ecsconnection.authentication.host, e, exc_info=True)
+            finally:
+                with self.lock:
+                    self.running.pop(ecsconnection, None)
+
+    def backfill(self, ecsconnection, floor):
+        """
+        Writes the history samples of an ECS that are newer than the floor watermarks.  Returns False if
+        the backfill was interrupted by a shutdown.
+        """
+        host = ecsconnection.authentication.host
+
+        for endpoint in self.endpoints:
+            response = ecsconnection.request(endpoint, {'dataType': 'history'})
+
+            if response.data is None:
+                raise ECSException("Unable to retrieve the " + endpoint.description + " history from host " + host +
+                                   ".  Status code: " + str(response.status))
+
+            try:
+                if not self.backfill_endpoint(ecsconnection, endpoint, response.data, floor):
+                    return False
+            finally:
+                # Release the connection of a stream that was not read to the end
+                if hasattr(response.data, 'close'):
+                    response.data.close()
+
+        return True
+
+    def backfill_endpoint(self, ecsconnection, endpoint, dashboard_data, floor):
+        """
+        Writes the history samples of one endpoint in batches as the instances are processed.  Returns False if
+        the backfill was interrupted by a shutdown.
+        """
+        marks = {}
+        points = []
+        written = 0
+        start_time = time.monotonic()
+
+        for fields, metrics, summary in ecs_dashboard_points(self.logger, ecsconnection, endpoint, dashboard_data,
+                                                             marks, floor):
+            # Entity fields are stamped with the current time and are left to the live collectors
+            points.extend(metrics)
+            points.extend(summary)
+
+            while len(points) >= self.batchsize:
+                if not self.write_batch(points[:self.batchsize], start_time, written):
+                    return False
+                written += self.batchsize
+                del points[:self.batchsize]
+
+        if points:
+            if not self.write_batch(points, start_time, written):
+                return False
+            written += len(points)
+
+        if marks:
+            _ecsWatermarks.update(marks)
+
+        self.logger.info('%s::ECSBackfill::backfill_endpoint()::Backfilled %s %s points for host %s', MODULE_NAME,
+                         written, endpoint.measurement, ecsconnection.authentication.host)
+
+        return True
+
+    def write_batch(self, batch, start_time, written):
+        """
+        Writes a batch of points and then waits long enough to stay below the configured write rate.  Returns
+        False if a shutdown was requested.
+        """
+        if controlledShutdown.kill_now:
+            return False
+
+        self.influxclient.write_points(batch, time_precision=_configuration.database_time_precision)
+
+        # Stay below the configured write rate
+        if self.maxpointspersecond > 0:
+            delay = start_time + (written + len(batch)) / self.maxpointspersecond - time.monotonic()
+            if delay > 0:
+                controlledShutdown.wait(delay)
+
+        return True
+
+
+def ecs_backfill_poll_result(ecsconnection, succeeded):
+    """
+    Tells the gap backfill whether a poll of an ECS succeeded
+    """
+    if _ecsBackfill is None:
+        return
+
+    if succeeded:
+        _ecsBackfill.poll_succeeded(ecsconnection)
+    else:
+        _ecsBackfill.poll_failed(ecsconnection)
 
 
 def ecs_check_for_integer(var_to_check):
@@ -111,20 +313,6 @@ def ecs_check_for_integer(var_to_check):
         return False
 
 
-def ecs_delete_file(file_to_delete):
-    global _logger
-
-    try:
-        # Load and validate module configuration
-        os.remove(file_to_delete)
-
-        _logger.debug(MODULE_NAME + '::ecs_delete_file()::Successfully deleted file ' + file_to_delete + '.')
-    except OSError as e:
-        if e.errno != errno.ENOENT:
-            _logger.error(MODULE_NAME + '::ecs_delete_file()::The following unexpected '
-                                        'exception occured: ' + str(e) + "\n" + traceback.format_exc())
-
-
 def ecs_config(config, vdc_config, temp_dir):
     global _configuration
     global _logger
@@ -138,1432 +326,983 @@ def ecs_config(config, vdc_config, temp_dir):
         _ecsVDCLookup = ECSUtility(_ecsAuthentication, _logger, vdc_config)
 
         # Grab loggers and log status
-        _logger = ecs_logger.get_logger(__name__, _configuration.logging_level)
-        _logger.info(MODULE_NAME + '::ecs_config()::We have configured logging level to: '
-                     + logging.getLevelName(str(_configuration.logging_level)))
-        _logger.info(MODULE_NAME + '::ecs_config()::Configuring ECS Data Collection Module complete.')
+        _logger = ecs_logger.get_logger(__name__, _configuration.logging_level,
+                                        async_logging=_configuration.async_logging,
+                                        queue_size=_configuration.log_queue_size,
+                                        queue_full_policy=_configuration.log_queue_full_policy,
+                                        error_suppression_window=_configuration.error_suppression_window)
+        _logger.info('%s::ecs_config()::We have configured logging level to: %s', MODULE_NAME,
+                     logging.getLevelName(str(_configuration.logging_level)))
+        _logger.info('%s::ecs_config()::Configuring ECS Data Collection Module complete.', MODULE_NAME)
     except Exception as e:
-        _logger.error(MODULE_NAME + '::ecs_config()::The following unexpected '
-                                    'exception occured: ' + str(e) + "\n" + traceback.format_exc())
-
-
-def ecs_collect_capacity_data(influxclient, logger, ecsmanagmentapi, pollinginterval):
-
-    try:
-        # Start polling loop
-        while True:
-            # Perform API call against each configured ECS
-            for ecsconnection in ecsmanagmentapi:
-                # Retrieve capacity data via API
-                capacity_data = ecsconnection.get_capacity_data()
-
-                if capacity_data is None:
-                    logger.info(MODULE_NAME + '::ecs_collect_capacity_data()::Unable to retrieve ECS Dashboard Capacity Information')
-                    return
-                else:
-                    """
-                    We have the raw JSON data now lets prep it for Influx
-                    """
+        _logger.error('%s::ecs_config()::The following unexpected exception occured: %s', MODULE_NAME, e,
+                      exc_info=True)
+
+
+def ecs_poll_executor():
+    """
+    Returns a worker pool large enough to poll every configured ECS at the same time
+    """
+    return concurrent.futures.ThreadPoolExecutor(max_workers=max(1, len(_configuration.ecsconnections)))
+
+
+def ecs_poll_connections(influxclient, logger, method, ecsmanagmentapi, executor, endpoint, outstanding):
+    """
+    Retrieves data from all ECS concurrently and writes it to Influx.  An ECS that fails or does not answer
+    within its poll timeout only loses its own data points for this cycle.  Outstanding holds the last poll
+    of every ECS.  An ECS whose last poll is still running is not polled again, so a stalled ECS holds on to
+    a single worker of the pool.
+    """
+    start_time = time.monotonic()
+    polls = []
+
+    # Fire off the API call against every ECS.  The response is also processed by the worker so a streamed
+    # response is downloaded and written within the poll timeout of its ECS.
+    for ecsconnection in list(ecsmanagmentapi):
+        previous = outstanding.get(ecsconnection)
+        if previous is not None and not previous.done():
+            logger.error('%s::%s::The previous poll of %s from host %s is still in flight, skipping this cycle',
+                         MODULE_NAME, method, endpoint.description, ecsconnection.authentication.host)
+            ecs_backfill_poll_result(ecsconnection, False)
+            continue
+
+        outstanding[ecsconnection] = executor.submit(ecs_poll_dashboard, influxclient, logger, ecsconnection,
+                                                     endpoint, start_time + ecsconnection.polltimeout)
+        polls.append((ecsconnection, outstanding[ecsconnection]))
+
+    # Wait for the polls in order.  Every ECS gets its full poll timeout counted from the start of the cycle.
+    for ecsconnection, poll in polls:
+        host = ecsconnection.authentication.host
+        try:
+            response = poll.result(timeout=max(0.0, start_time + ecsconnection.polltimeout - time.monotonic()))
 
-                    # Declare locals
-                    current_time = datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S")
-                    current_epoch_time = time.time()
-                    db_array = []
-                    ecsdata = {}
-                    ecsdata_metrics = {}
-                    ecsdata_summary = {}
-                    fields = {}
-                    tags = {}
-                    target_name = "Capacity"
+            if response.data is None:
+                logger.error('%s::%s::Unable to retrieve %s from host %s.  Status code: %s', MODULE_NAME, method,
+                             endpoint.description, host, response.status)
+                ecs_backfill_poll_result(ecsconnection, False)
+            else:
+                ecs_backfill_poll_result(ecsconnection, True)
+        except concurrent.futures.TimeoutError:
+            logger.error('%s::%s::Timed out after %s seconds retrieving %s from host %s', MODULE_NAME, method,
+                         ecsconnection.polltimeout, endpoint.description, host)
+            ecs_backfill_poll_result(ecsconnection, False)
+        except Exception as e:
+            logger.error('%s::%s::Unable to collect %s from host %s. Cause: %s', MODULE_NAME, method,
+                         endpoint.description, host, e, exc_info=True)
+            ecs_backfill_poll_result(ecsconnection, False)
 
-                    # Grab VDC Name
-                    tags['vdc'] = _ecsVDCLookup.vdc_json[ecsconnection.authentication.host]
 
-                    # Process remaining data in JSON
-                    for field in capacity_data:
-                        # Process individual data field
-                        if type(capacity_data[field]) is int:
-                            try:
-                                logger.debug(MODULE_NAME + '::ecs_collect_capacity_data()::field from capacity_data being processed is: ' + field)
-                                ecsdata[field] = float(capacity_data[field])
-                            except Exception:
-                                try:
-                                    # We're here because trying to convert to a float failed.  Store whatever value is there
-                                    ecsdata[field] = capacity_data[field].encode("utf-8")
-                                except Exception:
-                                    pass
-                        # Process list fields
-                        elif type(capacity_data[field]) is list:
-                            logger.debug(MODULE_NAME + '::ecs_collect_data()::field from capacity_data being processed is: ' + field)
-                            ecsconnection.get_ecs_detail_data(field=field, metric_list=capacity_data[field], metric_values=ecsdata_metrics)
-                        else:
-                            # Process dictionary fields
-                            logger.debug(MODULE_NAME + '::ecs_collect_data()::field from capacity_data being processed is: ' + field)
-                            ecsconnection.get_ecs_summary_data(field=field, summary_dict=capacity_data[field],
-                                                             current_epoch=current_epoch_time, summary_values=ecsdata_summary)
+def ecs_poll_dashboard(influxclient, logger, ecsconnection, endpoint, deadline):
+    """
+    Retrieves an endpoint from a single ECS and writes its data to Influx.  Processing stops with an
+    ECSException once the deadline has passed.  Returns the response.
+    """
+    response = ecsconnection.request(endpoint)
 
-                    # Create Influx DB Info Dictionary for our string fields and add it to the db list
-                    db_json = {
-                        "measurement": target_name,
-                        "tags": tags,
-                        "fields": ecsdata,
-                        "time": current_time
-                    }
-                    db_array.append(db_json.copy())
-
-                    #  Create Influx DB Info Dictionary for our list fields and add it to the db list
-                    for times in ecsdata_metrics:
-                        influxdb_time = datetime.datetime.utcfromtimestamp(int(times))
-                        influxdb_time = influxdb_time.strftime("%Y-%m-%dT%H:%M:%S")
-
-                        db_json = {
-                            "measurement": target_name+"Metrics",
-                            "tags": tags,
-                            "fields": ecsdata_metrics[times],
-                            "time": influxdb_time
-                        }
-                        db_array.append(db_json.copy())
-
-                    #  Create Influx DB Info Dictionary for our dictionary fields and add it to the db list
-                    for times in ecsdata_summary:
-                        influxdb_time = datetime.datetime.utcfromtimestamp(int(times))
-                        influxdb_time = influxdb_time.strftime("%Y-%m-%dT%H:%M:%S")
-
-                        db_json = {
-                            "measurement": target_name+"Summary",
-                            "tags": tags,
-                            "fields": ecsdata_summary[times],
-                            "time": influxdb_time
-                        }
-                        db_array.append(db_json.copy())
-
-                    # Write data to Influx
-                    influxclient.write_points(db_array)
+    if response.data is not None:
+        logger.debug('%s::ecs_poll_dashboard()::Retrieved %s bytes of %s from host %s in %.3f seconds', MODULE_NAME,
+                     response.bytes, endpoint.description, ecsconnection.authentication.host, response.latency)
+        try:
+            ecs_process_dashboard_data(influxclient, logger, ecsconnection, endpoint, response.data, deadline)
+        finally:
+            # Release the connection of a stream that was not read to the end
+            if hasattr(response.data, 'close'):
+                response.data.close()
+
+    return response
+
+
+def ecs_process_dashboard_data(influxclient, logger, ecsconnection, endpoint, dashboard_data, deadline=None):
+    """
+    We have the raw JSON data now lets prep it for Influx as described by the endpoint and write it.  The
+    instances of a stream endpoint are written as they are decoded so only one instance is held at a time.
+    """
+    marks = {}
+    entity_points = ecs_dashboard_points(logger, ecsconnection, endpoint, dashboard_data, marks)
+
+    if endpoint.stream:
+        writes = (fields + metrics + summary for fields, metrics, summary in entity_points)
+    elif endpoint.shape == 'instances':
+        # Each entity is written on its own, all entity fields first then all metrics and all summaries
+        entity_points = list(entity_points)
+        writes = [fields for fields, metrics, summary in entity_points] + \
+                 [metrics for fields, metrics, summary in entity_points] + \
+                 [summary for fields, metrics, summary in entity_points]
+    else:
+        writes = (fields + metrics + summary for fields, metrics, summary in entity_points)
+
+    for db_array in writes:
+        if deadline is not None and time.monotonic() > deadline:
+            raise ECSException("The poll timeout of host " + ecsconnection.authentication.host + " passed while "
+                               "writing " + endpoint.description)
+
+        # Nothing left to write once every sample of a series has been filtered out
+        if not db_array:
+            continue
+
+        # Write data to Influx.  Points dropped by the writer fail the poll so their samples are not marked as
+        # written and are picked up again by the next cycle or the backfill.
+        if influxclient.write_points(db_array, time_precision=_configuration.database_time_precision) is False:
+            raise InfluxException("Unable to write " + str(len(db_array)) + " " + endpoint.measurement +
+                                  " points of host " + ecsconnection.authentication.host + " to Influx")
+
+        # Dump array for debug
+        logger.debug('%s::ecs_process_dashboard_data()::%s db_array is: \r\n\r\n%s', MODULE_NAME,
+                     endpoint.measurement, db_array)
+
+    # Only advance the watermarks once all samples have been written so a failed write is retried next cycle
+    if marks:
+        _ecsWatermarks.update(marks)
+
+
+def ecs_dashboard_points(logger, ecsconnection, endpoint, dashboard_data, marks, floor=None):
+    """
+    Yields the (entity fields, metrics, summary) Influx DB points of every entity in the raw JSON data as
+    soon as its instance has been processed.  When incremental ingestion is enabled only history samples
+    newer than the current watermarks, or the given floor, are yielded and the watermarks to record once
+    the points have been written are added to marks.
+    """
+
+    # Declare locals
+    current_epoch_time = time.time()
+    current_time = ecs_influx_time(current_epoch_time)
+    timestamps = {}
+    tags = {}
+    target_name = endpoint.measurement
+
+    # Grab VDC Name
+    tags['vdc'] = _ecsVDCLookup.vdc_json[ecsconnection.authentication.host]
+
+    # Check the logging level once rather than for every field of every instance
+    debug_enabled = logger.is_enabled_for(logging.DEBUG)
+
+    # History samples that were already written are skipped when incremental ingestion is enabled.  Series
+    # without their own sample times are stamped with the current time and always written.
+    watermarks = _ecsWatermarks if endpoint.series_time else None
+    host = ecsconnection.authentication.host
+
+    # Instance endpoints carry one entity per instance, the others are a single entity.  Stream endpoints
+    # already hand us an iterator over their instances so only one raw instance is held at a time.
+    if endpoint.stream:
+        instances = dashboard_data
+    elif endpoint.shape == 'instances':
+        instances = dashboard_data['_embedded']['_instances']
+    else:
+        instances = [dashboard_data]
+
+    for instance in instances:
+
+        # Remove data points from raw json we are not interested in
+        for field in endpoint.drop_fields:
+            instance.pop(field, None)
+
+        if endpoint.shape == 'instances':
+            entity = instance[endpoint.instance_key]
+            entity_tags = dict(tags)
+            entity_tags[endpoint.tag_key] = entity
+        else:
+            entity = None
+            entity_tags = tags
+
+        ecsdata = {}
+        ecsdata_metrics = {}
+        ecsdata_summary = {}
+
+        # Process remaining data in JSON
+        for field in instance:
+            if debug_enabled:
+                logger.debug('%s::ecs_dashboard_points()::field from %s data being processed is: %s',
+                             MODULE_NAME, endpoint.name, field)
+
+            # Process individual data field
+            if type(instance[field]) is endpoint.value_type:
+                try:
+                    ecsdata[field] = float(instance[field])
+                except Exception:
+                    try:
+                        # We're here because trying to convert to a float failed.  Store whatever value is there
+                        ecsdata[field] = instance[field].encode("utf-8")
+                    except Exception:
+                        pass
+            # Process list fields
+            elif type(instance[field]) is list:
+                ecsconnection.get_ecs_detail_data(field=field, metric_list=instance[field],
+                                                  metric_values=ecsdata_metrics)
+            # Process dictionary fields
+            else:
+                ecsconnection.get_ecs_summary_data(field=field, summary_dict=instance[field],
+                                                   current_epoch=current_epoch_time,
+                                                   summary_values=ecsdata_summary)
+
+        # Create the Influx DB points of the entity.  The entity fields come first followed by the points of
+        # our list fields and our dictionary fields
+        db_json = {
+            "measurement": target_name,
+            "tags": entity_tags,
+            "fields": ecsdata,
+            "time": current_time
+        }
+
+        if watermarks is not None:
+            ecsdata_metrics = watermarks.filter(host, target_name + endpoint.metrics_suffix, entity,
+                                                ecsdata_metrics, marks, floor)
+            ecsdata_summary = watermarks.filter(host, target_name + endpoint.summary_suffix, entity,
+                                                ecsdata_summary, marks, floor)
+
+        yield ([db_json],
+               ecs_series_points(target_name + endpoint.metrics_suffix, entity_tags, ecsdata_metrics,
+                                 endpoint.series_time, current_time, timestamps),
+               ecs_series_points(target_name + endpoint.summary_suffix, entity_tags, ecsdata_summary,
+                                 endpoint.series_time, current_time, timestamps))
+
+
+def ecs_influx_time(epoch_time):
+    """
+    Returns the integer Influx timestamp at the configured time precision of an epoch time in seconds
+    """
+    return int(float(epoch_time) * TIME_PRECISION_MULTIPLIERS[_configuration.database_time_precision])
+
+
+def ecs_series_points(measurement, tags, series, series_time, current_time, timestamps):
+    """
+    Returns the Influx DB points of a history series keyed by epoch time.  The Influx timestamps of the
+    sample times are memoized in timestamps as every entity of a cycle shares the same sample times.
+    """
+    db_array = []
+
+    for times in series:
+        if series_time:
+            influxdb_time = timestamps.get(times)
+            if influxdb_time is None:
+                influxdb_time = timestamps[times] = ecs_influx_time(times)
+        else:
+            influxdb_time = current_time
 
-                    # Dump array for debug
-                    logger.debug(MODULE_NAME + '::ecs_collect_capacity_data()::'
-                                               'Capacity db_array is: \r\n\r\n'.join(str(db_array)))
+        db_json = {
+            "measurement": measurement,
+            "tags": tags,
+            "fields": series[times],
+            "time": influxdb_time
+        }
+        db_array.append(db_json)
 
-            if controlledShutdown.kill_now:
-                print(MODULE_NAME + "ecs_collect_capacity_data()::Shutdown detected.  Terminating polling.")
-                break
+    return db_array
 
-            # Wait for specific polling interval
-            time.sleep(float(pollinginterval))
-    except Exception as e:
-        _logger.error(MODULE_NAME + '::ecs_collect_capacity_data()::The following unexpected '
-                                    'exception occured: ' + str(e) + "\n" + traceback.format_exc())
 
+def ecs_collect_dashboard_data(influxclient, logger, ecsmanagmentapi, pollinginterval, method, endpoint):
 
-def ecs_collect_local_zone_data(influxclient, logger, ecsmanagmentapi, pollinginterval):
+    # Worker pool used to poll all configured ECS at the same time and the last poll of each ECS
+    poll_executor = ecs_poll_executor()
+    outstanding = {}
 
     try:
         # Start polling loop
         while True:
+            # Perform API call against all configured ECS concurrently
+            ecs_poll_connections(influxclient, logger, method, ecsmanagmentapi, poll_executor, endpoint,
+                                 outstanding)
 
-            # Perform API call against each configured ECS
-            for ecsconnection in ecsmanagmentapi:
-
-                # Retrieve local zone data via API
-                local_zone_data = ecsconnection.get_local_zone_data()
-
-                if local_zone_data is None:
-                    logger.error(MODULE_NAME + '::ecs_collect_local_zone_data()::'
-                                               'Unable to retrieve ECS Dashboard Local Zone Information')
-                    return
-                else:
-                    """
-                    We have the raw JSON data now lets prep it for Influx
-                    """
-
-                    # Declare locals
-                    current_time = datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S")
-                    current_epoch_time = time.time()
-                    db_array = []
-                    ecsdata = {}
-                    ecsdata_metrics = {}
-                    ecsdata_summary = {}
-                    fields = {}
-                    tags = {}
-                    target_name = "dashboard_local_zone"
-
-                    # Remove data points from raw json we are not interested in
-                    local_zone_data.pop('_links', None)
-                    local_zone_data.pop('transactionErrors', None)
-                    local_zone_data.pop('transactionErrorsSummary', None)
-                    local_zone_data.pop('transactionErrorsCurrent', None)
-
-                    # Grab VDC Name
-                    tags['vdc'] = _ecsVDCLookup.vdc_json[ecsconnection.authentication.host]
-
-                    # Process remaining data in JSON
-                    for field in local_zone_data:
-                        # Process individual data field
-                        if type(local_zone_data[field]) is str:
-                            try:
-                                logger.debug(MODULE_NAME + '::ecs_collect_local_zone_data()::'
-                                                           'field from local_zone_data being processed is: ' + field)
-                                ecsdata[field] = float(local_zone_data[field])
-                            except Exception:
-                                try:
-                                    # We're here because trying to convert to a float failed.
-                                    # Convert unicode value to string and store whatever value is there
-                                    ecsdata[field] = local_zone_data[field].encode("utf-8")
-                                except Exception:
-                                    pass
-                        # Process list fields
-                        elif type(local_zone_data[field]) is list:
-                            logger.debug(MODULE_NAME + '::ecs_collect_local_zone_data()::'
-                                                       'field from local_zone_data being processed is: ' + field)
-                            ecsconnection.get_ecs_detail_data(field=field, metric_list=local_zone_data[field], metric_values=ecsdata_metrics)
-                        else:
-                            # Process dictionary fields
-                            logger.debug(MODULE_NAME + '::ecs_collect_local_zone_data()::'
-                                                       'field from local_zone_data being processed is: ' + field)
-                            ecsconnection.get_ecs_summary_data(field=field, summary_dict=local_zone_data[field],
-                                                             current_epoch=current_epoch_time, summary_values=ecsdata_summary)
-
-                    # Create Influx DB Info Dictionary for our string fields and add it to the db list
-                    db_json = {
-                        "measurement": target_name,
-                        "tags": tags,
-                        "fields": ecsdata,
-                        "time": current_time
-                    }
-                    db_array.append(db_json.copy())
-
-                    #  Create Influx DB Info Dictionary for our list fields and add it to the db list
-                    for times in ecsdata_metrics:
-                        influxdb_time = datetime.datetime.utcfromtimestamp(int(times))
-                        influxdb_time = influxdb_time.strftime("%Y-%m-%dT%H:%M:%S")
-
-                        db_json = {
-                            "measurement": target_name+"_metrics",
-                            "tags": tags,
-                            "fields": ecsdata_metrics[times],
-                            "time": current_time
-                        }
-                        db_array.append(db_json.copy())
-
-                    #  Create Influx DB Info Dictionary for our dictionary fields and add it to the db list
-                    for times in ecsdata_summary:
-                        influxdb_time = datetime.datetime.utcfromtimestamp(int(times))
-                        influxdb_time = influxdb_time.strftime("%Y-%m-%dT%H:%M:%S")
-
-                        db_json = {
-                            "measurement": target_name+"_summary",
-                            "tags": tags,
-                            "fields": ecsdata_summary[times],
-                            "time": current_time
-                        }
-                        db_array.append(db_json.copy())
-
-                    # Write data to Influx
-                    influxclient.write_points(db_array)
-
-                    # Dump array for debug
-                    logger.debug(MODULE_NAME + '::ecs_collect_local_zone_data()::'
-                                               'Local Zone db_array is: \r\n\r\n'.join(str(db_array)))
-
-            if controlledShutdown.kill_now:
-                print(MODULE_NAME + "ecs_collect_local_zone_data()::"
-                                    "Shutdown detected.  Terminating polling.")
+            # Wait for specific polling interval, a shutdown request ends the wait right away
+            if controlledShutdown.wait(float(pollinginterval)):
+                print(MODULE_NAME + method + "::Shutdown detected.  Terminating polling.")
                 break
-
-            # Wait for specific polling interval
-            time.sleep(float(pollinginterval))
     except Exception as e:
-        _logger.error(MODULE_NAME + '::ecs_collect_local_zone_data()::The following unexpected '
-                                    'exception occured: ' + str(e) + "\n" + traceback.format_exc())
+        _logger.error('%s::%s::The following unexpected exception occured: %s', MODULE_NAME, method, e,
+                      exc_info=True)
+    finally:
+        poll_executor.shutdown(wait=False)
+
+
+def ecs_crawl_bucket_billing(ecsconnection, namespace, buckets, tempdir, executor):
+    """
+    Retrieves the billing information of each bucket in a namespace and yields (bucket, billing information)
+    pairs in bucket order.  When an executor is provided up to the configured maximum number of billing
+    calls for the ECS are kept in flight at the same time.
+    """
+    if executor is None:
+        for bucket in buckets:
+            yield bucket, ecsconnection.get_namespace_billing_data(namespace, bucket['name'], tempdir).data
+    else:
+        in_flight = collections.deque()
+
+        for bucket in buckets:
+            in_flight.append((bucket, executor.submit(ecsconnection.get_namespace_billing_data,
+                                                      namespace, bucket['name'], tempdir)))
+
+            # Hand back the oldest call once we have reached the in flight limit
+            if len(in_flight) >= ecsconnection.billingmaxinflight:
+                completed_bucket, future = in_flight.popleft()
+                yield completed_bucket, future.result().data
+
+        while in_flight:
+            completed_bucket, future = in_flight.popleft()
+            yield completed_bucket, future.result().data
+
+
+def ecs_crawl_namespace_billing(ecsconnection, namespace, buckets, tempdir):
+    """
+    Retrieves the billing information of every bucket in a namespace with paged namespace level billing
+    calls and yields (bucket, billing information) pairs in bucket order.  A failed billing page raises
+    ECSException rather than leaving every bucket of the namespace out of its totals.
+    """
+    bucket_billing_info = ecsconnection.get_namespace_bucket_billing_data(namespace, tempdir)
+
+    if bucket_billing_info is None:
+        raise ECSException("Unable to retrieve the namespace billing information of namespace " + namespace +
+                           " from host " + ecsconnection.authentication.host)
+
+    for bucket in buckets:
+        yield bucket, bucket_billing_info.get(bucket['name'])
+
+
+def ecs_process_namespace_billing_data(influxclient, logger, ecsconnection, tempdir, billing_executor):
+    """
+    Crawls the namespace and bucket billing information of an ECS and writes the metering data points to Influx
+    """
+    # Lets set a timestamp that we can use for all data points written during this cycle
+    current_time = ecs_influx_time(time.time())
+
+    # Walk the namespaces page by page.  For each namespace grab needed info
+    # and then grab all the buckets for that namespace
+    for namespace in ecsconnection.iter_namespaces():
+        # Stop a long crawl between namespaces on shutdown, namespaces already written keep complete totals
+        if controlledShutdown.kill_now:
+            logger.info('%s::ecs_process_namespace_billing_data()::Shutdown detected.  Stopping the billing '
+                        'crawl of host %s.', MODULE_NAME, ecsconnection.authentication.host)
+            break
 
+        ns_name = namespace['name']
+        ns_id = namespace['id']
+        ns_block_size = namespace['blockSize']
+        ns_notification_size = namespace['notificationSize']
+        ns_total_size_f = 0.0
+        ns_total_objects_f = 0.0
+        ns_total_size_bytes = 0.0
+        ns_total_protected_size_bytes = 0.0
+
+        if ecs_check_for_integer(ns_block_size):
+            ns_block_size_int = int(ns_block_size)
+            if ns_block_size_int > 0:
+                ns_block_size_bytes = float(ns_block_size) * 1073741824
+            else:
+                ns_block_size_bytes = 0
+                ns_block_size = 0
+        else:
+            ns_block_size_bytes = 0
+            ns_block_size = 0
 
-def ecs_collect_local_zone_node_data(influxclient, logger, ecsmanagmentapi, pollinginterval):
+        if ecs_check_for_integer(ns_notification_size):
+            ns_notification_size_int = int(ns_notification_size)
+            if ns_notification_size_int > 0:
+                ns_notification_size_bytes = float(ns_notification_size) * 1073741824
+            else:
+                ns_notification_size_bytes = 0
+                ns_notification_size = 0
+        else:
+            ns_notification_size_bytes = 0
+            ns_notification_size = 0
+
+        db_array_ns = []
+        ecsdata_ns = {}
+        fields_ns = {}
+        tags_ns = {}
+        target_name_ns = "metering_stats_namespace"
+
+        # Enumerate the buckets of the namespace page by page as the billing crawl consumes them
+        buckets = ecsconnection.iter_buckets(ns_name)
+
+        # Retrieve the billing information for each bucket either with paged namespace
+        # level calls or with a call per bucket.  Bucket calls are fanned out over the
+        # ECS billing worker pool when a concurrent crawl is configured while the
+        # results are still processed here, in bucket order, so that namespace
+        # totals are accumulated by a single thread
+        if ecsconnection.billingmode == 'namespace':
+            bucket_billing = ecs_crawl_namespace_billing(ecsconnection, ns_name, buckets, tempdir)
+        else:
+            bucket_billing = ecs_crawl_bucket_billing(ecsconnection, ns_name, buckets,
+                                                      tempdir, billing_executor)
+
+        for bucket, billing_info in bucket_billing:
+            bucket_name = bucket['name']
+            soft_quota = bucket['softquota']
+            block_size = bucket['block_size']
+            notification_size = bucket['notification_size']
+
+            # Lets calculate quota sizes in bytes if provided -
+            # Quota Values are always set in GiB on ECS but we want them in bytes
+            if ecs_check_for_integer(soft_quota):
+                soft_quota_int = int(soft_quota)
+                if soft_quota_int > 0:
+                    soft_quota_size_bytes = float(soft_quota) * 1073741824
+                else:
+                    soft_quota_size_bytes = 0
+                    soft_quota = 0
+            else:
+                soft_quota_size_bytes = 0
+                soft_quota = 0
 
-    try:
-        # Start polling loop
-        while True:
+            if ecs_check_for_integer(block_size):
+                block_size_int = int(block_size)
+                if block_size_int > 0:
+                    block_size_bytes = float(block_size) * 1073741824
+                else:
+                    block_size_bytes = 0
+                    block_size = 0
+            else:
+                block_size_bytes = 0
+                block_size = 0
 
-            # Perform API call against each configured ECS
-            for ecsconnection in ecsmanagmentapi:
+            if ecs_check_for_integer(notification_size):
+                notification_size_int = int(notification_size)
+                if notification_size_int < 0:
+                    notification_size = 0
+            else:
+                notification_size = 0
 
-                # Retrieve local zone node data via API
-                local_zone_node_data = ecsconnection.get_local_zone_node_data()
+            if billing_info is None:
+                # If we had an issue just log the error and keep going to the next bucket
+                logger.info('%s::ecs_collect_namespace_billing_data()::Unable to retrieve Metering information for '
+                            '%s and bucket %s', MODULE_NAME, ns_name, bucket_name)
+            else:
+                # We have metering information for the bucket and namespace so lets
+                # create an InfluxDB datapoint
+                try:
+                    # Grab VDC Name
+                    vdc = _ecsVDCLookup.vdc_json[ecsconnection.authentication.host]
+                    managementIp = ecsconnection.authentication.host
 
-                if local_zone_node_data is None:
-                    logger.error(MODULE_NAME + '::ecs_collect_local_zone_node_data()::'
-                                               'Unable to retrieve ECS Dashboard Local Zone Node Information')
-                    return
-                else:
-                    """
-                    We have the raw JSON data now lets prep it for Influx
-                    """
+                    vpool_id = billing_info.find('vpool_id').text
+                    total_size = billing_info.find('total_size').text
+                    total_objects = billing_info.find('total_objects').text
 
-                    # Declare locals
-                    current_time = datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S")
+                    # We have parsed our metering file for
+                    # the current bucket now lets create a data point
                     current_epoch_time = time.time()
                     db_array = []
                     ecsdata = {}
-                    ecsdata_metrics = {}
-                    ecsdata_summary = {}
                     fields = {}
                     tags = {}
-                    target_name = "LocalZoneNodes"
+                    target_name = "metering_stats"
 
+                    # Setup measurement tags.
                     tags['vdc'] = _ecsVDCLookup.vdc_json[ecsconnection.authentication.host]
-
-                    # Grab just node information
-                    zone_node_data = local_zone_node_data['_embedded']['_instances']
-
-                    # Using 'local_zone_node_data' so we can re-use code without changing references
-                    for local_zone_node_data in zone_node_data:
-
-                        # Not handling a few metrics for now
-                        local_zone_node_data.pop('_links', None)
-                        local_zone_node_data.pop('transactionErrors', None)
-                        local_zone_node_data.pop('transactionErrorsSummary', None)
-                        local_zone_node_data.pop('transactionErrorsCurrent', None)
-
-                        node_display_name = local_zone_node_data['displayName']
-                        ecsdata[node_display_name] = {}
-                        ecsdata_metrics[node_display_name] = {}
-                        ecsdata_summary[node_display_name] = {}
-
-                        for field in local_zone_node_data:
-                            if type(local_zone_node_data[field]) is str:
-                                try:
-                                    logger.debug(MODULE_NAME + '::ecs_collect_local_zone_node_data()::field from '
-                                                               'local_zone_node_data being processed is: ' + field)
-                                    ecsdata[node_display_name][field] = float(local_zone_node_data[field])
-                                except Exception as ex1:
-                                    try:
-                                        # We're here because trying to convert to a float failed.
-                                        ecsdata[node_display_name][field] = local_zone_node_data[field].encode("utf-8")
-                                    except Exception as ex2:
-                                        pass
-
-                            elif type(local_zone_node_data[field]) is list:
-                                logger.debug(MODULE_NAME + '::ecs_collect_local_zone_node_data()::field from '
-                                                           'local_zone_node_data being processed is: ' + field)
-
-                                ecsconnection.get_ecs_detail_data(field=field, metric_list=local_zone_node_data[field],
-                                                                metric_values=ecsdata_metrics[node_display_name])
-
-                            else:
-                                logger.debug(MODULE_NAME + '::ecs_collect_local_zone_node_data()::field from '
-                                                           'local_zone_node_data being processed is: ' + field)
-
-                                ecsconnection.get_ecs_summary_data(field=field, summary_dict=local_zone_node_data[field],
-                                                                 current_epoch=current_epoch_time, summary_values=ecsdata_summary[node_display_name])
-
-                    for node_display_name in ecsdata:
-                        db_array = []
-                        tags['NodeID'] = node_display_name
-                        db_json = {
-                            "measurement": target_name,
-                            "tags": tags,
-                            "fields": ecsdata[node_display_name],
-                            "time": current_time
-                        }
-                        db_array.append(db_json.copy())
-                        influxclient.write_points(db_array)
-                        logger.debug(MODULE_NAME + '::ecs_collect_local_zone_node_data()::'
-                                                   'Local Zone Node data db_array is: \r\n\r\n'.join(str(db_array)))
-
-                    for node_display_name in ecsdata_metrics:
-                        db_array = []
-                        tags['NodeID'] = node_display_name
-
-                        for times in ecsdata_metrics[node_display_name]:
-
-                            influxdb_time = datetime.datetime.utcfromtimestamp(int(times))
-                            influxdb_time = influxdb_time.strftime("%Y-%m-%dT%H:%M:%S")
-
-                            db_json = {
-                                "measurement": target_name+"Metrics",
-                                "tags": tags,
-                                "fields": ecsdata_metrics[node_display_name][times],
-                                "time": influxdb_time
-                            }
-                            db_array.append(db_json.copy())
-
-                        influxclient.write_points(db_array)
-                    logger.debug(MODULE_NAME + '::ecs_collect_local_zone_node_data()::'
-                                               'Local Zone Node metrics db_array is: \r\n\r\n'.join(str(db_array)))
-
-                    for node_display_name in ecsdata_summary:
-                        db_array = []
-                        tags['NodeID'] = node_display_name
-
-                        for times in ecsdata_summary[node_display_name]:
-                            influxdb_time = datetime.datetime.utcfromtimestamp(int(times))
-                            influxdb_time = influxdb_time.strftime("%Y-%m-%dT%H:%M:%S")
-
-                            db_json = {
-                                "measurement": target_name+"Summary",
-                                "tags": tags,
-                                "fields": ecsdata_summary[node_display_name][times],
-                                "time": influxdb_time
-                            }
-                            db_array.append(db_json.copy())
-
-                        influxclient.write_points(db_array)
-                        logger.debug(MODULE_NAME + '::ecs_collect_local_zone_node_data()::'
-                                                   'Local Zone Node summary db_array is: \r\n\r\n'.join(str(db_array)))
-
-            if controlledShutdown.kill_now:
-                print(MODULE_NAME + "ecs_collect_local_zone_node_data()::Shutdown detected.  Terminating polling.")
-                break
-
-            # Wait for specific polling interval
-            time.sleep(float(pollinginterval))
-    except Exception as e:
-        _logger.error(MODULE_NAME + '::ecs_collect_local_zone_node_data()::The following unexpected '
-                                    'exception occured: ' + str(e) + "\n" + traceback.format_exc())
-
-
-def ecs_collect_local_zone_disk_data(influxclient, logger, ecsmanagmentapi, pollinginterval):
-
-    while True:
-
-        # Perform API call against each configured ECS
-        for ecsconnection in ecsmanagmentapi:
-
-            # Retrieve local zone disk data via API
-            local_zone_disk_data = ecsconnection.get_local_zone_disk_data()
-
-            if local_zone_disk_data is None:
-                logger.error(MODULE_NAME + '::ecs_collect_local_zone_disk_data()::'
-                                            'Unable to retrieve ECS Dashboard Local Zone Disk Information')
-                return
-            else:
-                """
-                We have the raw JSON data now lets prep it for Influx
-                """
-
-                # Declare locals
-                current_time = datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S")
-                current_epoch_time = time.time()
-                db_array = []
-                ecsdata = {}
-                ecsdata_metrics = {}
-                ecsdata_summary = {}
-                fields = {}
-                tags = {}
-                target_name = "LocalZoneDisks"
-
-                tags['vdc'] = _ecsVDCLookup.vdc_json[ecsconnection.authentication.host]
-
-                # Grab just node information
-                zone_disk_data = local_zone_disk_data['_embedded']['_instances']
-
-                # Using 'local_zone_disk_data' so we can re-use code without changing references
-                for local_zone_disk_data in zone_disk_data:
-
-                    # Not handling a few metrics for now
-                    local_zone_disk_data.pop('_links', None)
-
-                    disk_display_name = local_zone_disk_data['displayName']
-                    ecsdata[disk_display_name] = {}
-                    ecsdata_metrics[disk_display_name] = {}
-                    ecsdata_summary[disk_display_name] = {}
-
-                    for field in local_zone_disk_data:
-                        if type(local_zone_disk_data[field]) is str:
-                            try:
-                                logger.debug(MODULE_NAME + '::ecs_collect_local_zone_disk_data()::field from '
-                                                            'local_zone_disk_data being processed is: ' + field)
-                                ecsdata[disk_display_name][field] = float(local_zone_disk_data[field])
-                            except Exception as ex1:
-                                try:
-                                    # We're here because trying to convert to a float failed.
-                                    ecsdata[disk_display_name][field] = local_zone_disk_data[field].encode("utf-8")
-                                except Exception as ex2:
-                                    pass
-
-                        elif type(local_zone_disk_data[field]) is list:
-                            logger.debug(MODULE_NAME + '::ecs_collect_local_zone_disk_data()::field from '
-                                                        'local_zone_disk_data being processed is: ' + field)
-                            ecsconnection.get_ecs_detail_data(field=field, metric_list=local_zone_disk_data[field],
-                                                            metric_values=ecsdata_metrics[disk_display_name])
-
+                    tags['namespace'] = ns_name
+                    tags['bucket'] = bucket_name
+                    # tags['virtual_pool_id'] = vpool_id
+
+                    # We always grab capacity data in KB and we want to convert it to bytes
+                    total_size_f = float(total_size)
+                    total_size_bytes = total_size_f * 1024.00
+                    total_protected_size_bytes = total_size_bytes * 1.33
+
+                    # Calculate average object sizes if
+                    # objects and size are greater than zero
+                    total_objects_f = float(total_objects)
+                    if total_objects_f > 0:
+                        if total_size_f > 0:
+                            average_object_size_f = total_size_bytes / total_objects_f
                         else:
-                            logger.debug(MODULE_NAME + '::ecs_collect_local_zone_disk_data()::field from '
-                                                        'local_zone_disk_data being processed is: ' + field)
-                            ecsconnection.get_ecs_summary_data(field=field, summary_dict=local_zone_disk_data[field],
-                                                             current_epoch=current_epoch_time, summary_values=ecsdata_summary[disk_display_name])
+                            average_object_size_f = 0.0
+                    else:
+                        average_object_size_f = 0.0
+
+                    # If we have hard and / or soft quotas
+                    # lets calculate quota utilization %
+                    if soft_quota_size_bytes > 0:
+                        if total_size_bytes > 0:
+                            soft_quota_utilization = total_size_bytes / soft_quota_size_bytes
+                            soft_quota_utilization_protected = total_protected_size_bytes / soft_quota_size_bytes
+                        else:
+                            soft_quota_utilization = 0
+                            soft_quota_utilization_protected = 0
+                    else:
+                        soft_quota_utilization = 0
+                        soft_quota_utilization_protected = 0
 
-                for disk_display_name in ecsdata:
-                    db_array = []
-                    tags['DiskID'] = disk_display_name
+                    if block_size_bytes > 0:
+                        if total_size_bytes > 0:
+                            hard_quota_utilization = total_size_bytes / block_size_bytes
+                            hard_quota_utilization_protected = total_protected_size_bytes / block_size_bytes
+                        else:
+                            hard_quota_utilization = 0
+                            hard_quota_utilization_protected = 0
+                    else:
+                        hard_quota_utilization = 0
+                        hard_quota_utilization_protected = 0
+
+                    # Add bucket level details to namespace totals
+                    ns_total_size_f += total_size_f
+                    ns_total_objects_f += total_objects_f
+                    ns_total_size_bytes += total_size_bytes
+                    ns_total_protected_size_bytes += total_protected_size_bytes
+
+                    # Load dictionary of values
+                    ecsdata[bucket_name] = {}
+                    try:
+                        ecsdata[bucket_name]['total_size'] = float(total_size_bytes)
+                    except Exception as ex1:
+                        try:
+                            # We're here because trying to convert to a float failed.
+                            ecsdata[bucket_name]['total_size'] = total_size_bytes
+                        except Exception as ex2:
+                            pass
+
+                    try:
+                        ecsdata[bucket_name]['total_objects'] = float(total_objects)
+                    except Exception as ex3:
+                        try:
+                            # We're here because trying to convert to a float failed.
+                            ecsdata[bucket_name]['total_objects'] = total_objects
+                        except Exception as ex4:
+                            pass
+
+                    try:
+                        ecsdata[bucket_name]['soft_quota'] = float(soft_quota)
+                    except Exception as ex5:
+                        try:
+                            # We're here because trying to convert to a float failed.
+                            ecsdata[bucket_name]['soft_quota'] = soft_quota
+                        except Exception as ex6:
+                            pass
+
+                    try:
+                        ecsdata[bucket_name]['hard_quota'] = float(block_size)
+                    except Exception as ex7:
+                        try:
+                            # We're here because trying to convert to a float failed.
+                            ecsdata[bucket_name]['hard_quota'] = block_size
+                        except Exception as ex8:
+                            pass
+
+                    try:
+                        ecsdata[bucket_name]['notification_size'] = float(notification_size)
+                    except Exception as ex7:
+                        try:
+                            # We're here because trying to convert to a float failed.
+                            ecsdata[bucket_name]['notification_size'] = notification_size
+                        except Exception as ex8:
+                            pass
+
+                    try:
+                        ecsdata[bucket_name]['average_size'] = float(average_object_size_f)
+                    except Exception as ex7:
+                        try:
+                            # We're here because trying to convert to a float failed.
+                            ecsdata[bucket_name]['average_size'] = average_object_size_f
+                        except Exception as ex8:
+                            pass
+
+                    try:
+                        ecsdata[bucket_name]['soft_quota_utilization'] = float(soft_quota_utilization)
+                    except Exception as ex7:
+                        try:
+                            # We're here because trying to convert to a float failed.
+                            ecsdata[bucket_name]['soft_quota_utilization'] = soft_quota_utilization
+                        except Exception as ex8:
+                            pass
+
+                    try:
+                        ecsdata[bucket_name]['hard_quota_utilization'] = float(hard_quota_utilization)
+                    except Exception as ex7:
+                        try:
+                            # We're here because trying to convert to a float failed.
+                            ecsdata[bucket_name]['hard_quota_utilization'] = hard_quota_utilization
+                        except Exception as ex8:
+                            pass
+
+                    try:
+                        ecsdata[bucket_name]['total_protected_size'] = float(total_protected_size_bytes)
+                    except Exception as ex7:
+                        try:
+                            # We're here because trying to convert to a float failed.
+                            ecsdata[bucket_name]['total_protected_size'] = total_protected_size_bytes
+                        except Exception as ex8:
+                            pass
+
+                    try:
+                        ecsdata[bucket_name]['soft_quota_utilization_protected'] = float(soft_quota_utilization_protected)
+                    except Exception as ex7:
+                        try:
+                            # We're here because trying to convert to a float failed.
+                            ecsdata[bucket_name]['soft_quota_utilization_protected'] = soft_quota_utilization_protected
+                        except Exception as ex8:
+                            pass
+
+                    try:
+                        ecsdata[bucket_name]['hard_quota_utilization_protected'] = float(hard_quota_utilization_protected)
+                    except Exception as ex7:
+                        try:
+                            # We're here because trying to convert to a float failed.
+                            ecsdata[bucket_name]['hard_quota_utilization_protected'] = hard_quota_utilization_protected
+                        except Exception as ex8:
+                            pass
+
+                    # Create Influx DB Info Dictionary for
+                    # our string fields and add it to the db list
                     db_json = {
                         "measurement": target_name,
                         "tags": tags,
-                        "fields": ecsdata[disk_display_name],
+                        "fields": ecsdata[bucket_name],
                         "time": current_time
                     }
-                    db_array.append(db_json.copy())
-                    influxclient.write_points(db_array)
-                    logger.debug(MODULE_NAME + '::ecs_collect_local_zone_disk_data()::Local Zone Failed Disk data db_array is: \r\n\r\n'.join(str(db_array)))
-
-                for disk_display_name in ecsdata_metrics:
-                    db_array = []
-                    tags['DiskID'] = disk_display_name
-
-                    for times in ecsdata_metrics[disk_display_name]:
-
-                        influxdb_time = datetime.datetime.utcfromtimestamp(int(times))
-                        influxdb_time = influxdb_time.strftime("%Y-%m-%dT%H:%M:%S")
-
-                        db_json = {
-                            "measurement": target_name+"Metrics",
-                            "tags": tags,
-                            "fields": ecsdata_metrics[disk_display_name][times],
-                            "time": influxdb_time
-                        }
-                        db_array.append(db_json.copy())
-
-                    influxclient.write_points(db_array)
-                    logger.debug(MODULE_NAME + '::ecs_collect_local_zone_disk_data()::Local Zone Failed Disk metrics db_array is: \r\n\r\n'.join(str(db_array)))
-
-                for disk_display_name in ecsdata_summary:
-                    db_array = []
-                    tags['DiskID'] = disk_display_name
-
-                    for times in ecsdata_summary[disk_display_name]:
-                        influxdb_time = datetime.datetime.utcfromtimestamp(int(times))
-                        influxdb_time = influxdb_time.strftime("%Y-%m-%dT%H:%M:%S")
+                    db_array.append(db_json)
 
-                        db_json = {
-                            "measurement": target_name+"Summary",
-                            "tags": tags,
-                            "fields": ecsdata_summary[disk_display_name][times],
-                            "time": influxdb_time
-                        }
-                        db_array.append(db_json.copy())
+                    # Write data to Influx
+                    influxclient.write_points(db_array, time_precision=_configuration.database_time_precision)
 
-                    influxclient.write_points(db_array)
-                    logger.debug(MODULE_NAME + '::ecs_collect_local_zone_disk_data()::'
-                                               'Local Zone Failed Disk summary db_array is: \r\n\r\n'.join(str(db_array)))
+                    # Dump array for debug
+                    logger.debug('%s::ecs_collect_namespace_billing_data()::Billing db_array is: \r\n\r\n%s',
+                                 MODULE_NAME, db_array)
+
+                except Exception as ex:
+                    logger.error('%s::ecs_collect_namespace_billing_data()::The following unexpected exception '
+                                 'occurred: %s', MODULE_NAME, ex, exc_info=True)
+        # Let log namespace level info
+        tags_ns['vdc'] = _ecsVDCLookup.vdc_json[ecsconnection.authentication.host]
+        tags_ns['namespace'] = ns_name
+        ecsdata_ns[ns_name] = {}
+
+        # Calculate average object sizes for the namespace if
+        # objects and size are greater than zero
+        if ns_total_objects_f > 0:
+            if ns_total_size_f > 0:
+                ns_average_object_size_f = ns_total_size_f / ns_total_objects_f
+            else:
+                ns_average_object_size_f = 0.0
+        else:
+            ns_average_object_size_f = 0.0
+
+        # If we have hard and / or soft quotas
+        # lets calculate quota utilization %
+        if ns_notification_size_bytes > 0:
+            if ns_total_size_bytes > 0:
+                ns_soft_quota_utilization = ns_total_size_bytes / ns_notification_size_bytes
+                ns_soft_quota_utilization_protected = ns_total_protected_size_bytes / ns_notification_size_bytes
+            else:
+                ns_soft_quota_utilization = 0
+                ns_soft_quota_utilization_protected = 0
+        else:
+            ns_soft_quota_utilization = 0
+            ns_soft_quota_utilization_protected = 0
 
-        if controlledShutdown.kill_now:
-            print(MODULE_NAME + "ecs_collect_local_zone_disk_data()::Shutdown detected.  Terminating polling.")
-            break
+        if ns_block_size_bytes > 0:
+            if ns_total_size_bytes > 0:
+                ns_hard_quota_utilization = ns_total_size_bytes / ns_block_size_bytes
+                ns_hard_quota_utilization_protected = ns_total_protected_size_bytes / ns_block_size_bytes
+            else:
+                ns_hard_quota_utilization = 0
+                ns_hard_quota_utilization_protected = 0
+        else:
+            ns_hard_quota_utilization = 0
+            ns_hard_quota_utilization_protected = 0
 
-        # Wait for specific polling interval
-        time.sleep(float(pollinginterval))
+        # Add namespace values to the array for writing to Influx
+        try:
+            ecsdata_ns[ns_name]['ns_average_size'] = float(ns_average_object_size_f)
+        except Exception as ex5:
+            try:
+                # We're here because trying to convert to a float failed.
+                ecsdata_ns[ns_name]['ns_average_size'] = ns_average_object_size_f
+            except Exception as ex6:
+                pass
 
+        try:
+            ecsdata_ns[ns_name]['ns_hard_quota'] = float(ns_block_size)
+        except Exception as ex5:
+            try:
+                # We're here because trying to convert to a float failed.
+                ecsdata_ns[ns_name]['ns_hard_quota'] = ns_block_size
+            except Exception as ex6:
+                pass
 
-def ecs_collect_local_zone_replication_data(influxclient, logger, ecsmanagmentapi, pollinginterval):
+        try:
+            ecsdata_ns[ns_name]['ns_soft_quota'] = float(ns_notification_size)
+        except Exception as ex7:
+            try:
+                # We're here because trying to convert to a float failed.
+                ecsdata_ns[ns_name]['ns_soft_quota'] = ns_notification_size
+            except Exception as ex8:
+                pass
 
-    while True:
+        try:
+            ecsdata_ns[ns_name]['ns_total_size'] = float(ns_total_size_bytes)
+        except Exception as ex1:
+            try:
+                # We're here because trying to convert to a float failed.
+                ecsdata_ns[ns_name]['ns_total_size'] = ns_total_size_bytes
+            except Exception as ex2:
+                pass
 
-        # Perform API call against each configured ECS
-        for ecsconnection in ecsmanagmentapi:
+        try:
+            ecsdata_ns[ns_name]['ns_total_objects'] = float(ns_total_objects_f)
+        except Exception as ex1:
+            try:
+                # We're here because trying to convert to a float failed.
+                ecsdata_ns[ns_name]['ns_total_objects'] = ns_total_objects_f
+            except Exception as ex2:
+                pass
 
-            # Retrieve local zone replication data via API
-            local_zone_replication_data = ecsconnection.get_local_zone_replication_data()
+        try:
+            ecsdata_ns[ns_name]['ns_total_protected_size'] = float(ns_total_protected_size_bytes)
+        except Exception as ex1:
+            try:
+                # We're here because trying to convert to a float failed.
+                ecsdata_ns[ns_name]['ns_total_protected_size'] = ns_total_protected_size_bytes
+            except Exception as ex2:
+                pass
 
-            if local_zone_replication_data is None:
-                logger.error(MODULE_NAME + '::ecs_collect_local_zone_replication_data()::Unable to retrieve ECS Dashboard Local Replication Node Information')
-                return
-            else:
-                """
-                We have the raw JSON data now lets prep it for Influx
-                """
-
-                # Declare locals
-                current_time = datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S")
-                current_epoch_time = time.time()
-                db_array = []
-                ecsdata = {}
-                ecsdata_metrics = {}
-                ecsdata_summary = {}
-                fields = {}
-                tags = {}
-                target_name = "LocalZoneReplication"
-
-                tags['vdc'] = _ecsVDCLookup.vdc_json[ecsconnection.authentication.host]
-
-                # Grab just node information
-                replication_data = local_zone_replication_data['_embedded']['_instances']
-
-                # Using 'local_zone_replication_data' so we can re-use code without changing references
-                for local_zone_replication_data in replication_data:
-
-                    # Not handling a few metrics for now
-                    local_zone_replication_data.pop('_links', None)
-
-                    node_name = local_zone_replication_data['name']
-                    ecsdata[node_name] = {}
-                    ecsdata_metrics[node_name] = {}
-                    ecsdata_summary[node_name] = {}
-
-                    for field in local_zone_replication_data:
-                        if type(local_zone_replication_data[field]) is str:
-                            try:
-                                logger.debug(MODULE_NAME + '::ecs_collect_local_zone_replication_data()::field from '
-                                                            'local_zone_replication_data being processed is: ' + field)
-                                ecsdata[node_name][field] = float(local_zone_replication_data[field])
-                            except Exception as ex1:
-                                try:
-                                    # We're here because trying to convert to a float failed.
-                                    ecsdata[node_name][field] = local_zone_replication_data[field].encode("utf-8")
-                                except Exception as ex2:
-                                    pass
-
-                        elif type(local_zone_replication_data[field]) is list:
-                            logger.debug(MODULE_NAME + '::ecs_collect_local_zone_replication_data()::field from '
-                                                        'local_zone_replication_data being processed is: ' + field)
-                            ecsconnection.get_ecs_detail_data(field=field, metric_list=local_zone_replication_data[field],
-                                                            metric_values=ecsdata_metrics[node_name])
+        try:
+            ecsdata_ns[ns_name]['ns_soft_quota_utilization'] = float(ns_soft_quota_utilization)
+        except Exception as ex1:
+            try:
+                # We're here because trying to convert to a float failed.
+                ecsdata_ns[ns_name]['ns_soft_quota_utilization'] = ns_soft_quota_utilization
+            except Exception as ex2:
+                pass
 
-                        else:
-                            logger.debug(MODULE_NAME + '::ecs_collect_data()::field from '
-                                                        'local_zone_replication_data being processed is: ' + field)
-                            ecsconnection.get_ecs_summary_data(field=field, summary_dict=local_zone_replication_data[field],
-                                                             current_epoch=current_epoch_time, summary_values=ecsdata_summary[node_name])
+        try:
+            ecsdata_ns[ns_name]['ns_hard_quota_utilization'] = float(ns_hard_quota_utilization)
+        except Exception as ex1:
+            try:
+                # We're here because trying to convert to a float failed.
+                ecsdata_ns[ns_name]['ns_hard_quota_utilization'] = ns_hard_quota_utilization
+            except Exception as ex2:
+                pass
 
-                for node_name in ecsdata:
-                    db_array = []
-                    tags['ReplicationGroupID'] = node_name
-                    db_json = {
-                        "measurement": target_name,
-                        "tags": tags,
-                        "fields": ecsdata[node_name],
-                        "time": current_time
-                    }
-                    db_array.append(db_json.copy())
-                    influxclient.write_points(db_array)
+        try:
+            ecsdata_ns[ns_name]['ns_soft_quota_utilization_protected'] = float(ns_soft_quota_utilization_protected)
+        except Exception as ex1:
+            try:
+                # We're here because trying to convert to a float failed.
+                ecsdata_ns[ns_name]['ns_soft_quota_utilization_protected'] = ns_soft_quota_utilization_protected
+            except Exception as ex2:
+                pass
 
-                    # Dump array for debug
-                    logger.debug(MODULE_NAME + '::ecs_collect_local_zone_replication_data()::Local Zone Replication field db_array is: \r\n\r\n'.join(str(db_array)))
+        try:
+            ecsdata_ns[ns_name]['ns_hard_quota_utilization_protected'] = float(ns_hard_quota_utilization_protected)
+        except Exception as ex1:
+            try:
+                # We're here because trying to convert to a float failed.
+                ecsdata_ns[ns_name]['ns_hard_quota_utilization_protected'] = ns_hard_quota_utilization_protected
+            except Exception as ex2:
+                pass
+        # Create Influx DB Info Dictionary for
+        # our string fields and add it to the db list
+        db_json_ns = {
+            "measurement": target_name_ns,
+            "tags": tags_ns,
+            "fields": ecsdata_ns[ns_name],
+            "time": current_time
+        }
+        db_array_ns.append(db_json_ns)
+
+        # Write data to Influx
+        influxclient.write_points(db_array_ns, time_precision=_configuration.database_time_precision)
+
+        # Dump array for debug
+        logger.debug('%s::ecs_collect_namespace_billing_data()::Namespace Billing db_array is: \r\n\r\n%s',
+                     MODULE_NAME, db_array_ns)
 
-                for node_name in ecsdata_metrics:
-                    db_array = []
-                    tags['ReplicationGroupID'] = node_name
 
-                    for times in ecsdata_metrics[node_name]:
+def ecs_collect_namespace_billing_data(influxclient, logger, ecsmanagmentapi, pollinginterval, tempdir):
 
-                        influxdb_time = datetime.datetime.utcfromtimestamp(int(times))
-                        influxdb_time = influxdb_time.strftime("%Y-%m-%dT%H:%M:%S")
+    # Worker pool used to crawl all configured ECS at the same time
+    poll_executor = ecs_poll_executor()
 
-                        db_json = {
-                            "measurement": target_name+"Metrics",
-                            "tags": tags,
-                            "fields": ecsdata_metrics[node_name][times],
-                            "time": influxdb_time
-                        }
-                        db_array.append(db_json.copy())
-                    influxclient.write_points(db_array)
+    # Worker pools used to crawl bucket billing information concurrently keyed by ECS connection
+    billing_executors = {}
 
-                    # Dump array for debug
-                    logger.debug(MODULE_NAME + '::ecs_collect_local_zone_replication_data()::Local Zone Replication metrics db_array is: \r\n\r\n'.join(str(db_array)))
+    try:
+        # Start polling loop
+        while True:
+            crawls = []
+
+            # Start the crawl of each configured ECS
+            for ecsconnection in list(ecsmanagmentapi):
+
+                # Create the billing worker pool for this ECS if a concurrent crawl is configured
+                if ecsconnection.billingmaxinflight > 1 and ecsconnection not in billing_executors:
+                    billing_executors[ecsconnection] = concurrent.futures.ThreadPoolExecutor(
+                        max_workers=ecsconnection.billingmaxinflight)
+                billing_executor = billing_executors.get(ecsconnection)
+
+                # Crawl the namespace and bucket billing information of this ECS
+                crawls.append((ecsconnection, poll_executor.submit(ecs_process_namespace_billing_data, influxclient,
+                                                                   logger, ecsconnection, tempdir, billing_executor)))
+
+            # Wait for all crawls so a crawl never overlaps with the next cycle of the same ECS
+            for ecsconnection, crawl in crawls:
+                try:
+                    crawl.result()
+                except Exception as e:
+                    logger.error('%s::ecs_collect_namespace_billing_data()::Unable to collect billing information '
+                                 'from host %s. Cause: %s', MODULE_NAME, ecsconnection.authentication.host, e,
+                                 exc_info=True)
+
+            # Wait for specific polling interval, a shutdown request ends the wait right away
+            if controlledShutdown.wait(float(pollinginterval)):
+                print(MODULE_NAME + "ecs_collect_namespace_billing_data()::Shutdown detected.  Terminating polling.")
+                break
+    except Exception as e:
+        _logger.error('%s::ecs_collect_namespace_billing_data()::The following unexpected exception occured: %s',
+                      MODULE_NAME, e, exc_info=True)
+    finally:
+        poll_executor.shutdown(wait=False)
+        for billing_executor in billing_executors.values():
+            billing_executor.shutdown(wait=False)
 
-                for node_name in ecsdata_summary:
-                    db_array = []
-                    tags['ReplicationGroupID'] = node_name
 
-                    for times in ecsdata_summary[node_name]:
-                        influxdb_time = datetime.datetime.utcfromtimestamp(int(times))
-                        influxdb_time = influxdb_time.strftime("%Y-%m-%dT%H:%M:%S")
+async def ecs_async_poll(method, influxclient, logger, ecsconnection, asyncapi, pollinginterval, tempdir,
+                         billing_executors):
+    loop = asyncio.get_event_loop()
 
-                        db_json = {
-                            "measurement": target_name+"Summary",
-                            "tags": tags,
-                            "fields": ecsdata_summary[node_name][times],
-                            "time": influxdb_time
-                        }
-                        db_array.append(db_json.copy())
+    # Poll a single ECS with a single method.  Failures are logged and the next poll is attempted after the
+    # polling interval so one ECS can not stall the collection of the others.
+    while True:
+        try:
+            if method == 'ecs_collect_namespace_billing_data()':
+                # The billing crawl is blocking so it gets its own worker for this ECS
+                if ecsconnection not in billing_executors:
+                    if ecsconnection.billingmaxinflight > 1:
+                        crawl_executor = concurrent.futures.ThreadPoolExecutor(
+                            max_workers=ecsconnection.billingmaxinflight)
+                    else:
+                        crawl_executor = None
+                    billing_executors[ecsconnection] = (concurrent.futures.ThreadPoolExecutor(max_workers=1),
+                                                        crawl_executor)
+                billing_executor, crawl_executor = billing_executors[ecsconnection]
 
-                    influxclient.write_points(db_array)
+                await loop.run_in_executor(billing_executor, ecs_process_namespace_billing_data, influxclient,
+                                           logger, ecsconnection, tempdir, crawl_executor)
+            else:
+                endpoint = ECS_DASHBOARD_COLLECTORS[method]
+                response = await asyncio.wait_for(asyncapi.request(endpoint), ecsconnection.polltimeout)
+
+                if response.data is None:
+                    logger.info('%s::ecs_async_poll()::Unable to retrieve data for method %s from ECS host %s.  '
+                                'Status code: %s', MODULE_NAME, method, ecsconnection.authentication.host,
+                                response.status)
+                    ecs_backfill_poll_result(ecsconnection, False)
+                else:
+                    await loop.run_in_executor(None, ecs_process_dashboard_data, influxclient, logger, ecsconnection,
+                                               endpoint, response.data)
+                    ecs_backfill_poll_result(ecsconnection, True)
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            logger.error('%s::ecs_async_poll()::Method %s timed out after %s seconds against ECS host %s',
+                         MODULE_NAME, method, ecsconnection.polltimeout, ecsconnection.authentication.host)
+            ecs_backfill_poll_result(ecsconnection, False)
+        except Exception as e:
+            logger.error('%s::ecs_async_poll()::Method %s failed against ECS host %s. Cause: %s', MODULE_NAME,
+                         method, ecsconnection.authentication.host, e, exc_info=True)
+            ecs_backfill_poll_result(ecsconnection, False)
 
-                    # Dump array for debug
-                    logger.debug(MODULE_NAME + '::ecs_collect_local_zone_replication_data()::'
-                                                'Local Zone Replication summary db_array is: \r\n\r\n'.join(str(db_array)))
+        # Wait for specific polling interval
+        await asyncio.sleep(float(pollinginterval))
 
-        if controlledShutdown.kill_now:
-            print(MODULE_NAME + "ecs_collect_local_zone_replication_data()::Shutdown detected.  Terminating polling.")
-            break
 
-        # Wait for specific polling interval
-        time.sleep(float(pollinginterval))
+async def ecs_async_collection_engine(influxclient, logger, ecsmanagmentapi, modulesintervals, tempdir):
 
+    asyncapis = {}
+    tasks = []
+    billing_executors = {}
 
-def ecs_collect_local_zone_replication_failure_data(influxclient, logger, ecsmanagmentapi, pollinginterval):
+    methods = []
+    for i, j in modulesintervals.items():
+        method = str(i)
+        if method in ECS_DASHBOARD_COLLECTORS or method == 'ecs_collect_namespace_billing_data()':
+            methods.append((method, str(j)))
+        else:
+            logger.info('%s::ecs_async_collection_engine()::Requested method %s is not supported.', MODULE_NAME,
+                        method)
 
     try:
-        while True:
+        while not controlledShutdown.kill_now:
+            # Start polling every ECS that has been authenticated since we last looked
+            for ecsconnection in list(ecsmanagmentapi):
+                if ecsconnection in asyncapis:
+                    continue
 
-            # Perform API call against each configured ECS
-            for ecsconnection in ecsmanagmentapi:
+                asyncapis[ecsconnection] = ECSAsyncManagementAPI(ecsconnection)
+                for method, interval in methods:
+                    tasks.append(asyncio.ensure_future(
+                        ecs_async_poll(method, influxclient, logger, ecsconnection, asyncapis[ecsconnection],
+                                       interval, tempdir, billing_executors)))
 
-                # Retrieve local zone failed replication data via API
-                local_zone_failed_failed_replication_link_data = ecsconnection.get_local_zone_replication_failure_data()
+            await asyncio.sleep(1)
 
-                if local_zone_failed_failed_replication_link_data is None:
-                    logger.error(MODULE_NAME + '::ecs_collect_local_zone_replication_failure_data()::'
-                                               'Unable to retrieve ECS Dashboard Local Replication Group Link Failure Information')
-                    return
-                else:
-                    """
-                    We have the raw JSON data now lets prep it for Influx
-                    """
+        print(MODULE_NAME + "ecs_async_collection_engine()::Shutdown detected.  Terminating polling.")
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
-                    # Declare locals
-                    current_time = datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S")
-                    current_epoch_time = time.time()
-                    db_array = []
-                    ecsdata = {}
-                    ecsdata_metrics = {}
-                    ecsdata_summary = {}
-                    fields = {}
-                    tags = {}
-                    target_name = "LocalZoneReplicationFailure"
+        for asyncapi in asyncapis.values():
+            await asyncapi.close()
 
-                    tags['vdc'] = _ecsVDCLookup.vdc_json[ecsconnection.authentication.host]
+        for billing_executor, crawl_executor in billing_executors.values():
+            billing_executor.shutdown(wait=False)
+            if crawl_executor is not None:
+                crawl_executor.shutdown(wait=False)
 
-                    # Grab just node information
-                    failed_replication_link_data = local_zone_failed_failed_replication_link_data['_embedded']['_instances']
-
-                    # Using 'local_zone_failed_failed_replication_link_data'
-                    # so we can re-use code without changing references
-                    for local_zone_failed_failed_replication_link_data in failed_replication_link_data:
-
-                        # Not handling a few metrics for now
-                        local_zone_failed_failed_replication_link_data.pop('_links', None)
-
-                        failed_rg_name = local_zone_failed_failed_replication_link_data['rgName']
-                        ecsdata[failed_rg_name] = {}
-                        ecsdata_metrics[failed_rg_name] = {}
-                        ecsdata_summary[failed_rg_name] = {}
-
-                        for field in local_zone_failed_failed_replication_link_data:
-                            if type(local_zone_failed_failed_replication_link_data[field]) is str:
-                                try:
-                                    logger.debug(MODULE_NAME + '::ecs_collect_local_zone_replication_failure_data()::field from '
-                                                                'local_zone_failed_failed_replication_link_data being processed is: ' + field)
-                                    ecsdata[failed_rg_name][field] = float(local_zone_failed_failed_replication_link_data[field])
-                                except Exception as ex1:
-                                    try:
-                                        # We're here because trying to convert to a float failed.
-                                        ecsdata[failed_rg_name][field] = local_zone_failed_failed_replication_link_data[field].encode("utf-8")
-                                    except Exception as ex2:
-                                        pass
-
-                            elif type(local_zone_failed_failed_replication_link_data[field]) is list:
-                                logger.debug(MODULE_NAME + '::ecs_collect_local_zone_replication_failure_data()::field from '
-                                                            'local_zone_failed_failed_replication_link_data being processed is: ' + field)
-                                ecsconnection.get_ecs_detail_data(field=field, metric_list=local_zone_failed_failed_replication_link_data[field],
-                                                                metric_values=ecsdata_metrics[failed_rg_name])
-
-                            else:
-                                logger.debug(MODULE_NAME + '::ecs_collect_local_zone_replication_failure_data()::field from '
-                                                            'local_zone_failed_failed_replication_link_data being processed is: ' + field)
-                                ecsconnection.get_ecs_summary_data(field=field, summary_dict=local_zone_failed_failed_replication_link_data[field],
-                                                                 current_epoch=current_epoch_time, summary_values=ecsdata_summary[failed_rg_name])
-
-                    for failed_rg_name in ecsdata:
-                        db_array = []
-                        tags['ReplicationGroupID'] = failed_rg_name
-                        db_json = {
-                            "measurement": target_name,
-                            "tags": tags,
-                            "fields": ecsdata[failed_rg_name],
-                            "time": current_time
-                        }
-                        db_array.append(db_json.copy())
-                        influxclient.write_points(db_array)
-                        logger.debug(MODULE_NAME + '::ecs_collect_local_zone_replication_failure_data()::'
-                                                    'Local Zone Failed Replication data db_array is: \r\n\r\n'.join(str(db_array)))
-
-                    for failed_rg_name in ecsdata_metrics:
-                        db_array = []
-                        tags['ReplicationGroupID'] = failed_rg_name
-
-                        for times in ecsdata_metrics[failed_rg_name]:
-
-                            influxdb_time = datetime.datetime.utcfromtimestamp(int(times))
-                            influxdb_time = influxdb_time.strftime("%Y-%m-%dT%H:%M:%S")
-
-                            db_json = {
-                                "measurement": target_name+"Metrics",
-                                "tags": tags,
-                                "fields": ecsdata_metrics[failed_rg_name][times],
-                                "time": influxdb_time
-                            }
-                            db_array.append(db_json.copy())
-
-                        influxclient.write_points(db_array)
-                        logger.debug(MODULE_NAME + '::ecs_collect_local_zone_replication_failure_data()::'
-                                                    'Local Zone Failed Replication metrics db_array is: \r\n\r\n'.join(str(db_array)))
-
-                    for failed_rg_name in ecsdata_summary:
-                        db_array = []
-                        tags['ReplicationGroupID'] = failed_rg_name
-
-                        for times in ecsdata_summary[failed_rg_name]:
-                            influxdb_time = datetime.datetime.utcfromtimestamp(int(times))
-                            influxdb_time = influxdb_time.strftime("%Y-%m-%dT%H:%M:%S")
-
-                            db_json = {
-                                "measurement": target_name+"Summary",
-                                "tags": tags,
-                                "fields": ecsdata_summary[failed_rg_name][times],
-                                "time": influxdb_time
-                            }
-                            db_array.append(db_json.copy())
-
-                        influxclient.write_points(db_array)
-                        logger.debug(MODULE_NAME + '::ecs_collect_local_zone_replication_failure_data()::'
-                                                   'Local Zone Failed Replication summary '
-                                                   'db_array is: \r\n\r\n'.join(str(db_array)))
-
-            if controlledShutdown.kill_now:
-                print(MODULE_NAME + "ecs_collect_local_zone_replication_failure_data()::"
-                                    "Shutdown detected.  Terminating polling.")
-                break
 
-            # Wait for specific polling interval
-            time.sleep(float(pollinginterval))
+def ecs_run_async_collection_engine(influxclient, logger, ecsmanagmentapi, modulesintervals, tempdir):
+    try:
+        asyncio.run(ecs_async_collection_engine(influxclient, logger, ecsmanagmentapi, modulesintervals, tempdir))
     except Exception as e:
-        _logger.error(MODULE_NAME + '::ecs_collect_local_zone_replication_failure_data()::The following unexpected '
-                                    'exception occured: ' + str(e) + "\n" + traceback.format_exc())
+        _logger.error('%s::ecs_run_async_collection_engine()::The following unexpected exception occured: %s',
+                      MODULE_NAME, e, exc_info=True)
 
 
-def ecs_collect_local_zone_bootstrap_data(influxclient, logger, ecsmanagmentapi, pollinginterval):
+def ecs_connect(auth):
+    global _logger
 
     try:
-        while True:
-
-            # Perform API call against each configured ECS
-            for ecsconnection in ecsmanagmentapi:
-
-                # Retrieve local zone bootstrap data via API
-                local_zone_bootstrap_data = ecsconnection.get_local_zone_bootstrap_data()
+        auth.connect()
+    except Exception as e:
+        _logger.error('%s::ecs_connect()::Unable to connect to ECS host %s. Cause: %s', MODULE_NAME, auth.host, e)
 
-                if local_zone_bootstrap_data is None:
-                    logger.error(MODULE_NAME + '::ecs_collect_local_zone_bootstrap_data()::'
-                                               'Unable to retrieve ECS Dashboard Local Replication '
-                                               'Group Link Bootstrap Information')
-                    return
-                else:
-                    """
-                    We have the raw JSON data now lets prep it for Influx
-                    """
+    return auth.token is not None
 
-                    # Declare locals
-                    current_time = datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S")
-                    current_epoch_time = time.time()
-                    db_array = []
-                    ecsdata = {}
-                    ecsdata_metrics = {}
-                    ecsdata_summary = {}
-                    fields = {}
-                    tags = {}
-                    target_name = "LocalZoneReplicationBootstrap"
 
-                    tags['vdc'] = _ecsVDCLookup.vdc_json[ecsconnection.authentication.host]
+def ecs_add_connection(auth, ecsmanagmentapi):
+    global _ecsAuthentication
+    global _ecsManagmentAPI
 
-                    # Grab just node information
-                    replication_link_bootstrap_data = local_zone_bootstrap_data['_embedded']['_instances']
-
-                    # Using 'local_zone_bootstrap_data' so we can re-use code without changing references
-                    for local_zone_bootstrap_data in replication_link_bootstrap_data:
-
-                        # Not handling a few metrics for now
-                        local_zone_bootstrap_data.pop('_links', None)
-
-                        bootstrap_rg_name = local_zone_bootstrap_data['rgName']
-                        ecsdata[bootstrap_rg_name] = {}
-                        ecsdata_metrics[bootstrap_rg_name] = {}
-                        ecsdata_summary[bootstrap_rg_name] = {}
-
-                        for field in local_zone_bootstrap_data:
-                            if type(local_zone_bootstrap_data[field]) is str:
-                                try:
-                                    logger.debug(MODULE_NAME + '::ecs_collect_local_zone_bootstrap_data()::field from '
-                                                                'local_zone_bootstrap_data being processed is: ' + field)
-                                    ecsdata[bootstrap_rg_name][field] = float(local_zone_bootstrap_data[field])
-                                except Exception as ex1:
-                                    try:
-                                        # We're here because trying to convert to a float failed.
-                                        ecsdata[bootstrap_rg_name][field] = local_zone_bootstrap_data[field].encode("utf-8")
-                                    except Exception as ex2:
-                                        pass
-
-                            elif type(local_zone_bootstrap_data[field]) is list:
-                                logger.debug(MODULE_NAME + '::ecs_collect_local_zone_bootstrap_data()::field from '
-                                                            'local_zone_bootstrap_data being processed is: ' + field)
-                                ecsconnection.get_ecs_detail_data(field=field, metric_list=local_zone_bootstrap_data[field],
-                                                                metric_values=ecsdata_metrics[bootstrap_rg_name])
-
-                            else:
-                                logger.debug(MODULE_NAME + '::ecs_collect_local_zone_bootstrap_data()::field from '
-                                                            'local_zone_bootstrap_data being processed is: ' + field)
-                                ecsconnection.get_ecs_summary_data(field=field, summary_dict=local_zone_bootstrap_data[field],
-                                                                 current_epoch=current_epoch_time, summary_values=ecsdata_summary[bootstrap_rg_name])
-
-                    for bootstrap_rg_name in ecsdata:
-                        db_array = []
-                        tags['ReplicationGroupID'] = bootstrap_rg_name
-                        db_json = {
-                            "measurement": target_name,
-                            "tags": tags,
-                            "fields": ecsdata[bootstrap_rg_name],
-                            "time": current_time
-                        }
-                        db_array.append(db_json.copy())
-                        influxclient.write_points(db_array)
-                        logger.debug(MODULE_NAME + '::ecs_collect_local_zone_bootstrap_data()::'
-                                                    'Local Zone Failed Bootstrap data db_array is: \r\n\r\n'.join(str(db_array)))
-
-                    for bootstrap_rg_name in ecsdata_metrics:
-                        db_array = []
-                        tags['ReplicationGroupID'] = bootstrap_rg_name
-
-                        for times in ecsdata_metrics[bootstrap_rg_name]:
-
-                            influxdb_time = datetime.datetime.utcfromtimestamp(int(times))
-                            influxdb_time = influxdb_time.strftime("%Y-%m-%dT%H:%M:%S")
-
-                            db_json = {
-                                "measurement": target_name+"Metrics",
-                                "tags": tags,
-                                "fields": ecsdata_metrics[bootstrap_rg_name][times],
-                                "time": influxdb_time
-                            }
-                            db_array.append(db_json.copy())
-
-                        influxclient.write_points(db_array)
-                        logger.debug(MODULE_NAME + '::ecs_collect_local_zone_bootstrap_data()::'
-                                                    'Local Zone Failed Bootstrap metrics db_array is: \r\n\r\n'.join(str(db_array)))
-
-                    for bootstrap_rg_name in ecsdata_summary:
-                        db_array = []
-                        tags['ReplicationGroupID'] = bootstrap_rg_name
-
-                        for times in ecsdata_summary[bootstrap_rg_name]:
-                            influxdb_time = datetime.datetime.utcfromtimestamp(int(times))
-                            influxdb_time = influxdb_time.strftime("%Y-%m-%dT%H:%M:%S")
-
-                            db_json = {
-                                "measurement": target_name+"Summary",
-                                "tags": tags,
-                                "fields": ecsdata_summary[bootstrap_rg_name][times],
-                                "time": influxdb_time
-                            }
-                            db_array.append(db_json.copy())
-
-                        influxclient.write_points(db_array)
-                        logger.debug(MODULE_NAME + '::ecs_collect_local_zone_bootstrap_data()::'
-                                                    'Local Zone Failed Bootstrap summary db_array is: \r\n\r\n'.join(str(db_array)))
-
-            if controlledShutdown.kill_now:
-                print(MODULE_NAME + "ecs_collect_local_zone_bootstrap_data()::"
-                                    "Shutdown detected.  Terminating polling.")
-                break
+    # Collector threads share these lists so a connection becomes visible to them on their next cycle
+    _ecsAuthentication.append(auth)
+    _ecsManagmentAPI.append(ecsmanagmentapi)
 
-            # Wait for specific polling interval
-            time.sleep(float(pollinginterval))
-    except Exception as e:
-        _logger.error(MODULE_NAME + '::ecs_collect_local_zone_bootstrap_data()::The following unexpected '
-                                    'exception occured: ' + str(e) + "\n" + traceback.format_exc())
+    _logger.info('%s::ecs_add_connection()::Authenticated to ECS host %s.  Data collection for this ECS is enabled.',
+                 MODULE_NAME, auth.host)
 
 
-def ecs_collect_namespace_billing_data(influxclient, logger, ecsmanagmentapi, pollinginterval, tempdir):
+def ecs_connect_retry(auth, ecsmanagmentapi, login, retryinterval):
+    global _logger
 
     try:
-        # Start polling loop
-        while True:
-            # Perform API call against each configured ECS
-            for ecsconnection in ecsmanagmentapi:
-
-                # Retrieve the list of namespaces
-                namespace_data = ecsconnection.get_namespace_data()
+        # Wait for the startup login that is still in flight before retrying
+        connected = False
+        try:
+            connected = login.result()
+        except Exception:
+            pass
 
-                if namespace_data is None:
-                    logger.info(MODULE_NAME + '::ecs_collect_namespace_billing_data()::'
-                                              'Unable to retrieve ECS Namespace Information')
-                    return
-                else:
-                    # For each namespace in the collection get billing retrieve billing information
-                    if namespace_data is None:
-                        logger.info(MODULE_NAME + '::ecs_collect_namespace_billing_data()::'
-                                                  'Unable to retrieve ECS Namespace Information')
-                        return
-                    else:
-                        # Lets set a timestamp that we can use for all data points written during this cycle
-                        current_time = datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S")
-
-                        # Grab the namespace list and cycle thru it
-                        if type(namespace_data['namespace']) is list:
-                            # Process list of namespaces
-                            logger.debug(MODULE_NAME + '::ecs_collect_namespace_billing_data()::'
-                                                       'We have the list of namespaces')
-
-                            # For each namespace grab needed info and then grab all the buckets for that namespace
-                            for namespace in namespace_data['namespace']:
-                                ns_name = namespace['name']
-                                ns_id = namespace['id']
-                                ns_block_size = namespace['blockSize']
-                                ns_notification_size = namespace['notificationSize']
-                                ns_total_size_f = 0.0
-                                ns_total_objects_f = 0.0
-                                ns_total_size_bytes = 0.0
-                                ns_total_protected_size_bytes = 0.0
-
-                                if ecs_check_for_integer(ns_block_size):
-                                    ns_block_size_int = int(ns_block_size)
-                                    if ns_block_size_int > 0:
-                                        ns_block_size_bytes = float(ns_block_size) * 1073741824
-                                    else:
-                                        ns_block_size_bytes = 0
-                                        ns_block_size = 0
-                                else:
-                                    ns_block_size_bytes = 0
-                                    ns_block_size = 0
-
-                                if ecs_check_for_integer(ns_notification_size):
-                                    ns_notification_size_int = int(ns_notification_size)
-                                    if ns_notification_size_int > 0:
-                                        ns_notification_size_bytes = float(ns_notification_size) * 1073741824
-                                    else:
-                                        ns_notification_size_bytes = 0
-                                        ns_notification_size = 0
-                                else:
-                                    ns_notification_size_bytes = 0
-                                    ns_notification_size = 0
-
-                                db_array_ns = []
-                                ecsdata_ns = {}
-                                fields_ns = {}
-                                tags_ns = {}
-                                target_name_ns = "metering_stats_namespace"
-
-                                # Retrieve the list of buckets for the namespace
-                                bucket_data = ecsconnection.get_bucket_data(ns_name)
-
-                                if bucket_data is None:
-                                    logger.info(MODULE_NAME + '::ecs_collect_namespace_billing_data()::'
-                                                              'Unable to retrieve the list of buckets for namespace ' + ns_name)
-                                    return
-                                else:
-                                    # We've got some data bucket data lets
-                                    # check if we have some buckets for this namespace to process
-
-                                    for bucket in bucket_data['object_bucket']:
-                                        bucket_name = bucket['name']
-                                        soft_quota = bucket['softquota']
-                                        block_size = bucket['block_size']
-                                        notification_size = bucket['notification_size']
-
-                                        # Lets calculate quota sizes in bytes if provided -
-                                        # Quota Values are always set in GiB on ECS but we want them in bytes
-                                        if ecs_check_for_integer(soft_quota):
-                                            soft_quota_int = int(soft_quota)
-                                            if soft_quota_int > 0:
-                                                soft_quota_size_bytes = float(soft_quota) * 1073741824
-                                            else:
-                                                soft_quota_size_bytes = 0
-                                                soft_quota = 0
-                                        else:
-                                            soft_quota_size_bytes = 0
-                                            soft_quota = 0
-
-                                        if ecs_check_for_integer(block_size):
-                                            block_size_int = int(block_size)
-                                            if block_size_int > 0:
-                                                block_size_bytes = float(block_size) * 1073741824
-                                            else:
-                                                block_size_bytes = 0
-                                                block_size = 0
-                                        else:
-                                            block_size_bytes = 0
-                                            block_size = 0
-
-                                        if ecs_check_for_integer(notification_size):
-                                            notification_size_int = int(notification_size)
-                                            if notification_size_int < 0:
-                                                notification_size = 0
-                                        else:
-                                            notification_size = 0
-
-                                        # We have a namespace and a bucket lets go
-                                        # and retrieve the metering information
-                                        billing_data_file = ecsconnection.get_namespace_billing_data(ns_name, bucket_name, tempdir)
-
-                                        if billing_data_file is None:
-                                            # If we had an issue just log the error and keep going to the next bucket
-                                            logger.info(MODULE_NAME + '::ecs_collect_namespace_billing_data()::'
-                                                                      'Unable to retrieve Metering information for ' + ns_name + ' and bucket ' + bucket_name)
-                                        else:
-                                            # We have a metering file for the bucket and namespace so lets
-                                            # parse it and create an InfluxDB datapoint
-                                            try:
-                                                tree = ET.parse(billing_data_file)
-                                                billing_info = tree.getroot()
-
-                                                # Grab VDC Name
-                                                vdc = _ecsVDCLookup.vdc_json[ecsconnection.authentication.host]
-                                                managementIp = ecsconnection.authentication.host
-
-                                                vpool_id = billing_info.find('vpool_id').text
-                                                total_size = billing_info.find('total_size').text
-                                                total_objects = billing_info.find('total_objects').text
-
-                                                # No need to close the file as the ET parse()
-                                                # method will close it when parsing is completed.
-                                                _logger.debug(MODULE_NAME + '::ecs_collect_namespace_billing_data::Deleting temporary '
-                                                                            'xml file: ' + billing_data_file)
-
-                                                # We have parsed our metering file for
-                                                # the current bucket now lets create a data point
-                                                current_epoch_time = time.time()
-                                                db_array = []
-                                                ecsdata = {}
-                                                fields = {}
-                                                tags = {}
-                                                target_name = "metering_stats"
-
-                                                # Setup measurement tags.
-                                                tags['vdc'] = _ecsVDCLookup.vdc_json[ecsconnection.authentication.host]
-                                                tags['namespace'] = ns_name
-                                                tags['bucket'] = bucket_name
-                                                # tags['virtual_pool_id'] = vpool_id
-
-                                                # We always grab capacity data in KB and we want to convert it to bytes
-                                                total_size_f = float(total_size)
-                                                total_size_bytes = total_size_f * 1024.00
-                                                total_protected_size_bytes = total_size_bytes * 1.33
-
-                                                # Calculate average object sizes if
-                                                # objects and size are greater than zero
-                                                total_objects_f = float(total_objects)
-                                                if total_objects_f > 0:
-                                                    if total_size_f > 0:
-                                                        average_object_size_f = total_size_bytes / total_objects_f
-                                                    else:
-                                                        average_object_size_f = 0.0
-                                                else:
-                                                    average_object_size_f = 0.0
-
-                                                # If we have hard and / or soft quotas
-                                                # lets calculate quota utilization %
-                                                if soft_quota_size_bytes > 0:
-                                                    if total_size_bytes > 0:
-                                                        soft_quota_utilization = total_size_bytes / soft_quota_size_bytes
-                                                        soft_quota_utilization_protected = total_protected_size_bytes / soft_quota_size_bytes
-                                                    else:
-                                                        soft_quota_utilization = 0
-                                                        soft_quota_utilization_protected = 0
-                                                else:
-                                                    soft_quota_utilization = 0
-                                                    soft_quota_utilization_protected = 0
-
-                                                if block_size_bytes > 0:
-                                                    if total_size_bytes > 0:
-                                                        hard_quota_utilization = total_size_bytes / block_size_bytes
-                                                        hard_quota_utilization_protected = total_protected_size_bytes / block_size_bytes
-                                                    else:
-                                                        hard_quota_utilization = 0
-                                                        hard_quota_utilization_protected = 0
-                                                else:
-                                                    hard_quota_utilization = 0
-                                                    hard_quota_utilization_protected = 0
-
-                                                # Add bucket level details to namespace totals
-                                                ns_total_size_f += total_size_f
-                                                ns_total_objects_f += total_objects_f
-                                                ns_total_size_bytes += total_size_bytes
-                                                ns_total_protected_size_bytes += total_protected_size_bytes
-
-                                                # Load dictionary of values
-                                                ecsdata[bucket_name] = {}
-                                                try:
-                                                    ecsdata[bucket_name]['total_size'] = float(total_size_bytes)
-                                                except Exception as ex1:
-                                                    try:
-                                                        # We're here because trying to convert to a float failed.
-                                                        ecsdata[bucket_name]['total_size'] = total_size_bytes
-                                                    except Exception as ex2:
-                                                        pass
-
-                                                try:
-                                                    ecsdata[bucket_name]['total_objects'] = float(total_objects)
-                                                except Exception as ex3:
-                                                    try:
-                                                        # We're here because trying to convert to a float failed.
-                                                        ecsdata[bucket_name]['total_objects'] = total_objects
-                                                    except Exception as ex4:
-                                                        pass
-
-                                                try:
-                                                    ecsdata[bucket_name]['soft_quota'] = float(soft_quota)
-                                                except Exception as ex5:
-                                                    try:
-                                                        # We're here because trying to convert to a float failed.
-                                                        ecsdata[bucket_name]['soft_quota'] = soft_quota
-                                                    except Exception as ex6:
-                                                        pass
-
-                                                try:
-                                                    ecsdata[bucket_name]['hard_quota'] = float(block_size)
-                                                except Exception as ex7:
-                                                    try:
-                                                        # We're here because trying to convert to a float failed.
-                                                        ecsdata[bucket_name]['hard_quota'] = block_size
-                                                    except Exception as ex8:
-                                                        pass
-
-                                                try:
-                                                    ecsdata[bucket_name]['notification_size'] = float(notification_size)
-                                                except Exception as ex7:
-                                                    try:
-                                                        # We're here because trying to convert to a float failed.
-                                                        ecsdata[bucket_name]['notification_size'] = notification_size
-                                                    except Exception as ex8:
-                                                        pass
-
-                                                try:
-                                                    ecsdata[bucket_name]['average_size'] = float(average_object_size_f)
-                                                except Exception as ex7:
-                                                    try:
-                                                        # We're here because trying to convert to a float failed.
-                                                        ecsdata[bucket_name]['average_size'] = average_object_size_f
-                                                    except Exception as ex8:
-                                                        pass
-
-                                                try:
-                                                    ecsdata[bucket_name]['soft_quota_utilization'] = float(soft_quota_utilization)
-                                                except Exception as ex7:
-                                                    try:
-                                                        # We're here because trying to convert to a float failed.
-                                                        ecsdata[bucket_name]['soft_quota_utilization'] = soft_quota_utilization
-                                                    except Exception as ex8:
-                                                        pass
-
-                                                try:
-                                                    ecsdata[bucket_name]['hard_quota_utilization'] = float(hard_quota_utilization)
-                                                except Exception as ex7:
-                                                    try:
-                                                        # We're here because trying to convert to a float failed.
-                                                        ecsdata[bucket_name]['hard_quota_utilization'] = hard_quota_utilization
-                                                    except Exception as ex8:
-                                                        pass
-
-                                                try:
-                                                    ecsdata[bucket_name]['total_protected_size'] = float(total_protected_size_bytes)
-                                                except Exception as ex7:
-                                                    try:
-                                                        # We're here because trying to convert to a float failed.
-                                                        ecsdata[bucket_name]['total_protected_size'] = total_protected_size_bytes
-                                                    except Exception as ex8:
-                                                        pass
-
-                                                try:
-                                                    ecsdata[bucket_name]['soft_quota_utilization_protected'] = float(soft_quota_utilization_protected)
-                                                except Exception as ex7:
-                                                    try:
-                                                        # We're here because trying to convert to a float failed.
-                                                        ecsdata[bucket_name]['soft_quota_utilization_protected'] = soft_quota_utilization_protected
-                                                    except Exception as ex8:
-                                                        pass
-
-                                                try:
-                                                    ecsdata[bucket_name]['hard_quota_utilization_protected'] = float(hard_quota_utilization_protected)
-                                                except Exception as ex7:
-                                                    try:
-                                                        # We're here because trying to convert to a float failed.
-                                                        ecsdata[bucket_name]['hard_quota_utilization_protected'] = hard_quota_utilization_protected
-                                                    except Exception as ex8:
-                                                        pass
-
-                                                # Create Influx DB Info Dictionary for
-                                                # our string fields and add it to the db list
-                                                db_json = {
-                                                    "measurement": target_name,
-                                                    "tags": tags,
-                                                    "fields": ecsdata[bucket_name],
-                                                    "time": current_time
-                                                }
-                                                db_array.append(db_json.copy())
-
-                                                # Write data to Influx
-                                                influxclient.write_points(db_array)
-
-                                                # Dump array for debug
-                                                logger.debug(MODULE_NAME + '::ecs_collect_namespace_billing_data()::'
-                                                                           'Billing db_array is: \r\n\r\n'.join(str(db_array)))
-
-                                                # Delete temp file
-                                                ecs_delete_file(billing_data_file)
-
-                                            except Exception as ex:
-                                                logger.error(MODULE_NAME + '::ecs_collect_namespace_billing_data()::The following unexpected '
-                                                                           'exception occurred: ' + str(ex) + "\n" + traceback.format_exc())
-                                # Let log namespace level info
-                                tags_ns['vdc'] = _ecsVDCLookup.vdc_json[ecsconnection.authentication.host]
-                                tags_ns['namespace'] = ns_name
-                                ecsdata_ns[ns_name] = {}
-
-                                # Calculate average object sizes for the namespace if
-                                # objects and size are greater than zero
-                                if ns_total_objects_f > 0:
-                                    if ns_total_size_f > 0:
-                                        ns_average_object_size_f = ns_total_size_f / ns_total_objects_f
-                                    else:
-                                        ns_average_object_size_f = 0.0
-                                else:
-                                    ns_average_object_size_f = 0.0
-
-                                # If we have hard and / or soft quotas
-                                # lets calculate quota utilization %
-                                if ns_notification_size_bytes > 0:
-                                    if ns_total_size_bytes > 0:
-                                        ns_soft_quota_utilization = ns_total_size_bytes / ns_notification_size_bytes
-                                        ns_soft_quota_utilization_protected = ns_total_protected_size_bytes / ns_notification_size_bytes
-                                    else:
-                                        ns_soft_quota_utilization = 0
-                                        ns_soft_quota_utilization_protected = 0
-                                else:
-                                    ns_soft_quota_utilization = 0
-                                    ns_soft_quota_utilization_protected = 0
-
-                                if ns_block_size_bytes > 0:
-                                    if ns_total_size_bytes > 0:
-                                        ns_hard_quota_utilization = ns_total_size_bytes / ns_block_size_bytes
-                                        ns_hard_quota_utilization_protected = ns_total_protected_size_bytes / ns_block_size_bytes
-                                    else:
-                                        ns_hard_quota_utilization = 0
-                                        ns_hard_quota_utilization_protected = 0
-                                else:
-                                    ns_hard_quota_utilization = 0
-                                    ns_hard_quota_utilization_protected = 0
-
-                                # Add namespace values to the array for writing to Influx
-                                try:
-                                    ecsdata_ns[ns_name]['ns_average_size'] = float(ns_average_object_size_f)
-                                except Exception as ex5:
-                                    try:
-                                        # We're here because trying to convert to a float failed.
-                                        ecsdata_ns[ns_name]['ns_average_size'] = ns_average_object_size_f
-                                    except Exception as ex6:
-                                        pass
-
-                                try:
-                                    ecsdata_ns[ns_name]['ns_hard_quota'] = float(ns_block_size)
-                                except Exception as ex5:
-                                    try:
-                                        # We're here because trying to convert to a float failed.
-                                        ecsdata_ns[ns_name]['ns_hard_quota'] = ns_block_size
-                                    except Exception as ex6:
-                                        pass
-
-                                try:
-                                    ecsdata_ns[ns_name]['ns_soft_quota'] = float(ns_notification_size)
-                                except Exception as ex7:
-                                    try:
-                                        # We're here because trying to convert to a float failed.
-                                        ecsdata_ns[ns_name]['ns_soft_quota'] = ns_notification_size
-                                    except Exception as ex8:
-                                        pass
-
-                                try:
-                                    ecsdata_ns[ns_name]['ns_total_size'] = float(ns_total_size_bytes)
-                                except Exception as ex1:
-                                    try:
-                                        # We're here because trying to convert to a float failed.
-                                        ecsdata_ns[ns_name]['ns_total_size'] = ns_total_size_bytes
-                                    except Exception as ex2:
-                                        pass
-
-                                try:
-                                    ecsdata_ns[ns_name]['ns_total_objects'] = float(ns_total_objects_f)
-                                except Exception as ex1:
-                                    try:
-                                        # We're here because trying to convert to a float failed.
-                                        ecsdata_ns[ns_name]['ns_total_objects'] = ns_total_objects_f
-                                    except Exception as ex2:
-                                        pass
-
-                                try:
-                                    ecsdata_ns[ns_name]['ns_total_protected_size'] = float(ns_total_protected_size_bytes)
-                                except Exception as ex1:
-                                    try:
-                                        # We're here because trying to convert to a float failed.
-                                        ecsdata_ns[ns_name]['ns_total_protected_size'] = ns_total_protected_size_bytes
-                                    except Exception as ex2:
-                                        pass
-
-                                try:
-                                    ecsdata_ns[ns_name]['ns_soft_quota_utilization'] = float(ns_soft_quota_utilization)
-                                except Exception as ex1:
-                                    try:
-                                        # We're here because trying to convert to a float failed.
-                                        ecsdata_ns[ns_name]['ns_soft_quota_utilization'] = ns_soft_quota_utilization
-                                    except Exception as ex2:
-                                        pass
-
-                                try:
-                                    ecsdata_ns[ns_name]['ns_hard_quota_utilization'] = float(ns_hard_quota_utilization)
-                                except Exception as ex1:
-                                    try:
-                                        # We're here because trying to convert to a float failed.
-                                        ecsdata_ns[ns_name]['ns_hard_quota_utilization'] = ns_hard_quota_utilization
-                                    except Exception as ex2:
-                                        pass
-
-                                try:
-                                    ecsdata_ns[ns_name]['ns_soft_quota_utilization_protected'] = float(ns_soft_quota_utilization_protected)
-                                except Exception as ex1:
-                                    try:
-                                        # We're here because trying to convert to a float failed.
-                                        ecsdata_ns[ns_name]['ns_soft_quota_utilization_protected'] = ns_soft_quota_utilization_protected
-                                    except Exception as ex2:
-                                        pass
-
-                                try:
-                                    ecsdata_ns[ns_name]['ns_hard_quota_utilization_protected'] = float(ns_hard_quota_utilization_protected)
-                                except Exception as ex1:
-                                    try:
-                                        # We're here because trying to convert to a float failed.
-                                        ecsdata_ns[ns_name]['ns_hard_quota_utilization_protected'] = ns_hard_quota_utilization_protected
-                                    except Exception as ex2:
-                                        pass
-                                # Create Influx DB Info Dictionary for
-                                # our string fields and add it to the db list
-                                db_json_ns = {
-                                    "measurement": target_name_ns,
-                                    "tags": tags_ns,
-                                    "fields": ecsdata_ns[ns_name],
-                                    "time": current_time
-                                }
-                                db_array_ns.append(db_json_ns.copy())
-
-                                # Write data to Influx
-                                influxclient.write_points(db_array_ns)
-
-                                # Dump array for debug
-                                logger.debug(MODULE_NAME + '::ecs_collect_namespace_billing_data()::'
-                                                           'Namespace Billing db_array is: \r\n\r\n'.join(str(db_array_ns)))
+        while not connected:
+            _logger.error('%s::ecs_connect_retry()::Unable to authenticate to ECS host %s.  Retrying in %s seconds.',
+                          MODULE_NAME, auth.host, retryinterval)
 
-                        else:
-                            # We should have found the namespace list in the dictionary.  We have an issue
-                            logger.info(MODULE_NAME + '::ecs_collect_namespace_billing_data()::'
-                                                      'Unable to retrieve the list of namespaces '
-                                                      'from the namespace data dictionary.')
-                            return
+            if controlledShutdown.wait(float(retryinterval)):
+                return
 
+            connected = ecs_connect(auth)
 
-            if controlledShutdown.kill_now:
-                print(MODULE_NAME + "ecs_collect_namespace_billing_data()::Shutdown detected.  Terminating polling.")
-                break
+        ecs_add_connection(auth, ecsmanagmentapi)
 
-            # Wait for specific polling interval
-            time.sleep(float(pollinginterval))
     except Exception as e:
-        _logger.error(MODULE_NAME + '::ecs_collect_namespace_billing_data()::The following unexpected '
-                                    'exception occured: ' + str(e) + "\n" + traceback.format_exc())
+        _logger.error('%s::ecs_connect_retry()::The following unexpected exception occured: %s', MODULE_NAME, e,
+                      exc_info=True)
 
 
 def ecs_authenticate():
@@ -1571,6 +1310,7 @@ def ecs_authenticate():
     global _configuration
     global _logger
     global _ecsManagmentAPI
+    global _ecsTokenCache
     connected = True
 
     try:
@@ -1578,45 +1318,104 @@ def ecs_authenticate():
         while not _configuration:
             time.sleep(1)
 
-        # Iterate over all ECS Connections configured and attempt tp Authenticate to ECS
-        for ecsconnection in _configuration.ecsconnections:
+        # Load persisted tokens so a restart can reuse still valid ECS sessions
+        if _configuration.token_cache_file:
+            _ecsTokenCache = ECSTokenCache(_configuration.token_cache_file, _logger)
 
-            # Attempt to authenticate
-            auth = ECSAuthentication(ecsconnection['protocol'], ecsconnection['host'], ecsconnection['user'],
-                                     ecsconnection['password'], ecsconnection['port'], _logger)
+        if not _configuration.ecsconnections:
+            _logger.info('%s::ecs_authenticate()::ECS Data Collection Module is not ready.  No ECS connections are '
+                         'configured.', MODULE_NAME)
+            return False
 
-            auth.connect()
+        # Log in to all configured ECS Connections at the same time
+        login_executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(_configuration.ecsconnections))
+        logins = []
 
-            # Check to see if we have a token returned
-            if auth.token is None:
-                _logger.error(MODULE_NAME + '::ecs_init()::Unable to authenticate to ECS as configured.  '
-                             'Please validate and try again.')
-                connected = False
-                break
+        for ecsconnection in _configuration.ecsconnections:
+
+            auth = ECSAuthentication(ecsconnection['protocol'], ecsconnection['host'], ecsconnection['user'],
+                                     ecsconnection['password'], ecsconnection['port'], _logger,
+                                     ecsconnection['poolSize'],
+                                     ecsconnection['poolKeepAlive'].lower() == 'true',
+                                     ecsconnection['poolMaxIdle'],
+                                     ecsconnection['tokenMaxAge'],
+                                     _ecsTokenCache,
+                                     ecsconnection['connectTimeout'],
+                                     ecsconnection['readTimeout'])
+
+            # Instantiate ECS Management API object
+            ecsmanagmentapi = ECSManagementAPI(auth, ecsconnection['connectTimeout'],
+                                               ecsconnection['readTimeout'], _logger,
+                                               billingmaxinflight=ecsconnection['billingMaxInFlight'],
+                                               billingmode=ecsconnection['billingMode'],
+                                               pagesize=ecsconnection['enumerationPageSize'],
+                                               metadatacachettl=ecsconnection['metadataCacheTTL'],
+                                               metadatacachesize=ecsconnection['metadataCacheSize'],
+                                               datatype=ecsconnection['dataType'],
+                                               category=ecsconnection['category'],
+                                               maxconcurrentrequests=ecsconnection['maxConcurrentRequests'],
+                                               polltimeout=ecsconnection['pollTimeout'])
+
+            logins.append((auth, ecsmanagmentapi, login_executor.submit(ecs_connect, auth)))
+
+        # Wait for the logins up to the startup deadline
+        concurrent.futures.wait([login for auth, ecsmanagmentapi, login in logins],
+                                timeout=float(_configuration.startup_deadline))
+
+        for auth, ecsmanagmentapi, login in logins:
+            if login.done() and login.result():
+                ecs_add_connection(auth, ecsmanagmentapi)
             else:
-                _ecsAuthentication.append(auth)
+                # Slow or unreachable ECS are retried in the background so the healthy ones can start collecting
+                t = threading.Thread(target=ecs_connect_retry,
+                                     args=(auth, ecsmanagmentapi, login, _configuration.connect_retry_interval))
+                t.daemon = True
+                t.start()
 
-                # Instantiate ECS Management API object, add it to our list, and validate that we are authenticated
-                _ecsManagmentAPI.append(ECSManagementAPI(auth, ecsconnection['connectTimeout'],
-                                                         ecsconnection['readTimeout'], _logger))
-                if not _ecsAuthentication:
-                    _logger.info(MODULE_NAME + '::ecs_authenticate()::ECS Data Collection '
-                                               'Module is not ready.  Please check logs.')
-                    connected = False
-                    break
+        login_executor.shutdown(wait=False)
+
+        if not _ecsAuthentication:
+            _logger.error('%s::ecs_authenticate()::Unable to authenticate to any ECS before the startup deadline.  '
+                          'Data collection will start as ECS become available.', MODULE_NAME)
 
         return connected
 
     except Exception as e:
-        _logger.error(MODULE_NAME + '::ecs_init()::Cannot initialize plugin. Cause: '
-                      + str(e) + "\n" + traceback.format_exc())
+        _logger.error('%s::ecs_init()::Cannot initialize plugin. Cause: %s', MODULE_NAME, e, exc_info=True)
         connected = False
 
 
+def influx_transports(influx_client, transports):
+    """
+    Returns the writers of the configured Influx write transports keyed by transport
+    """
+    writers = {}
+
+    for transport in transports:
+        if transport == 'http':
+            writers[transport] = influx_client
+        elif transport == 'gzip':
+            gzip_client = InfluxDBClient(_configuration.database_host, _configuration.database_port,
+                                         _configuration.database_user, _configuration.database_password,
+                                         _configuration.database_name, gzip=True)
+            if _configuration.database_line_protocol_writes:
+                gzip_client = InfluxLineProtocolWriter(gzip_client)
+            writers[transport] = gzip_client
+        else:
+            writers[transport] = InfluxUDPWriter(_configuration.database_host, _configuration.database_udp_port,
+                                                 _logger, _configuration.database_udp_payload_size)
+
+    return writers
+
+
 def influx_init():
     global _influxClient
+    global _influxWriter
+    global _influxSpool
+    global _influxRouter
     global _configuration
     global _logger
+    global _ecsWatermarks
     connected = True
 
     try:
@@ -1624,6 +1423,10 @@ def influx_init():
         while not _configuration:
             time.sleep(1)
 
+        # Track the newest history sample written per series so only new samples are written each cycle
+        if _configuration.incremental_ingestion:
+            _ecsWatermarks = ECSWatermarks(_configuration.watermark_file, _logger)
+
         # Instantiate utility object and check to see if our database exists
         db_utility = InfluxUtility(_configuration, _logger)
         database_found = db_utility.check_db_exists(_configuration.database_name)
@@ -1659,43 +1462,179 @@ def influx_init():
             influx_client = InfluxDBClient(_configuration.database_host, _configuration.database_port, _configuration.database_user, _configuration.database_password,_configuration.database_name)
 
         if influx_client is None:
-            _logger.error(MODULE_NAME + '::influx_init()::Unable to connect to Influx as configured.  '
-                                       'Please validate and try again.')
+            _logger.error('%s::influx_init()::Unable to connect to Influx as configured.  Please validate and try '
+                          'again.', MODULE_NAME)
             connected = False
         else:
-            _logger.info(MODULE_NAME + '::influx_init()::Successfully connected to Influx as configured.')
+            _logger.info('%s::influx_init()::Successfully connected to Influx as configured.', MODULE_NAME)
+
+            # Serialize points to line protocol ourselves instead of letting the client re-encode every point
+            if _configuration.database_line_protocol_writes:
+                influx_client = InfluxLineProtocolWriter(influx_client)
+
+            # Measurements can be written with gzip compressed HTTP or fire and forget UDP instead of plain HTTP
+            transports = set(_configuration.database_measurement_transports.values())
+            transports.add(_configuration.database_write_transport)
+            if transports != {'http'}:
+                _influxRouter = InfluxTransportRouter(influx_transports(influx_client, transports),
+                                                      _configuration.database_measurement_transports,
+                                                      _configuration.database_write_transport)
+                influx_client = _influxRouter
             _influxClient = influx_client
 
+            # Points that can not be written while Influx is down are spooled to disk and replayed later
+            if _configuration.database_spool_directory:
+                _influxSpool = InfluxSpool(influx_client, _logger, _configuration.database_spool_directory,
+                                           _configuration.database_spool_segment_size,
+                                           _configuration.database_spool_max_size,
+                                           _configuration.database_spool_replay_max_points_per_second,
+                                           _configuration.database_spool_replay_interval)
+                _influxClient = _influxSpool
+
+            # Collectors hand their points to a shared background writer that batches them
+            if _configuration.database_async_writes:
+                _influxWriter = InfluxBatchWriter(_influxClient, _logger, _configuration.database_write_batch_size,
+                                                  _configuration.database_write_flush_interval,
+                                                  _configuration.database_write_queue_size,
+                                                  _configuration.database_write_queue_full_policy)
+                _influxClient = _influxWriter
+
         return connected
 
     except Exception as e:
-        _logger.error(MODULE_NAME + '::influx_init()::Cannot initialize Influx connection. Cause: '
-                      + str(e) + "\n" + traceback.format_exc())
+        _logger.error('%s::influx_init()::Cannot initialize Influx connection. Cause: %s', MODULE_NAME, e,
+                      exc_info=True)
         connected = False
 
 
+def ecs_logout():
+    global _ecsAuthentication
+    global _logger
+
+    try:
+        # Release our tokens so they do not count against the ECS per user token limit.  Cached
+        # tokens are kept alive so they can be reused by the next start.
+        for auth in _ecsAuthentication:
+            if auth.tokencache is None:
+                auth.logout()
+
+    except Exception as e:
+        _logger.error('%s::ecs_logout()::A failure ocurred logging out of ECS. Cause: %s', MODULE_NAME, e,
+                      exc_info=True)
+
+
+def ecs_log_stats(log):
+    """
+    Logs the connection pool and metadata cache statistics of every ECS and the statistics of the Influx writers
+    """
+    for ecsconnection in list(_ecsManagmentAPI):
+        log('%s::ecs_log_stats()::Connection pool: %s  Metadata cache: %s', MODULE_NAME,
+            ecsconnection.get_pool_stats(), ecsconnection.metadata_cache.get_stats())
+
+    if _influxWriter is not None:
+        log('%s::ecs_log_stats()::Influx batch writer: %s', MODULE_NAME, _influxWriter.get_stats())
+
+    if _influxSpool is not None:
+        log('%s::ecs_log_stats()::Influx spool: %s', MODULE_NAME, _influxSpool.get_stats())
+
+    if _influxRouter is not None:
+        for transport, writer in _influxRouter.transports.items():
+            if hasattr(writer, 'get_stats'):
+                log('%s::ecs_log_stats()::Influx %s transport: %s', MODULE_NAME, transport, writer.get_stats())
+
+
 def ecs_data_collection():
     global _influxClient
     global _ecsAuthentication
     global _logger
     global _ecsManagmentAPI
 
+    threads = []
+
     try:
         # Wait till configuration is set
         while not _configuration:
             time.sleep(1)
 
+        # Start the gap backfill before the collectors so the watermarks from before the start are its floor
+        if _configuration.backfill:
+            threads.append(ecs_start_backfill())
+
+        if _configuration.collection_engine == 'asyncio':
+            return threads + ecs_async_data_collection()
+
         # Now lets spin up a thread for each API call with it's own custom polling interval by iterating
         # through our module configuration
         for i, j in _configuration.modules_intervals.items():
             method = str(i)
             interval = str(j)
-            t = ECSDataCollection(method, _influxClient, _logger, _ecsManagmentAPI, interval, _configuration.tempfilepath)
+            # The temporary directory is only handed to the collectors when billing responses are to be captured
+            if _configuration.billing_debug_capture:
+                tempdir = _configuration.tempfilepath
+            else:
+                tempdir = None
+
+            t = ECSDataCollection(method, _influxClient, _logger, _ecsManagmentAPI, interval, tempdir)
             t.start()
+            threads.append(t)
+
+    except Exception as e:
+        _logger.error('%s::ecs_data_collection()::A failure ocurred during data collection. Cause: %s', MODULE_NAME,
+                      e, exc_info=True)
+
+    return threads
+
+
+def ecs_start_backfill():
+    global _ecsBackfill
+
+    # Only the configured dashboard collectors that carry their own sample times have a history to backfill
+    endpoints = [ECS_DASHBOARD_COLLECTORS[str(method)] for method in _configuration.modules_intervals
+                 if str(method) in ECS_DASHBOARD_COLLECTORS and ECS_DASHBOARD_COLLECTORS[str(method)].series_time]
+
+    # The backfill writes its own large batches at a limited rate so it bypasses the batching writer
+    if _influxWriter is not None:
+        influxclient = _influxWriter.influxclient
+    else:
+        influxclient = _influxClient
+
+    _ecsBackfill = ECSBackfill(influxclient, _logger, _ecsManagmentAPI, endpoints,
+                               _configuration.backfill_batch_size, _configuration.backfill_max_points_per_second)
+    _ecsBackfill.start()
+
+    return _ecsBackfill
+
+
+def ecs_async_data_collection():
+    global _influxClient
+    global _logger
+    global _ecsManagmentAPI
+
+    threads = []
+
+    try:
+        if ECSAsyncManagementAPI is None:
+            _logger.error('%s::ecs_async_data_collection()::The asyncio collection engine requires the aiohttp '
+                          'package.  Please install it or select the thread collection engine.', MODULE_NAME)
+            return threads
+
+        # The temporary directory is only handed to the collectors when billing responses are to be captured
+        if _configuration.billing_debug_capture:
+            tempdir = _configuration.tempfilepath
+        else:
+            tempdir = None
+
+        # All polling methods against all ECS run as tasks on a single event loop hosted by this thread
+        t = threading.Thread(target=ecs_run_async_collection_engine,
+                             args=(_influxClient, _logger, _ecsManagmentAPI, _configuration.modules_intervals, tempdir))
+        t.start()
+        threads.append(t)
 
     except Exception as e:
-        _logger.error(MODULE_NAME + '::ecs_data_collection()::A failure ocurred during data collection. Cause: '
-                      + str(e) + "\n" + traceback.format_exc())
+        _logger.error('%s::ecs_async_data_collection()::A failure ocurred during data collection. Cause: %s',
+                      MODULE_NAME, e, exc_info=True)
+
+    return threads
 
 
 """
@@ -1736,7 +1675,41 @@ if __name__ == "__main__":
             if influx_init():
 
                 # Launch ECS Data Collection polling threads
-                ecs_data_collection()
+                collection_threads = ecs_data_collection()
+
+                # Wait for a shutdown request, logging the pool and writer statistics for tuning once per interval
+                stats_time = time.monotonic()
+                while not controlledShutdown.kill_now:
+                    time.sleep(1)
+
+                    if time.monotonic() - stats_time >= INTERVAL:
+                        stats_time = time.monotonic()
+                        if _logger.is_enabled_for(logging.DEBUG):
+                            ecs_log_stats(_logger.debug)
+
+                # Wait for the polling threads to finish their current cycle
+                for collection_thread in collection_threads:
+                    collection_thread.join()
+
+                # Write the points still queued by the collectors
+                if _influxWriter is not None:
+                    _influxWriter.close()
+
+                # Stop replaying the spool, anything still spooled is replayed by the next start
+                if _influxSpool is not None:
+                    _influxSpool.close()
+
+                if _influxRouter is not None:
+                    _influxRouter.close()
+
+                # Persist the watermarks of the samples written so far
+                if _ecsWatermarks is not None:
+                    _ecsWatermarks.save()
+
+                ecs_log_stats(_logger.info)
+
+                # Release our ECS tokens
+                ecs_logout()
 
                 # Check for shutdown
                 if controlledShutdown.kill_now:
@@ -1744,4 +1717,8 @@ if __name__ == "__main__":
     except Exception as e:
         print(MODULE_NAME + '__main__::The following unexpected error occured: '
               + str(e) + "\n" + traceback.format_exc())
+    finally:
+        # Write out any log records still queued for the log file
+        if _logger is not None:
+            _logger.close()
 
@@ -1,40 +1,390 @@
 """
 DELL EMC ECS API Data Collection Module.
 """
+import collections
+import logging
 import os
 import json
+import threading
+import time
 import requests
 import urllib3
 import uuid
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 try:
     import xml.etree.cElementTree as ET
 except ImportError:
     import xml.etree.ElementTree as ET
 
+# Incremental JSON parser used to stream large dashboard responses when installed
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Use the fastest installed JSON decoder for responses that are decoded in one piece
+try:
+    import orjson as fastjson
+except ImportError:
+    try:
+        import ujson as fastjson
+    except ImportError:
+        fastjson = json
+
 
 class ECSException(Exception):
     pass
 
 
+class ECSResponse(object):
+    """
+    Result of a single ECS Management API call.  Every call returns its own response so API objects can be
+    shared by any number of threads.
+    """
+
+    def __init__(self, status, latency, size, data=None):
+        self.status = status
+        self.latency = latency
+        self.bytes = size
+        self.data = data
+
+
+class ECSEndpoint(object):
+    """
+    Declarative description of an ECS Management API endpoint.  Endpoints with a measurement also describe how
+    their response is written to Influx.  A 'single' response is one entity, an 'instances' response carries a
+    list of entities under '_embedded._instances' each of which is tagged with its instance key.  The instances
+    of a 'stream' endpoint are decoded one at a time as the response arrives.
+    """
+
+    def __init__(self, name, path, dashboard=False, response='json', measurement=None, description=None,
+                 shape='single', instance_key=None, tag_key=None, value_type=str, drop_fields=('_links',),
+                 metrics_suffix='Metrics', summary_suffix='Summary', series_time=True, stream=False):
+        self.name = name
+        self.path = path
+        self.dashboard = dashboard
+        self.response = response
+        self.measurement = measurement
+        self.description = description
+        self.shape = shape
+        self.instance_key = instance_key
+        self.tag_key = tag_key
+        self.value_type = value_type
+        self.drop_fields = drop_fields
+        self.metrics_suffix = metrics_suffix
+        self.summary_suffix = summary_suffix
+        self.series_time = series_time
+        self.stream = stream
+
+
+# Dashboard fields we are not handling for now
+TRANSACTION_ERROR_FIELDS = ('_links', 'transactionErrors', 'transactionErrorsSummary', 'transactionErrorsCurrent')
+
+ECS_ENDPOINTS = dict((endpoint.name, endpoint) for endpoint in [
+    ECSEndpoint('capacity', 'object/capacity.json', measurement='Capacity',
+                description='ECS Dashboard Capacity Information', value_type=int, drop_fields=()),
+    ECSEndpoint('local_zone', 'dashboard/zones/localzone', dashboard=True, measurement='dashboard_local_zone',
+                description='ECS Dashboard Local Zone Information', drop_fields=TRANSACTION_ERROR_FIELDS,
+                metrics_suffix='_metrics', summary_suffix='_summary', series_time=False),
+    ECSEndpoint('local_zone_node', 'dashboard/zones/localzone/nodes', dashboard=True, measurement='LocalZoneNodes',
+                description='ECS Dashboard Local Zone Node Information', shape='instances',
+                instance_key='displayName', tag_key='NodeID', drop_fields=TRANSACTION_ERROR_FIELDS, stream=True),
+    ECSEndpoint('local_zone_disk', 'dashboard/zones/localzone/disks', dashboard=True, measurement='LocalZoneDisks',
+                description='ECS Dashboard Local Zone Disk Information', shape='instances',
+                instance_key='displayName', tag_key='DiskID', stream=True),
+    ECSEndpoint('local_zone_replication', 'dashboard/zones/localzone/replicationgroups', dashboard=True,
+                measurement='LocalZoneReplication', description='ECS Dashboard Local Replication Node Information',
+                shape='instances', instance_key='name', tag_key='ReplicationGroupID'),
+    ECSEndpoint('local_zone_replication_failure', 'dashboard/zones/localzone/rglinksFailed', dashboard=True,
+                measurement='LocalZoneReplicationFailure',
+                description='ECS Dashboard Local Replication Group Link Failure Information', shape='instances',
+                instance_key='rgName', tag_key='ReplicationGroupID'),
+    ECSEndpoint('local_zone_bootstrap', 'dashboard/zones/localzone/rglinksBootstrap', dashboard=True,
+                measurement='LocalZoneReplicationBootstrap',
+                description='ECS Dashboard Local Replication Group Link Bootstrap Information', shape='instances',
+                instance_key='rgName', tag_key='ReplicationGroupID'),
+    ECSEndpoint('bucket_billing', 'object/billing/buckets/{namespace}/{bucket}/info', response='xml'),
+    ECSEndpoint('namespace_billing', 'object/billing/namespace/{namespace}/info', response='xml'),
+    ECSEndpoint('namespaces', 'object/namespaces'),
+    ECSEndpoint('buckets', 'object/bucket')
+])
+
+
+class ECSTokenCache(object):
+    """
+    Persists ECS Management tokens keyed by host and user so they can be reused across restarts.
+    The cache file is only readable and writable by the owner.
+    """
+    def __init__(self, cache_file, logger):
+        self.cache_file = cache_file
+        self.logger = logger
+        self.lock = threading.Lock()
+        self.tokens = {}
+
+        if os.path.exists(self.cache_file):
+            try:
+                with open(self.cache_file, 'r') as f:
+                    self.tokens = json.load(f)
+            except (IOError, ValueError) as e:
+                self.logger.error('ECSTokenCache::Unable to load token cache file %s, starting with an empty cache: '
+                                  '%s', self.cache_file, e)
+                self.tokens = {}
+
+    @staticmethod
+    def get_key(host, port, username):
+        return "{0}:{1}/{2}".format(host, port, username)
+
+    def get(self, key):
+        """
+        Returns the cached (token, acquired time) for a key or None
+        """
+        with self.lock:
+            entry = self.tokens.get(key)
+
+        if entry is None:
+            return None
+
+        return entry['token'], entry['acquired']
+
+    def put(self, key, token, acquired):
+        with self.lock:
+            self.tokens[key] = {'token': token, 'acquired': acquired}
+            self._save()
+
+    def remove(self, key):
+        with self.lock:
+            if self.tokens.pop(key, None) is not None:
+                self._save()
+
+    def _save(self):
+        # Write to a private temporary file and swap it in so readers never see a partial cache
+        temp_file = self.cache_file + '.tmp'
+
+        try:
+            fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self.tokens, f)
+            os.chmod(temp_file, 0o600)
+            os.replace(temp_file, self.cache_file)
+        except OSError as e:
+            self.logger.error('ECSTokenCache::Unable to save token cache file %s: %s', self.cache_file, e)
+
+
+class ECSWatermarks(object):
+    """
+    High water marks of the history samples written to Influx keyed by host, measurement, entity and field.
+    Only samples newer than the watermark of their field are emitted again.  When a watermark file is
+    configured the watermarks are saved to it at most every save interval and loaded on startup.
+    """
+    def __init__(self, watermark_file, logger, saveinterval=60):
+        self.watermark_file = watermark_file
+        self.logger = logger
+        self.saveinterval = float(saveinterval)
+        self.lock = threading.Lock()
+        self.watermarks = {}
+        self.dirty = False
+        self.last_save = time.monotonic()
+
+        if self.watermark_file and os.path.exists(self.watermark_file):
+            try:
+                with open(self.watermark_file, 'r') as f:
+                    self.watermarks = json.load(f)
+            except (IOError, ValueError) as e:
+                self.logger.error('ECSWatermarks::Unable to load watermark file %s, starting without watermarks: %s',
+                                  self.watermark_file, e)
+                self.watermarks = {}
+
+    @staticmethod
+    def get_key(host, measurement, entity, field):
+        return "{0}|{1}|{2}|{3}".format(host, measurement, '' if entity is None else entity, field)
+
+    def get(self, key):
+        """
+        Returns the epoch time of the newest sample written for a key or None
+        """
+        with self.lock:
+            return self.watermarks.get(key)
+
+    def snapshot(self, host=None):
+        """
+        Returns a copy of the watermarks of an ECS host or, when no host is given, of all watermarks
+        """
+        prefix = "{0}|".format(host)
+
+        with self.lock:
+            if host is None:
+                return dict(self.watermarks)
+
+            return dict((key, watermark) for key, watermark in self.watermarks.items() if key.startswith(prefix))
+
+    def filter(self, host, measurement, entity, series, marks, floor=None):
+        """
+        Returns the samples of a history series keyed by epoch time that are newer than the watermark of
+        their field.  The newest sample time of every emitted field is recorded in marks so the watermarks
+        can be advanced with update() once the samples have been written.  A floor taken with snapshot()
+        filters against older watermarks instead of the current ones.
+        """
+        prefix = self.get_key(host, measurement, entity, '')
+        filtered = {}
+
+        with self.lock:
+            watermarks = self.watermarks if floor is None else floor
+
+            for times in series:
+                epoch_time = int(times)
+
+                for field in series[times]:
+                    key = prefix + field
+                    watermark = watermarks.get(key)
+
+                    if watermark is not None and epoch_time <= watermark:
+                        continue
+
+                    if times not in filtered:
+                        filtered[times] = {}
+                    filtered[times][field] = series[times][field]
+
+                    if epoch_time > marks.get(key, epoch_time - 1):
+                        marks[key] = epoch_time
+
+        return filtered
+
+    def update(self, marks):
+        """
+        Advances the watermarks to the sample times recorded by filter()
+        """
+        if not marks:
+            return
+
+        with self.lock:
+            for key in marks:
+                if marks[key] > self.watermarks.get(key, marks[key] - 1):
+                    self.watermarks[key] = marks[key]
+            self.dirty = True
+
+            if self.watermark_file and time.monotonic() - self.last_save >= self.saveinterval:
+                self._save()
+
+    def save(self):
+        """
+        Saves the watermarks to the watermark file if they changed since they were last saved
+        """
+        with self.lock:
+            if self.watermark_file and self.dirty:
+                self._save()
+
+    def _save(self):
+        # Write to a temporary file and swap it in so a crash never leaves a partial watermark file behind
+        temp_file = self.watermark_file + '.tmp'
+
+        try:
+            with open(temp_file, 'w') as f:
+                json.dump(self.watermarks, f)
+            os.replace(temp_file, self.watermark_file)
+            self.dirty = False
+        except OSError as e:
+            self.logger.error('ECSWatermarks::Unable to save watermark file %s: %s', self.watermark_file, e)
+
+        self.last_save = time.monotonic()
+
+
 class ECSAuthentication(object):
     """
     Stores ECS Authentication Information
     """
-    def __init__(self, protocol, host, username, password, port, logger):
+    def __init__(self, protocol, host, username, password, port, logger, poolsize=10, keepalive=True, maxidle=300,
+                 tokenmaxage=25200, tokencache=None, connecttimeout=15, readtimeout=60):
         self.protocol = protocol
         self.host = host
         self.port = port
         self.username = username
         self.password = password
         self.logger = logger
-        self.logger.info('ECSAuthentication::Object instance initialization complete.')
         self.url = "{0}://{1}:{2}".format(self.protocol, self.host, self.port)
         self.token = ''
+        self.timeout = (float(connecttimeout), float(readtimeout))
+
+        # Token refresh is single flight - only one thread at a time may log in to this ECS
+        self.token_lock = threading.Lock()
+        self.token_acquired = 0.0
+        self.tokenmaxage = float(tokenmaxage)
+        self.tokencache = tokencache
+        self.tokencache_key = ECSTokenCache.get_key(host, port, username)
+
+        # Connection pool settings shared by every API call made against this ECS
+        self.poolsize = int(poolsize)
+        self.keepalive = keepalive
+        self.maxidle = float(maxidle)
+        self.pool_lock = threading.Lock()
+        self.pool_last_used = time.time()
+        self.pool_idle_resets = 0
+        self.pool_requests = 0
+        self.session = self._create_session()
 
         # Disable warnings
         urllib3.disable_warnings()
 
+        self.logger.info('ECSAuthentication::Object instance initialization complete.')
+
+    def _create_session(self):
+        """
+        Creates a pooled HTTP session for this ECS.  Threads block waiting for a free connection
+        rather than opening connections outside of the pool.
+        """
+        session = requests.Session()
+        session.verify = False
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.poolsize, pool_block=True)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
+        if not self.keepalive:
+            session.headers['Connection'] = 'close'
+
+        return session
+
+    def get_session(self):
+        """
+        Returns the pooled session for this ECS.  Pooled connections that have been idle
+        longer than the configured maximum idle time are dropped before the session is reused.
+        """
+        with self.pool_lock:
+            now = time.time()
+            if self.maxidle > 0 and now - self.pool_last_used > self.maxidle:
+                for adapter in self.session.adapters.values():
+                    adapter.poolmanager.clear()
+                self.pool_idle_resets += 1
+                self.logger.debug('ECSAuthentication::get_session()::Pooled connections to host %s were idle for '
+                                  'more than %s seconds and have been reset.', self.host, self.maxidle)
+            self.pool_last_used = now
+            self.pool_requests += 1
+
+        return self.session
+
+    def get_pool_stats(self):
+        """
+        Returns connection pool statistics for this ECS.
+        """
+        connections = 0
+        pooled_requests = 0
+
+        adapter = self.session.get_adapter(self.url)
+        for key in adapter.poolmanager.pools.keys():
+            pool = adapter.poolmanager.pools.get(key)
+            if pool is not None:
+                connections += pool.num_connections
+                pooled_requests += pool.num_requests
+
+        with self.pool_lock:
+            return {'host': self.host,
+                    'pool_size': self.poolsize,
+                    'keep_alive': self.keepalive,
+                    'max_idle': self.maxidle,
+                    'requests': self.pool_requests,
+                    'connections_opened': connections,
+                    'pooled_requests': pooled_requests,
+                    'idle_resets': self.pool_idle_resets}
+
     def get_url(self):
         """
         Returns an ECS Management url made from protocol, host and port.
@@ -43,473 +393,458 @@ class ECSAuthentication(object):
 
     def get_token(self):
         """
-        Returns an ECS Management token
+        Returns an ECS Management token.  A token older than the configured maximum token age is
+        proactively refreshed before it is returned.
         """
-        return self.tokens
+        token = self.token
+
+        if token and self.tokenmaxage > 0 and time.time() - self.token_acquired > self.tokenmaxage:
+            self.logger.info('ECSAuthentication::get_token()::Token for host %s is older than %s seconds.  '
+                             'Refreshing token.', self.host, self.tokenmaxage)
+            self.refresh(token)
+            token = self.token
+
+        return token
 
-    def connect(self):
+    def refresh(self, expired_token):
         """
-        Connect to ECS and if successful update token
+        Log in again after the given token was rejected or has expired.  Only one thread logs in, threads
+        that arrive while a login is in progress wait for it and then reuse the token it obtained.
         """
-        self.logger.info('ECSAuthentication::connect()::We are about to attempt to connect to ECS with the following URL : '
-                         + "{0}://{1}:{2}".format(self.protocol, self.host, self.port) + '/login')
+        with self.token_lock:
+            if self.token and self.token != expired_token:
+                # Another thread already replaced the expired token
+                return
 
-        r = requests.get("{0}://{1}:{2}".format(self.protocol, self.host, self.port) + '/login',
-                         verify=False, auth=HTTPBasicAuth(self.username, self.password))
+            # The rejected token must not be picked up from the token cache again
+            self.connect(use_cache=False)
 
-        self.logger.info('ECSAuthentication::connect()::login call to ECS returned with status code: ' + str(r.status_code))
-        if r.status_code == requests.codes.ok:
-            self.logger.info('ECSAuthentication::connect()::login call returned with a 200 status code.  '
-                              'X-SDS-AUTH-TOKEN Header contains: ' + r.headers['X-SDS-AUTH-TOKEN'])
-            self.token = r.headers['X-SDS-AUTH-TOKEN']
-        else:
-            self.logger.info('ECSManagementAPI::connect()::login call '
-                             'failed with a status code of ' + str(r.status_code))
-            self.token = None
+    def validate_token(self, token):
+        """
+        Checks with a cheap API call whether ECS still accepts a token
+        """
+        headers = {'X-SDS-AUTH-TOKEN': "'{0}'".format(token), 'Accept': 'application/json'}
 
+        r = self.get_session().get("{0}/user/whoami".format(self.url), headers=headers, verify=False,
+                                   timeout=self.timeout)
 
-class ECSManagementAPI(object):
-    """
-    Perform ECS Management API Calls
-    """
-
-    def __init__(self, authentication, connecttimeout, readtimeout, logger, response_json=None):
-        self.ecs_authentication_failure = int('497')
-        self.authentication = authentication
-        self.response_json = response_json
-        self.connecttimeout = connecttimeout
-        self.readtimeout = readtimeout
-        self.logger = logger
-        self.response_xml_file = None
+        return r.status_code == requests.codes.ok
 
-    def get_local_zone_data(self):
+    def connect(self, use_cache=True):
+        """
+        Connect to ECS and if successful update token.  A valid token from the token cache is reused
+        instead of logging in again.
+        """
+        if use_cache and self.tokencache is not None:
+            cached_token = self.tokencache.get(self.tokencache_key)
 
-        while True:
-            # Perform ECS Dashboard Local Zone API Call
-            headers = {'X-SDS-AUTH-TOKEN': "'{0}'".format(self.authentication.token), 'content-type': 'application/json'}
-
-            r = requests.get("{0}//dashboard/zones/localzone".format(self.authentication.url),
-                             headers=headers, verify=False)
-
-            if r.status_code == requests.codes.ok:
-                self.logger.debug('ECSManagementAPI::get_local_zone_data()::/dashboard/zones/localzone '
-                                 'call returned with a 200 status code.')
-                self.response_json = r.json()
-                self.logger.debug('ECSManagementAPI::get_local_zone_data()::r.text() contains: \n' + r.text)
-
-                if type(self.response_json) is list:
-                    self.logger.debug('ECSManagementAPI::get_local_zone_data()::r.json() returned a list. ')
-                elif type(self.response_json) is dict:
-                    self.logger.debug('ECSManagementAPI::get_local_zone_data()::r.json() returned a dictionary. ')
-                else:
-                    self.logger.debug('ECSManagementAPI::get_local_zone_data()::r.json() returned unknown. ')
-                break
-            else:
-                if r.status_code == self.ecs_authentication_failure:
-                    # Attempt to re-authenticate
-                    self.authentication.token = None
-                    self.authentication.connect()
+            if cached_token is not None:
+                if self.validate_token(cached_token[0]):
+                    self.logger.info('ECSAuthentication::connect()::Reusing cached token for host %s.', self.host)
+                    self.token, self.token_acquired = cached_token
+                    return
 
-                    if self.authentication.token is None:
-                        self.logger.error('ECSManagementAPI::get_local_zone_data()::Token Expired.  Unable '
-                                          'to re-authenticate to ECS as configured for host ' + self.authentication.host +
-                                          '.  Please validate and try again.')
-                        raise ECSException("The ECS Data Collection Module was unable to "
-                                           "re-authenticate against host " + self.authentication.host + ".")
-                        break
-                else:
-                    self.logger.error('ECSManagementAPI::get_local_zone_data()::/dashboard/zones/localzone '
-                                      'call against host ' + self.authentication.host + ' failed with a status code of ' + str(r.status_code))
-                    self.response_json = None
-                    break
+                self.logger.info('ECSAuthentication::connect()::Cached token for host %s is no longer valid.',
+                                 self.host)
+                self.tokencache.remove(self.tokencache_key)
 
-        return self.response_json
+        self.logger.info('ECSAuthentication::connect()::We are about to attempt to connect to ECS with the following '
+                         'URL : %s://%s:%s/login', self.protocol, self.host, self.port)
 
-    def get_local_zone_replication_data(self):
+        r = self.get_session().get("{0}://{1}:{2}".format(self.protocol, self.host, self.port) + '/login',
+                                   verify=False, auth=HTTPBasicAuth(self.username, self.password), timeout=self.timeout)
 
-        while True:
-            # Perform ECS Dashboard Local Zone API Call
-            headers = {'X-SDS-AUTH-TOKEN': "'{0}'".format(self.authentication.token), 'content-type': 'application/json'}
-
-            r = requests.get("{0}//dashboard/zones/localzone/replicationgroups".format(self.authentication.url),
-                             headers=headers, verify=False)
-
-            if r.status_code == requests.codes.ok:
-                self.logger.debug('ECSManagementAPI::get_local_zone_replication_data()::/dashboard/zones/localzone/replicationgroups '
-                                 'call returned with a 200 status code.')
-                self.response_json = r.json()
-                self.logger.debug('ECSManagementAPI::get_local_zone_replication_data()::r.text() contains: \n' + r.text)
-
-                if type(self.response_json) is list:
-                    self.logger.debug('ECSManagementAPI::get_local_zone_replication_data()::r.json() returned a list. ')
-                elif type(self.response_json) is dict:
-                    self.logger.debug('ECSManagementAPI::get_local_zone_replication_data()::r.json() returned a dictionary. ')
-                else:
-                    self.logger.debug('ECSManagementAPI::get_local_zone_replication_data()::r.json() returned unknown. ')
-                break
-            else:
-                if r.status_code == self.ecs_authentication_failure:
-                    # Attempt to re-authenticate
-                    self.authentication.token = None
-                    self.authentication.connect()
+        self.logger.info('ECSAuthentication::connect()::login call to ECS returned with status code: %s',
+                         r.status_code)
+        if r.status_code == requests.codes.ok:
+            self.logger.info('ECSAuthentication::connect()::login call returned with a 200 status code.  '
+                             'X-SDS-AUTH-TOKEN Header contains: %s', r.headers['X-SDS-AUTH-TOKEN'])
+            self.token = r.headers['X-SDS-AUTH-TOKEN']
+            self.token_acquired = time.time()
 
-                    if self.authentication.token is None:
-                        self.logger.error('ECSManagementAPI::get_local_zone_replication_data()::Token Expired.  Unable '
-                                          'to re-authenticate to ECS as configured.  Please validate and try again.')
-                        raise ECSException("The ECS Data Collection Module was unable to re-authenticate.")
-                        break
-                else:
-                    self.logger.error('ECSManagementAPI::get_local_zone_replication_data()::/dashboard/zones/localzone/replicationgroups '
-                                      'call against host ' + self.authentication.host + ' failed with a status code of ' + str(r.status_code))
-                    self.response_json = None
-                    break
+            if self.tokencache is not None:
+                self.tokencache.put(self.tokencache_key, self.token, self.token_acquired)
+        else:
+            self.logger.info('ECSManagementAPI::connect()::login call failed with a status code of %s',
+                             r.status_code)
+            self.token = None
 
-        return self.response_json
+            if self.tokencache is not None:
+                self.tokencache.remove(self.tokencache_key)
 
-    def get_local_zone_replication_failure_data(self):
+    def logout(self):
+        """
+        Log out of ECS releasing the current token so it does not count against the ECS per user token limit
+        """
+        with self.token_lock:
+            if not self.token:
+                return
 
-        while True:
-            # Perform ECS Dashboard Local Zone API Call
-            headers = {'X-SDS-AUTH-TOKEN': "'{0}'".format(self.authentication.token), 'content-type': 'application/json'}
+            headers = {'X-SDS-AUTH-TOKEN': "'{0}'".format(self.token)}
 
+            try:
+                r = self.get_session().get("{0}/logout".format(self.url), headers=headers, verify=False,
+                                           timeout=self.timeout)
 
-            r = requests.get("{0}//dashboard/zones/localzone/rglinksFailed".format(self.authentication.url),
-                             headers=headers, verify=False, timeout=(float(self.connecttimeout), float(self.readtimeout)))
+                self.logger.info('ECSAuthentication::logout()::logout call to ECS host %s returned with status '
+                                 'code: %s', self.host, r.status_code)
+            except requests.exceptions.RequestException as e:
+                self.logger.error('ECSAuthentication::logout()::logout call to ECS host %s failed: %s', self.host, e)
 
-            if r.status_code == requests.codes.ok:
-                self.logger.debug('ECSManagementAPI::get_local_zone_replication_failure_data()::/dashboard/zones/localzone/rglinksFailed '
-                                 'call returned with a 200 status code.')
-                self.response_json = r.json()
-                self.logger.debug('ECSManagementAPI::get_local_zone_replication_failure_data()::r.text() contains: \n' + r.text)
+            self.token = None
 
-                if type(self.response_json) is list:
-                    self.logger.debug('ECSManagementAPI::get_local_zone_replication_failure_data()::r.json() returned a list. ')
-                elif type(self.response_json) is dict:
-                    self.logger.debug('ECSManagementAPI::get_local_zone_replication_failure_data()::r.json() returned a dictionary. ')
-                else:
-                    self.logger.debug('ECSManagementAPI::get_local_zone_replication_failure_data()::r.json() returned unknown. ')
-                break
-            else:
-                if r.status_code == self.ecs_authentication_failure:
-                    # Attempt to re-authenticate
-                    self.authentication.token = None
-                    self.authentication.connect()
+            if self.tokencache is not None:
+                self.tokencache.remove(self.tokencache_key)
 
-                    if self.authentication.token is None:
-                        self.logger.error('ECSManagementAPI::get_local_zone_replication_failure_data()::Token Expired.  Unable '
-                                         'to re-authenticate to ECS as configured.  Please validate and try again.')
-                        raise ECSException("The ECS Data Collection Module was unable to re-authenticate.")
-                        break
-                else:
-                    self.logger.error('ECSManagementAPI::get_local_zone_replication_failure_data()::/dashboard/zones/localzone/rglinksFailed '
-                                      'call against host ' + self.authentication.host + ' failed with a status code of ' + str(r.status_code))
-                    self.response_json = None
-                    break
 
-        return self.response_json
+class ECSMetadataCache(object):
+    """
+    Thread safe, size bounded cache of ECS metadata such as namespace and bucket listings.  Entries
+    expire after the configured time to live and the least recently used entry is evicted when the
+    cache is full.  A time to live of 0 disables caching.
+    """
+    def __init__(self, ttl, maxsize):
+        self.ttl = float(ttl)
+        self.maxsize = int(maxsize)
+        self.lock = threading.Lock()
+        self.entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def enabled(self):
+        """
+        Returns True if caching is enabled.
+        """
+        return self.ttl > 0 and self.maxsize > 0
 
-    def get_local_zone_bootstrap_data(self):
+    def get(self, key):
+        """
+        Returns the cached value for a key or None if the key is not cached or has expired.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
 
-        while True:
-            # Perform ECS Dashboard Local Zone API Call
-            headers = {'X-SDS-AUTH-TOKEN': "'{0}'".format(self.authentication.token), 'content-type': 'application/json'}
-
-            r = requests.get("{0}//dashboard/zones/localzone/rglinksBootstrap".format(self.authentication.url),
-                             headers=headers, verify=False)
-
-            if r.status_code == requests.codes.ok:
-                self.logger.debug('ECSManagementAPI::get_local_zone_bootstrap_data()::/dashboard/zones/localzone/rglinksBootstrap '
-                                 'call returned with a 200 status code.')
-                self.response_json = r.json()
-                self.logger.debug('ECSManagementAPI::get_local_zone_bootstrap_data()::r.text() contains: \n' + r.text)
-
-                if type(self.response_json) is list:
-                    self.logger.debug('ECSManagementAPI::get_local_zone_bootstrap_data()::r.json() returned a list. ')
-                elif type(self.response_json) is dict:
-                    self.logger.debug('ECSManagementAPI::get_local_zone_bootstrap_data()::r.json() returned a dictionary. ')
-                else:
-                    self.logger.debug('ECSManagementAPI::get_local_zone_bootstrap_data()::r.json() returned unknown. ')
-                break
-            else:
-                if r.status_code == self.ecs_authentication_failure:
-                    # Attempt to re-authenticate
-                    self.authentication.token = None
-                    self.authentication.connect()
+            if entry is None or time.time() - entry[0] > self.ttl:
+                self.entries.pop(key, None)
+                self.misses += 1
+                return None
 
-                    if self.authentication.token is None:
-                        self.logger.error('ECSManagementAPI::get_local_zone_bootstrap_data()::Token Expired.  Unable '
-                                         'to re-authenticate to ECS as configured.  Please validate and try again.')
-                        raise ECSException("The ECS Data Collection Module was unable to re-authenticate.")
-                        break
-                else:
-                    self.logger.error('ECSManagementAPI::get_local_zone_bootstrap_data()::/dashboard/zones/localzone/rglinksBootstrap '
-                                      'call against host ' + self.authentication.host + ' failed with a status code of ' + str(r.status_code))
-                    self.response_json = None
-                    break
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
 
-        return self.response_json
+    def get_stats(self):
+        """
+        Returns the cache statistics
+        """
+        with self.lock:
+            return {'entries': len(self.entries), 'hits': self.hits, 'misses': self.misses}
 
-    def get_capacity_data(self):
+    def put(self, key, value):
+        """
+        Caches a value for a key, evicting the least recently used entries if the cache is full.
+        """
+        if not self.enabled():
+            return
 
-        while True:
-            # Perform ECS Dashboard Local Zone API Call
-            headers = {'X-SDS-AUTH-TOKEN': "'{0}'".format(self.authentication.token), 'content-type': 'application/json'}
+        with self.lock:
+            self.entries[key] = (time.time(), value)
+            self.entries.move_to_end(key)
 
-            r = requests.get("{0}//object/capacity.json".format(self.authentication.url),
-                             headers=headers, verify=False)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
 
-            if r.status_code == requests.codes.ok:
-                self.logger.debug('ECSManagementAPI::get_capacity_data()::/object/capacity call returned '
-                                 'with a 200 status code.  Text is: ' + r.text)
-                self.response_json = r.json()
+    def invalidate(self, key=None):
+        """
+        Drops a single cached key or, when no key is given, the whole cache.
+        """
+        with self.lock:
+            if key is None:
+                self.entries.clear()
+            else:
+                self.entries.pop(key, None)
 
-                self.logger.debug('ECSManagementAPI::get_capacity_data()::r.text() contains: \n' + r.text)
 
-                if type(self.response_json) is list:
-                    self.logger.debug('ECSManagementAPI::get_capacity_data()::r.json() returned a list. ')
-                elif type(self.response_json) is dict:
-                    self.logger.debug('ECSManagementAPI::get_capacity_data()::r.json() returned a dictionary. ')
-                else:
-                    self.logger.debug('ECSManagementAPI::get_capacity_data()::r.json() returned unknown. ')
-                break
-            else:
-                if r.status_code == self.ecs_authentication_failure:
-                    # Attempt to re-authenticate
-                    self.authentication.token = None
-                    self.authentication.connect()
+class ECSManagementAPI(object):
+    """
+    Perform ECS Management API Calls
+    """
 
-                    if self.authentication.token is None:
-                        self.logger.error('ECSManagementAPI::get_capacity_data()::Token Expired.  Unable '
-                                         'to re-authenticate to ECS as configured.  Please validate and try again.')
-                        raise ECSException("The ECS Data Collection Module was unable to re-authenticate.")
-                        break
-                else:
-                    self.logger.error('ECSManagementAPI::get_capacity_data()::/object/capacity '
-                                      'call against host ' + self.authentication.host + ' failed with a status code of ' + str(r.status_code))
-                    self.response_json = None
-                    break
+    def __init__(self, authentication, connecttimeout, readtimeout, logger, billingmaxinflight=1,
+                 billingmode='bucket', pagesize=1000, metadatacachettl=0, metadatacachesize=1000,
+                 datatype='default', category='default', maxconcurrentrequests=4,
+                 polltimeout=90):
+        self.ecs_authentication_failure = int('497')
+        self.authentication = authentication
+        self.connecttimeout = connecttimeout
+        self.readtimeout = readtimeout
+        self.logger = logger
+        self.billingmaxinflight = int(billingmaxinflight)
+        self.billingmode = billingmode
+        self.pagesize = int(pagesize)
+        self.metadata_cache = ECSMetadataCache(metadatacachettl, metadatacachesize)
+        self.datatype = datatype
+        self.category = category
+        self.maxconcurrentrequests = int(maxconcurrentrequests)
+        self.polltimeout = float(polltimeout)
+
+    def get_pool_stats(self):
+        """
+        Returns the connection pool statistics of the ECS this API object is bound to.
+        """
+        return self.authentication.get_pool_stats()
 
-        return self.response_json
+    def get_dashboard_params(self):
+        """
+        Returns the dashboard API query parameters for the configured data type and category.  A data
+        type of 'current' only returns the latest sample instead of the full history series.  Values
+        left at 'default' are not sent so that ECS applies its own defaults.
+        """
+        params_dict = {}
 
-    def get_local_zone_node_data(self):
+        if self.datatype != 'default':
+            params_dict['dataType'] = self.datatype
+        if self.category != 'default':
+            params_dict['category'] = self.category
 
-        while True:
-            # Perform ECS Dashboard Local Zone API Call
-            headers = {'X-SDS-AUTH-TOKEN': "'{0}'".format(self.authentication.token), 'content-type': 'application/json'}
+        return params_dict
 
-            r = requests.get("{0}//dashboard/zones/localzone/nodes".format(self.authentication.url),
-                             headers=headers, verify=False)
+    def request(self, endpoint, params=None, tempdir=None, **path_args):
+        """
+        Performs a GET against an ECS Management API endpoint and returns the response.  Path arguments fill in
+        the endpoint path, dashboard endpoints also send the configured dashboard parameters.  When a temporary
+        directory is provided the raw XML response is captured to a file there for debugging.  The data of a
+        stream endpoint is an iterator over its instances which must be consumed to release the connection.
+        """
+        path = endpoint.path.format(**path_args)
 
-            if r.status_code == requests.codes.ok:
-                self.logger.debug('ECSManagementAPI::get_local_zone_node_data()::'
-                                 '/dashboard/zones/localzone/nodes call returned '
-                                 'with a 200 status code.  Text is: ' + r.text)
-                self.response_json = r.json()
+        query = {}
+        if endpoint.dashboard:
+            query.update(self.get_dashboard_params())
+        if params:
+            query.update(params)
 
-                self.logger.debug('ECSManagementAPI::get_local_zone_node_data()::r.text() contains: \n' + r.text)
+        # Without an incremental parser the instances are decoded in one piece
+        stream = endpoint.stream and ijson is not None
 
-                if type(self.response_json) is list:
-                    self.logger.debug('ECSManagementAPI::get_local_zone_node_data()::r.json() returned a list. ')
-                elif type(self.response_json) is dict:
-                    self.logger.debug('ECSManagementAPI::get_local_zone_node_data()::r.json() returned a dictionary. ')
+        while True:
+            token = self.authentication.get_token()
+            headers = {'X-SDS-AUTH-TOKEN': "'{0}'".format(token), 'content-type': 'application/json',
+                       'Accept': 'application/' + endpoint.response}
+
+            session = self.authentication.get_session()
+            start_time = time.monotonic()
+            r = session.get("{0}/{1}".format(self.authentication.url, path), headers=headers, verify=False,
+                            params=query, timeout=self.authentication.timeout, stream=stream)
+            latency = time.monotonic() - start_time
+
+            if r.status_code == requests.codes.ok and stream:
+                self.logger.debug('ECSManagementAPI::request()::/%s call returned with a 200 status code.  '
+                                  'Streaming instances.', path)
+
+                return ECSResponse(r.status_code, latency, int(r.headers.get('content-length', 0)),
+                                   self._iter_stream_instances(r))
+            elif r.status_code == requests.codes.ok:
+                # Only decode the body to text when it is going to be logged
+                if self.logger.is_enabled_for(logging.DEBUG):
+                    self.logger.debug('ECSManagementAPI::request()::/%s call returned with a 200 status code.  '
+                                      'Text is: %s', path, r.text)
+
+                if endpoint.response == 'xml':
+                    # Debug capture mode - store the raw XML in a unique temp file
+                    if tempdir is not None:
+                        tempfile = os.path.abspath(os.path.join(tempdir, str(uuid.uuid4()) + ".xml"))
+                        with open(tempfile, "wb") as fo:
+                            fo.write(r.content)
+
+                        self.logger.debug('ECSManagementAPI::request()::Captured /%s response to %s', path, tempfile)
+
+                    try:
+                        data = ET.fromstring(r.content)
+                    except ET.ParseError as e:
+                        self.logger.error('ECSManagementAPI::request()::/%s response from host %s could not be '
+                                          'parsed: %s', path, self.authentication.host, e)
+                        data = None
+                elif endpoint.stream:
+                    data = iter(fastjson.loads(r.content)['_embedded']['_instances'])
                 else:
-                    self.logger.debug('ECSManagementAPI::get_local_zone_node_data()::r.json() returned unknown. ')
-                break
+                    data = fastjson.loads(r.content)
+
+                return ECSResponse(r.status_code, latency, len(r.content), data)
             else:
                 if r.status_code == self.ecs_authentication_failure:
-                    # Attempt to re-authenticate
-                    self.authentication.token = None
-                    self.authentication.connect()
+                    # Hand a streamed connection back to the pool before retrying
+                    r.close()
+
+                    # Attempt to re-authenticate.  Only one thread logs in again while the others wait for its token
+                    self.authentication.refresh(token)
 
                     if self.authentication.token is None:
-                        self.logger.error('ECSManagementAPI::get_local_zone_node_data()::Token Expired.  Unable '
-                                         'to re-authenticate to ECS as configured.  Please validate and try again.')
+                        self.logger.error('ECSManagementAPI::request()::Token Expired.  Unable '
+                                          'to re-authenticate to ECS as configured.  Please validate and try again.')
                         raise ECSException("The ECS Data Collection Module was unable to re-authenticate.")
-                        break
                 else:
-                    self.logger.error('ECSManagementAPI::get_local_zone_node_data()::/dashboard/zones/localzone/nodes '
-                                      'call against host ' + self.authentication.host + ' failed with a status code of ' + str(r.status_code))
-                    self.response_json = None
-                    break
+                    self.logger.error('ECSManagementAPI::request()::/%s call against host %s failed with a status '
+                                      'code of %s', path, self.authentication.host, r.status_code)
+                    return ECSResponse(r.status_code, latency, len(r.content))
 
-        return self.response_json
+    def _iter_stream_instances(self, r):
+        try:
+            # Let urllib3 undo any content encoding before the parser sees the body
+            r.raw.decode_content = True
 
-    def get_local_zone_disk_data(self):
+            for instance in ijson.items(r.raw, '_embedded._instances.item', use_float=True):
+                yield instance
+        finally:
+            r.close()
 
-        while True:
-            # Perform ECS Dashboard Local Zone API Call
-            headers = {'X-SDS-AUTH-TOKEN': "'{0}'".format(self.authentication.token), 'content-type': 'application/json'}
+    def get_namespace_billing_data(self, namespace, bucket, tempdir=None):
+        """
+        Returns the response with the parsed billing information for a bucket.
+        """
+        # We will force the size unit to KB as we will convert that to bytes for storage in Influx
+        response = self.request(ECS_ENDPOINTS['bucket_billing'], {'sizeunit': 'KB', }, tempdir,
+                                namespace=namespace, bucket=bucket)
 
-            r = requests.get("{0}//dashboard/zones/localzone/disks".format(self.authentication.url),
-                             headers=headers, verify=False)
+        # The bucket no longer exists so the cached bucket list of the namespace is stale
+        if response.status == requests.codes.not_found:
+            self.invalidate_metadata(namespace)
 
-            if r.status_code == requests.codes.ok:
-                self.logger.debug('ECSManagementAPI::get_local_zone_disk_data()::'
-                                 '/dashboard/zones/localzone/disks call returned '
-                                 'with a 200 status code.  Text is: ' + r.text)
-                self.response_json = r.json()
+        return response
 
-                self.logger.debug('ECSManagementAPI::get_local_zone_disk_data()::r.text() contains: \n' + r.text)
+    def get_namespace_bulk_billing_data(self, namespace, marker=None, tempdir=None):
+        """
+        Returns the response with one page of parsed billing information for a namespace including per
+        bucket detail.  The next page is requested by passing the 'next_marker' of the previous page as the marker.
+        """
+        # We will force the size unit to KB as we will convert that to bytes for storage in Influx
+        params_dict = {'sizeunit': 'KB', 'include_bucket_detail': 'true', }
+        if marker:
+            params_dict['marker'] = marker
 
-                if type(self.response_json) is list:
-                    self.logger.debug('ECSManagementAPI::get_local_zone_disk_data()::r.json() returned a list. ')
-                elif type(self.response_json) is dict:
-                    self.logger.debug('ECSManagementAPI::get_local_zone_disk_data()::r.json() returned a dictionary. ')
-                else:
-                    self.logger.debug('ECSManagementAPI::get_local_zone_disk_data()::r.json() returned unknown. ')
-                break
-            else:
-                if r.status_code == self.ecs_authentication_failure:
-                    # Attempt to re-authenticate
-                    self.authentication.token = None
-                    self.authentication.connect()
+        response = self.request(ECS_ENDPOINTS['namespace_billing'], params_dict, tempdir, namespace=namespace)
 
-                    if self.authentication.token is None:
-                        self.logger.error('ECSManagementAPI::get_local_zone_disk_data()::Token Expired.  Unable '
-                                         'to re-authenticate to ECS as configured.  Please validate and try again.')
-                        raise ECSException("The ECS Data Collection Module was unable to re-authenticate.")
-                        break
-                else:
-                    self.logger.error('ECSManagementAPI::get_local_zone_disk_data()::/dashboard/zones/localzone/disks '
-                                      'call against host ' + self.authentication.host + ' failed with a status code of ' + str(r.status_code))
-                    self.response_json = None
-                    break
+        # The namespace no longer exists so the cached namespace list is stale
+        if response.status == requests.codes.not_found:
+            self.invalidate_metadata()
 
-        return self.response_json
+        return response
 
-    def get_namespace_billing_data(self, namespace, bucket, tempdir):
+    def get_namespace_bucket_billing_data(self, namespace, tempdir=None):
+        """
+        Returns a dictionary of bucket name to parsed bucket billing information for every bucket in a
+        namespace by following the namespace billing pages.  Returns None if a page could not be retrieved.
+        """
+        bucket_billing_info = {}
+        marker = None
 
         while True:
-            # Perform ECS Dashboard Local Zone API Call
-            headers = {'X-SDS-AUTH-TOKEN': "'{0}'".format(self.authentication.token), 'content-type': 'application/json'}
+            billing_info = self.get_namespace_bulk_billing_data(namespace, marker, tempdir).data
 
-            # We will force the size unit to KB as we will convert that to bytes for storage in Influx
-            params_dict = {'sizeunit': 'KB', }
+            if billing_info is None:
+                return None
 
-            r = requests.get("{0}//object/billing/buckets/{1}/{2}/info".format(self.authentication.url, namespace, bucket),
-                             headers=headers, verify=False, params=params_dict)
+            # Bucket detail elements carry the same children as the single bucket billing response
+            for bucket_info in billing_info.iter('bucket_billing_info'):
+                bucket_name = bucket_info.findtext('name')
+                if bucket_name is not None:
+                    bucket_billing_info[bucket_name] = bucket_info
 
-            if r.status_code == requests.codes.ok:
-                self.logger.debug('ECSManagementAPI::get_namespace_billing_data()::'
-                                  '/object/billing info call returned '
-                                  'with a 200 status code.  Text is: ' + r.text)
-                # Create a unique temp file and store the XML to it for processing
-                tempfile = os.path.abspath(os.path.join(tempdir, str(uuid.uuid4()) + ".xml"))
-                fo = open(tempfile, "w+")
-                fo.write(r.text)
+            marker = billing_info.findtext('next_marker')
+            if not marker:
+                break
 
-                # Close file
-                fo.close()
+        return bucket_billing_info
 
-                self.logger.debug('ECSManagementAPI::ecs_collect_alert_data()::r.text() contains: \n' + r.text)
+    def get_namespace_data(self, marker=None, limit=None):
+        params_dict = {}
+        if limit:
+            params_dict['limit'] = limit
+        if marker:
+            params_dict['marker'] = marker
 
-                self.response_xml_file = tempfile
-                break
-            else:
-                if r.status_code == self.ecs_authentication_failure:
-                    # Attempt to re-authenticate
-                    self.authentication.token = None
-                    self.authentication.connect()
+        return self.request(ECS_ENDPOINTS['namespaces'], params_dict)
 
-                    if self.authentication.token is None:
-                        self.logger.error('ECSManagementAPI::get_namespace_billing_data()::Token Expired.  Unable '
-                                          'to re-authenticate to ECS as configured.  Please validate and try again.')
-                        raise ECSException("The ECS Data Collection Module was unable to re-authenticate.")
-                        break
-                else:
-                    self.logger.error('ECSManagementAPI::get_namespace_billing_data()::/object/billing info '
-                                      'call against host ' + self.authentication.host + ' for namespace ' + namespace + ' and bucket ' + bucket + ' failed with a status code of ' + str(r.status_code))
-                    self.response_xml_file = None
-                    break
-        return self.response_xml_file
+    def get_bucket_data(self, namespace, marker=None, limit=None):
+        params_dict = {'namespace': namespace, }
+        if limit:
+            params_dict['limit'] = limit
+        if marker:
+            params_dict['marker'] = marker
 
-    def get_namespace_data(self):
+        return self.request(ECS_ENDPOINTS['buckets'], params_dict)
 
-        while True:
-            # Perform ECS Object Namespace API Call
-            headers = {'X-SDS-AUTH-TOKEN': "'{0}'".format(self.authentication.token),
-                       'content-type': 'application/json', 'Accept': 'application/json'}
+    def iter_namespaces(self):
+        """
+        Yields every namespace on the ECS, following marker / limit pagination so that only one
+        page of namespaces is held in memory at a time.  The namespace list is served from the
+        metadata cache while it is valid.
+        """
+        for namespace in self._iter_cached(('namespaces',), self._iter_pages(self.get_namespace_data, 'namespace')):
+            yield namespace
 
-            r = requests.get("{0}//object/namespaces".format(self.authentication.url),
-                             headers=headers, verify=False)
+    def iter_buckets(self, namespace):
+        """
+        Yields every bucket of a namespace, following marker / limit pagination so that only one
+        page of buckets is held in memory at a time.  The bucket list is served from the metadata
+        cache while it is valid.
+        """
+        pages = self._iter_pages(lambda marker, limit: self.get_bucket_data(namespace, marker, limit), 'object_bucket')
 
-            if r.status_code == requests.codes.ok:
-                self.logger.debug('ECSManagementAPI::ecs_collect_namespace_data()::'
-                                  '/object/namespaces call returned '
-                                  'with a 200 status code.  Text is: ' + r.text)
-                self.response_json = r.json()
+        for bucket in self._iter_cached(('buckets', namespace), pages):
+            yield bucket
 
-                self.logger.debug('ECSManagementAPI::ecs_collect_namespace_data()::r.text() contains: \n' + r.text)
+    def invalidate_metadata(self, namespace=None):
+        """
+        Drops the cached bucket list of a namespace or, when no namespace is given, all cached metadata.
+        """
+        if namespace is None:
+            self.metadata_cache.invalidate()
+        else:
+            self.metadata_cache.invalidate(('buckets', namespace))
 
-                if type(self.response_json) is list:
-                    self.logger.debug('ECSManagementAPI::ecs_collect_namespace_data()::r.json() returned a list. ')
-                elif type(self.response_json) is dict:
-                    self.logger.debug('ECSManagementAPI::ecs_collect_namespace_data()::r.json() returned a dictionary. ')
-                else:
-                    self.logger.debug('ECSManagementAPI::ecs_collect_namespace_data()::r.json() returned unknown. ')
-                break
-            else:
-                if r.status_code == self.ecs_authentication_failure:
-                    # Attempt to re-authenticate
-                    self.authentication.token = None
-                    self.authentication.connect()
+    def _iter_cached(self, key, items):
+        if not self.metadata_cache.enabled():
+            for item in items:
+                yield item
+            return
 
-                    if self.authentication.token is None:
-                        self.logger.error('ECSManagementAPI::ecs_collect_namespace_data()::Token Expired.  Unable '
-                                          'to re-authenticate to ECS as configured.  Please validate and try again.')
-                        raise ECSException("The ECS Data Collection Module was unable to re-authenticate.")
-                        break
-                else:
-                    self.logger.error('ECSManagementAPI::ecs_collect_namespace_data()::/object/namespaces '
-                                      'call against host ' + self.authentication.host + ' failed with a status code of ' + str(r.status_code))
-                    self.response_json = None
-                    break
-        return self.response_json
+        cached_items = self.metadata_cache.get(key)
 
-    def get_bucket_data(self, namespace):
+        if cached_items is not None:
+            for item in cached_items:
+                yield item
+        else:
+            # Only cache the listing once it has been enumerated completely
+            enumerated_items = []
+            for item in items:
+                enumerated_items.append(item)
+                yield item
 
-        while True:
-            # Perform ECS Object Namespace API Call
-            headers = {'X-SDS-AUTH-TOKEN': "'{0}'".format(self.authentication.token),
-                       'content-type': 'application/json', 'Accept': 'application/json'}
+            self.metadata_cache.put(key, enumerated_items)
 
-            params_dict = {'namespace': namespace, }
+    def _iter_pages(self, get_page, item_key):
+        marker = None
 
-            r = requests.get("{0}//object/bucket".format(self.authentication.url),
-                             headers=headers, verify=False, params=params_dict)
+        while True:
+            page = get_page(marker, self.pagesize).data
 
-            if r.status_code == requests.codes.ok:
-                self.logger.debug('ECSManagementAPI::get_bucket_data()::'
-                                  '/object/bucket call returned '
-                                  'with a 200 status code.  Text is: ' + r.text)
-                self.response_json = r.json()
+            if page is None:
+                raise ECSException("Unable to retrieve a page of " + item_key + " data from host " +
+                                   self.authentication.host + ".")
 
-                self.logger.debug('ECSManagementAPI::get_bucket_data()::r.text() contains: \n' + r.text)
+            items = page.get(item_key)
+            if type(items) is not list:
+                raise ECSException("The " + item_key + " list was not found in the data returned by host " +
+                                   self.authentication.host + ".")
 
-                if type(self.response_json) is list:
-                    self.logger.debug('ECSManagementAPI::get_bucket_data()::r.json() returned a list. ')
-                elif type(self.response_json) is dict:
-                    self.logger.debug('ECSManagementAPI::get_bucket_data()::r.json() returned a dictionary. ')
-                else:
-                    self.logger.debug('ECSManagementAPI::get_bucket_data()::r.json() returned unknown. ')
-                break
-            else:
-                if r.status_code == self.ecs_authentication_failure:
-                    # Attempt to re-authenticate
-                    self.authentication.token = None
-                    self.authentication.connect()
+            for item in items:
+                yield item
 
-                    if self.authentication.token is None:
-                        self.logger.error('ECSManagementAPI::get_bucket_data()::Token Expired.  Unable '
-                                          'to re-authenticate to ECS as configured.  Please validate and try again.')
-                        raise ECSException("The ECS Data Collection Module was unable to re-authenticate.")
-                        break
-                else:
-                    self.logger.error('ECSManagementAPI::get_bucket_data()::/object/bucket '
-                                      'call against host ' + self.authentication.host + ' failed with a status code of ' + str(r.status_code))
-                    self.response_json = None
-                    break
-        return self.response_json
+            # ECS returns the marker of the next page when more items are available
+            marker = page.get('NextMarker') or page.get('next_marker')
+            if not marker or not items:
+                break
 
     def get_ecs_detail_data(self, field, metric_list=[], metric_values={}):
         # Valid 'metric_list' is a list of dictionary items
@@ -537,8 +872,8 @@ class ECSManagementAPI(object):
         # { 't' : '<epoch time>', '<units of measure>' : '<data>' }
         # Third key is 'Avg' which just has a value
         for keys in summary_dict:
-            self.logger.debug('ECSManagementAPI::get_ecs_summary_data()::'
-                              'Key in summary_dict being processed is: ' + keys)
+            self.logger.debug('ECSManagementAPI::get_ecs_summary_data()::Key in summary_dict being processed is: %s',
+                              keys)
 
             if type(summary_dict[keys]) is list:
                 # Check non-empty list. Since list is only item we can address
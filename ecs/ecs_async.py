@@ -0,0 +1,97 @@
+"""
+DELL EMC ECS API Data Collection Module.
+"""
+import asyncio
+import time
+import aiohttp
+from ecs.ecs import ECSException
+from ecs.ecs import ECSResponse
+from ecs.ecs import fastjson
+
+
+class ECSAsyncManagementAPI(object):
+    """
+    Perform ECS Management API Calls on an asyncio event loop.  Authentication, token refresh and
+    dashboard parameters are shared with the ECSManagementAPI object of the same ECS.
+    """
+
+    def __init__(self, managementapi):
+        self.ecs_authentication_failure = int('497')
+        self.managementapi = managementapi
+        self.authentication = managementapi.authentication
+        self.logger = managementapi.logger
+        self.semaphore = asyncio.Semaphore(managementapi.maxconcurrentrequests)
+        self.session = None
+
+    def _get_session(self):
+        """
+        Returns the pooled aiohttp session for this ECS, creating it on first use so that it is bound
+        to the running event loop.
+        """
+        if self.session is None:
+            connector = aiohttp.TCPConnector(limit=self.authentication.poolsize, ssl=False,
+                                             force_close=not self.authentication.keepalive)
+            timeout = aiohttp.ClientTimeout(sock_connect=float(self.managementapi.connecttimeout),
+                                            sock_read=float(self.managementapi.readtimeout))
+            self.session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+        return self.session
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def request(self, endpoint):
+        """
+        Performs a GET against an ECS Management API JSON endpoint and returns its response with the decoded
+        data or no data on failure.  At most the configured number of requests are in flight against the ECS
+        at the same time.
+        """
+        loop = asyncio.get_event_loop()
+        path = endpoint.path
+
+        params = {}
+        if endpoint.dashboard:
+            params.update(self.managementapi.get_dashboard_params())
+
+        while True:
+            # Token refresh may log in to ECS so it is run off the event loop
+            token = await loop.run_in_executor(None, self.authentication.get_token)
+
+            headers = {'X-SDS-AUTH-TOKEN': "'{0}'".format(token),
+                       'content-type': 'application/json', 'Accept': 'application/json'}
+
+            async with self.semaphore:
+                start_time = time.monotonic()
+                async with self._get_session().get("{0}/{1}".format(self.authentication.url, path),
+                                                   headers=headers, params=params) as r:
+                    status = r.status
+                    body = await r.read()
+                latency = time.monotonic() - start_time
+
+            if status == 200:
+                self.logger.debug('ECSAsyncManagementAPI::request()::/%s call returned with a 200 status code.',
+                                  path)
+                data = fastjson.loads(body)
+
+                # Stream endpoints hand their instances to the collectors one at a time
+                if endpoint.stream:
+                    data = iter(data['_embedded']['_instances'])
+
+                return ECSResponse(status, latency, len(body), data)
+
+            if status == self.ecs_authentication_failure:
+                # Attempt to re-authenticate.  Only one thread logs in again while the others wait for its token
+                await loop.run_in_executor(None, self.authentication.refresh, token)
+
+                if self.authentication.token is None:
+                    self.logger.error('ECSAsyncManagementAPI::request()::Token Expired.  Unable to re-authenticate to '
+                                      'ECS as configured for host %s.  Please validate and try again.',
+                                      self.authentication.host)
+                    raise ECSException("The ECS Data Collection Module was unable to "
+                                       "re-authenticate against host " + self.authentication.host + ".")
+            else:
+                self.logger.error('ECSAsyncManagementAPI::request()::/%s call against host %s failed with a status '
+                                  'code of %s', path, self.authentication.host, status)
+                return ECSResponse(status, latency, len(body))
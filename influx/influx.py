@@ -2,7 +2,17 @@
 DELL EMC ECS API Data Collection Module.
 """
 from influxdb import InfluxDBClient
+from influxdb.exceptions import InfluxDBClientError
+from influxdb.exceptions import InfluxDBServerError
+from influxdb.line_protocol import make_line
+import calendar
+import collections
+import json
+import os
 import requests
+import socket
+import threading
+import time
 from requests.auth import HTTPBasicAuth
 
 
@@ -10,6 +20,11 @@ class InfluxException(Exception):
     pass
 
 
+# Write errors after which Influx can accept the same points later.  Points rejected with any other error,
+# such as a field type conflict, are never accepted.
+INFLUX_RETRYABLE_ERRORS = (InfluxDBServerError, requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+
 class InfluxUtility(object):
     """
     Stores ECS Authentication Information
@@ -30,15 +45,14 @@ class InfluxUtility(object):
 
             for db in db_list:
                 if db['name'] == name:
-                    self.logger.info('InfluxUtility::check_db_exists()::Database ' + name + ' found.')
+                    self.logger.info('InfluxUtility::check_db_exists()::Database %s found.', name)
                     return True
 
-            self.logger.info('InfluxUtility::check_db_exists()::Database ' + name + ' not found.')
+            self.logger.info('InfluxUtility::check_db_exists()::Database %s not found.', name)
             return False
 
         except Exception as e:
-            self.logger.error('InfluxUtility::check_db_exists()::The following '
-                              'unhandled exception occured: ' + e.message)
+            self.logger.error('InfluxUtility::check_db_exists()::The following unhandled exception occured: %s', e)
             return False
 
     def write_point_data(self, name):
@@ -53,13 +67,614 @@ class InfluxUtility(object):
 
             for db in db_list:
                 if db['name'] == name:
-                    self.logger.info('InfluxUtility::check_db_exists()::Database ' + name + ' found.')
+                    self.logger.info('InfluxUtility::check_db_exists()::Database %s found.', name)
                     return True
 
-            self.logger.info('InfluxUtility::check_db_exists()::Database ' + name + ' not found.')
+            self.logger.info('InfluxUtility::check_db_exists()::Database %s not found.', name)
             return False
 
         except Exception as e:
-            self.logger.error('InfluxUtility::check_db_exists()::The following '
-                              'unhandled exception occured: ' + e.message)
+            self.logger.error('InfluxUtility::check_db_exists()::The following unhandled exception occured: %s', e)
             return False
+
+
+class InfluxLineProtocolWriter(object):
+    """
+    Writes data points to Influx as line protocol serialized directly from the point dictionaries.  Escaped
+    measurement names, tag sets and field keys, and the epoch time of timestamp strings, are cached and reused
+    across points and cycles.  The lines are identical to the ones the influxdb client produces, points with
+    timestamps it can not handle itself are serialized by the client's own make_line().
+    """
+    # Multiplier from epoch seconds to each supported time precision
+    PRECISIONS = {None: 10 ** 9, 'n': 10 ** 9, 'u': 10 ** 6, 'ms': 10 ** 3, 's': 1}
+
+    def __init__(self, influxclient, cachesize=100000):
+        self.influxclient = influxclient
+        self.cachesize = int(cachesize)
+        self.escaped = {}
+        self.tagsets = {}
+        self.times = {}
+
+    @staticmethod
+    def escape(value):
+        if isinstance(value, bytes):
+            value = value.decode('utf-8')
+        elif value is None:
+            value = ''
+        else:
+            value = str(value)
+
+        return value.replace('\\', '\\\\').replace(' ', '\\ ').replace(',', '\\,').replace('=', '\\=') \
+            .replace('\n', '\\n')
+
+    @staticmethod
+    def format_value(value):
+        value_type = type(value)
+
+        if value_type is float:
+            return repr(value)
+        if value is None:
+            return ''
+        if value_type is bytes:
+            value = value.decode('utf-8')
+            value_type = str
+        if value_type is str:
+            return '"' + value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"'
+        if value_type is bool:
+            return str(value)
+        if isinstance(value, int):
+            return str(value) + 'i'
+
+        try:
+            return repr(float(value))
+        except (TypeError, ValueError):
+            return str(value)
+
+    def _cached(self, cache, key, make):
+        value = cache.get(key)
+
+        if value is None:
+            # Entities come and go so the caches are simply started over once they are full
+            if len(cache) >= self.cachesize:
+                cache.clear()
+            value = cache[key] = make(key)
+
+        return value
+
+    def _escape_key(self, key):
+        return self._cached(self.escaped, key, self.escape)
+
+    def _make_tagset(self, items):
+        tagset = ''
+
+        for key, value in sorted(items, key=lambda item: item[0]):
+            key = self._escape_key(key)
+            value = self.escape(value)
+            if key != '' and value != '':
+                tagset += ',' + key + '=' + value
+
+        return tagset
+
+    def _make_time(self, timestamp):
+        # The timestamps written by the collectors are UTC in a single fixed format
+        return calendar.timegm(time.strptime(timestamp, "%Y-%m-%dT%H:%M:%S"))
+
+    def make_line(self, point, precision=None, time_scale=1):
+        """
+        Returns the line protocol line of a data point.  Integer timestamps are multiplied by the time scale.
+        """
+        timestamp = point.get('time')
+
+        if timestamp is None:
+            line_time = None
+        elif type(timestamp) is int:
+            line_time = timestamp * time_scale
+        elif type(timestamp) is str and precision in self.PRECISIONS:
+            try:
+                line_time = self._cached(self.times, timestamp, self._make_time) * self.PRECISIONS[precision]
+            except ValueError:
+                return make_line(point.get('measurement'), point.get('tags'), point.get('fields'), timestamp,
+                                 precision)
+        else:
+            return make_line(point.get('measurement'), point.get('tags'), point.get('fields'), timestamp, precision)
+
+        line = self._escape_key(point.get('measurement'))
+
+        tags = point.get('tags')
+        if tags:
+            line += self._cached(self.tagsets, tuple(tags.items()), self._make_tagset)
+
+        fields = []
+        point_fields = point.get('fields') or {}
+        for key in sorted(point_fields):
+            escaped_key = self._escape_key(key)
+            value = self.format_value(point_fields[key])
+            if escaped_key != '' and value != '':
+                fields.append(escaped_key + '=' + value)
+
+        if fields:
+            line += ' ' + ','.join(fields)
+
+        if line_time is not None:
+            line += ' ' + str(line_time)
+
+        return line
+
+    def make_lines(self, points, precision=None, time_scale=1):
+        """
+        Returns the line protocol lines of a list of data points
+        """
+        return [self.make_line(point, precision, time_scale) for point in points]
+
+    def write_points(self, points, time_precision=None):
+        """
+        Writes data points to Influx as line protocol
+        """
+        return self.influxclient.write_points(self.make_lines(points, time_precision), time_precision=time_precision,
+                                              protocol='line')
+
+
+class InfluxUDPWriter(object):
+    """
+    Fire and forget writer that sends data points to the UDP listener of Influx as line protocol.  Lines are
+    packed into datagrams of at most payload size bytes, a single line larger than that is sent on its own.
+    Timestamps are sent in nanoseconds, the default precision of the Influx UDP listener.  Points that can not
+    be sent are counted and dropped rather than raising, nothing is retried.
+    """
+    def __init__(self, host, port, logger, payloadsize=1400, serializer=None):
+        self.logger = logger
+        self.payloadsize = int(payloadsize)
+        self.serializer = serializer or InfluxLineProtocolWriter(None)
+        self.lock = threading.Lock()
+        self.sent = 0
+        self.dropped = 0
+        self.datagrams = 0
+
+        family, socktype, proto, canonname, address = socket.getaddrinfo(host, int(port), 0, socket.SOCK_DGRAM)[0]
+        self.address = address
+        self.udp_socket = socket.socket(family, socktype, proto)
+
+    def write_points(self, points, time_precision=None):
+        """
+        Sends data points to Influx.  Returns False if any of them could not be sent.
+        """
+        time_scale = InfluxLineProtocolWriter.PRECISIONS['n'] // InfluxLineProtocolWriter.PRECISIONS[time_precision]
+        lines = self.serializer.make_lines(points, 'n', time_scale)
+
+        sent = 0
+        dropped = 0
+        datagrams = 0
+        payload = []
+        payload_size = 0
+        for line in lines:
+            line = (line + '\n').encode('utf-8')
+
+            if payload and payload_size + len(line) > self.payloadsize:
+                if self._send(payload):
+                    sent += len(payload)
+                    datagrams += 1
+                else:
+                    dropped += len(payload)
+                payload = []
+                payload_size = 0
+
+            payload.append(line)
+            payload_size += len(line)
+
+        if payload:
+            if self._send(payload):
+                sent += len(payload)
+                datagrams += 1
+            else:
+                dropped += len(payload)
+
+        with self.lock:
+            self.sent += sent
+            self.dropped += dropped
+            self.datagrams += datagrams
+
+        return not dropped
+
+    def get_stats(self):
+        """
+        Returns the writer statistics
+        """
+        with self.lock:
+            return {'sent': self.sent, 'dropped': self.dropped, 'datagrams': self.datagrams}
+
+    def close(self):
+        """
+        Closes the UDP socket
+        """
+        self.udp_socket.close()
+
+        if self.dropped:
+            self.logger.warning('InfluxUDPWriter::close()::%s points could not be sent to Influx.', self.dropped)
+
+    def _send(self, payload):
+        try:
+            self.udp_socket.sendto(b''.join(payload), self.address)
+            return True
+        except OSError as e:
+            self.logger.error('InfluxUDPWriter::_send()::Unable to send %s points to Influx at %s. Cause: %s',
+                              len(payload), self.address, e)
+            return False
+
+
+class InfluxTransportRouter(object):
+    """
+    Hands every data point to the writer of the transport configured for its measurement.  Measurements
+    without a transport of their own go to the default transport.
+    """
+    def __init__(self, transports, measurementtransports, defaulttransport):
+        self.transports = transports
+        self.default = transports[defaulttransport]
+        self.measurements = dict((measurement, transports[transport])
+                                 for measurement, transport in measurementtransports.items())
+
+    def write_points(self, points, time_precision=None):
+        """
+        Writes data points through the transports of their measurements
+        """
+        if not self.measurements:
+            return self.default.write_points(points, time_precision=time_precision)
+
+        writes = collections.OrderedDict()
+        for point in points:
+            writes.setdefault(self.measurements.get(point['measurement'], self.default), []).append(point)
+
+        result = True
+        for writer, writer_points in writes.items():
+            result = writer.write_points(writer_points, time_precision=time_precision) is not False and result
+
+        return result
+
+    def close(self):
+        """
+        Closes the UDP sockets of the transports
+        """
+        for writer in self.transports.values():
+            if isinstance(writer, InfluxUDPWriter):
+                writer.close()
+
+
+class InfluxBatchWriter(object):
+    """
+    Shared background writer for Influx data points.  Collectors hand their points to write_points() which
+    only queues them.  A single writer thread sends the queued points to Influx in batches once a full batch
+    has been queued or the oldest queued point has waited for the flush interval.  The queue holds at most
+    queue size points, when it is full collectors either wait for room or their points are dropped.  A batch
+    only ever holds points written with the same time precision.
+    """
+    def __init__(self, influxclient, logger, batchsize=5000, flushinterval=1, queuesize=100000,
+                 queuefullpolicy='block'):
+        self.influxclient = influxclient
+        self.logger = logger
+        self.batchsize = int(batchsize)
+        self.flushinterval = float(flushinterval)
+        self.queuesize = int(queuesize)
+        self.block = queuefullpolicy == 'block'
+        self.condition = threading.Condition()
+        self.points = collections.deque()
+        # [time precision, point count] of consecutive runs of queued points
+        self.precisions = collections.deque()
+        self.oldest = None
+        self.closing = False
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.batches = 0
+
+        self.thread = threading.Thread(target=self._run)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def write_points(self, points, time_precision=None):
+        """
+        Queues data points for writing.  Returns False if the points were dropped because the queue is full.
+        """
+        if not points:
+            return True
+
+        with self.condition:
+            # A single write larger than the whole queue is let in once the queue has drained
+            while not self.closing and self.points and len(self.points) + len(points) > self.queuesize:
+                if not self.block:
+                    self.dropped += len(points)
+                    return False
+                self.condition.wait()
+
+            if not self.points:
+                self.oldest = time.monotonic()
+            self.points.extend(points)
+
+            if self.precisions and self.precisions[-1][0] == time_precision:
+                self.precisions[-1][1] += len(points)
+            else:
+                self.precisions.append([time_precision, len(points)])
+
+            if len(self.points) >= self.batchsize:
+                self.condition.notify_all()
+
+        return True
+
+    def get_stats(self):
+        """
+        Returns the writer statistics
+        """
+        with self.condition:
+            return {'queued': len(self.points),
+                    'written': self.written,
+                    'dropped': self.dropped,
+                    'failed': self.failed,
+                    'batches': self.batches}
+
+    def close(self):
+        """
+        Writes all queued points and stops the writer thread
+        """
+        with self.condition:
+            self.closing = True
+            self.condition.notify_all()
+
+        self.thread.join()
+
+        if self.dropped:
+            self.logger.warning('InfluxBatchWriter::close()::%s points were dropped because the write queue was '
+                                'full.', self.dropped)
+
+    def _next_batch(self):
+        with self.condition:
+            while True:
+                if self.points:
+                    if self.closing or len(self.points) >= self.batchsize:
+                        break
+
+                    wait = self.oldest + self.flushinterval - time.monotonic()
+                    if wait <= 0:
+                        break
+                elif self.closing:
+                    return None
+                else:
+                    wait = None
+
+                self.condition.wait(wait)
+
+            # Cut the batch short where the time precision of the queued points changes
+            run = self.precisions[0]
+            time_precision = run[0]
+            count = min(self.batchsize, run[1])
+            run[1] -= count
+            if not run[1]:
+                self.precisions.popleft()
+
+            batch = [self.points.popleft() for _ in range(count)]
+            self.oldest = time.monotonic() if self.points else None
+
+            # Wake collectors waiting for room in the queue
+            self.condition.notify_all()
+
+            return batch, time_precision
+
+    def _run(self):
+        while True:
+            next_batch = self._next_batch()
+            if next_batch is None:
+                return
+
+            batch, time_precision = next_batch
+            try:
+                self.influxclient.write_points(batch, time_precision=time_precision)
+
+                with self.condition:
+                    self.written += len(batch)
+                    self.batches += 1
+            except Exception as e:
+                with self.condition:
+                    self.failed += len(batch)
+
+                self.logger.error('InfluxBatchWriter::_run()::Unable to write a batch of %s points to Influx. '
+                                  'Cause: %s', len(batch), e, exc_info=True)
+
+
+class InfluxSpool(object):
+    """
+    Durable write ahead spool in front of an Influx client.  Points that can not be written to Influx are
+    appended to segment files in the spool directory and every following write goes to the spool as well
+    until a background thread has replayed the spooled points to Influx, oldest segment first and at a
+    limited rate.  The spool is capped at a maximum size by discarding its oldest segments.  Segments left
+    behind by a previous run are replayed on startup.  The time precision of every spooled write is kept so
+    its points are replayed with the precision they were written with.  Only writes that failed because
+    Influx was unreachable, timed out or failed with a server error are spooled.  Spooled points Influx
+    rejects on replay, and spool lines that can not be decoded, are logged and skipped.
+    """
+    def __init__(self, influxclient, logger, directory, segmentsize=16, maxsize=1024, replaymaxpointspersecond=5000,
+                 replayinterval=10):
+        self.influxclient = influxclient
+        self.logger = logger
+        self.directory = directory
+        self.segmentsize = int(segmentsize) * 1024 * 1024
+        self.maxsize = int(maxsize) * 1024 * 1024
+        self.replaymaxpointspersecond = float(replaymaxpointspersecond)
+        self.replayinterval = float(replayinterval)
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.spooled = 0
+        self.replayed = 0
+        self.discarded = 0
+        self.rejected = 0
+        self.corrupt = 0
+
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+
+        # Segments are named by sequence number and creation time so they sort in the order they were written
+        self.segments = sorted(name for name in os.listdir(self.directory) if name.endswith('.spool'))
+        if self.segments:
+            self.sequence = int(self.segments[-1].split('-')[0]) + 1
+            self.logger.info('InfluxSpool::Found %s spool segments from a previous run to replay.', len(self.segments))
+        else:
+            self.sequence = 0
+        self.active = None
+
+        self.thread = threading.Thread(target=self._run)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def write_points(self, points, time_precision=None):
+        """
+        Writes points to Influx or, when Influx is unavailable or earlier points are still spooled, to the spool
+        """
+        with self.lock:
+            spooling = bool(self.segments)
+
+        if not spooling:
+            try:
+                return self.influxclient.write_points(points, time_precision=time_precision)
+            except INFLUX_RETRYABLE_ERRORS as e:
+                self.logger.error('InfluxSpool::write_points()::Unable to write %s points to Influx, spooling them '
+                                  'until Influx is available. Cause: %s', len(points), e)
+
+        self._append(points, time_precision)
+        return True
+
+    def get_stats(self):
+        """
+        Returns the spool depth and the age in seconds of the oldest spooled segment
+        """
+        with self.lock:
+            segments = list(self.segments)
+            stats = {'spooled': self.spooled, 'replayed': self.replayed, 'discarded': self.discarded,
+                     'rejected': self.rejected, 'corrupt': self.corrupt}
+
+        stats['segments'] = len(segments)
+        stats['bytes'] = sum(self._segment_size(name) for name in segments)
+        stats['oldest_age'] = time.time() - int(segments[0].split('-')[1].split('.')[0]) if segments else 0
+
+        return stats
+
+    def close(self):
+        """
+        Stops replaying.  Points that are still spooled are replayed by the next run.
+        """
+        self.stop_event.set()
+        self.thread.join()
+
+    def _segment_size(self, name):
+        try:
+            return os.path.getsize(os.path.join(self.directory, name))
+        except OSError:
+            return 0
+
+    def _append(self, points, time_precision=None):
+        line = json.dumps({'precision': time_precision, 'points': points}, default=lambda value: value.decode('utf-8', 'replace')
+                          if isinstance(value, bytes) else str(value)) + '\n'
+
+        with self.lock:
+            if self.active is None or self._segment_size(self.active) >= self.segmentsize:
+                self.active = '{0:012d}-{1}.spool'.format(self.sequence, int(time.time()))
+                self.sequence += 1
+                self.segments.append(self.active)
+
+            with open(os.path.join(self.directory, self.active), 'a') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+            self.spooled += len(points)
+
+            # Discard the oldest segments once the spool is over its size cap
+            while len(self.segments) > 1 and sum(self._segment_size(name) for name in self.segments) > self.maxsize:
+                discarded = self.segments.pop(0)
+                self._remove(discarded)
+                self.discarded += 1
+                self.logger.error('InfluxSpool::_append()::Spool is over its size cap, discarded segment %s.',
+                                  discarded)
+
+    def _remove(self, name):
+        try:
+            os.remove(os.path.join(self.directory, name))
+        except OSError:
+            pass
+
+    def _run(self):
+        while not self.stop_event.wait(self.replayinterval):
+            try:
+                self._replay()
+            except Exception as e:
+                self.logger.error('InfluxSpool::_run()::Unable to replay the spool to Influx, retrying in %s '
+                                  'seconds. Cause: %s', self.replayinterval, e)
+
+    def _replay(self):
+        while not self.stop_event.is_set():
+            with self.lock:
+                if not self.segments:
+                    return
+
+                segment = self.segments[0]
+
+                # New points go to a new segment while the active one is replayed
+                if segment == self.active:
+                    self.active = None
+
+            stats = self.get_stats()
+            self.logger.info('InfluxSpool::_replay()::Replaying segment %s.  Spool holds %s segments, %s bytes, '
+                             'oldest is %d seconds old.', segment, stats['segments'], stats['bytes'],
+                             stats['oldest_age'])
+
+            start_time = time.monotonic()
+            replayed = 0
+
+            try:
+                with open(os.path.join(self.directory, segment), 'r') as f:
+                    lines = f.readlines()
+            except IOError:
+                # The segment was discarded by the size cap
+                lines = []
+
+            for line in lines:
+                if self.stop_event.is_set():
+                    return
+
+                # Segments spooled before the time precision was recorded hold plain lists of points.  A line
+                # torn by a crash while it was appended can not be decoded and is skipped.
+                try:
+                    spooled = json.loads(line)
+                    if isinstance(spooled, list):
+                        spooled = {'precision': None, 'points': spooled}
+                    points = spooled['points']
+                    time_precision = spooled['precision']
+                except (ValueError, KeyError, TypeError) as e:
+                    with self.lock:
+                        self.corrupt += 1
+                    self.logger.error('InfluxSpool::_replay()::Skipping a spool line of segment %s that can not be '
+                                      'decoded. Cause: %s', segment, e)
+                    continue
+
+                try:
+                    self.influxclient.write_points(points, time_precision=time_precision)
+                except InfluxDBClientError as e:
+                    # Influx will never accept these points so replaying them again would block the spool
+                    with self.lock:
+                        self.rejected += len(points)
+                    self.logger.error('InfluxSpool::_replay()::Influx rejected %s spooled points of segment %s, '
+                                      'discarding them. Cause: %s  Line: %s', len(points), segment, e, line.rstrip())
+                    continue
+
+                replayed += len(points)
+
+                with self.lock:
+                    self.replayed += len(points)
+
+                # Stay below the configured replay rate
+                if self.replaymaxpointspersecond > 0:
+                    delay = start_time + replayed / self.replaymaxpointspersecond - time.monotonic()
+                    if delay > 0:
+                        self.stop_event.wait(delay)
+
+            with self.lock:
+                if self.segments and self.segments[0] == segment:
+                    self.segments.pop(0)
+                self._remove(segment)
+
+            self.logger.info('InfluxSpool::_replay()::Replayed %s points from segment %s.', replayed, segment)
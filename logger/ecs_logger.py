@@ -2,11 +2,20 @@
 DELL EMC ECS API Data Collection Module.
 """
 import abc
+import collections
 import logging
 import os
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler
+from logging.handlers import QueueListener
 from logging.handlers import RotatingFileHandler
 
 DEFAULT_LOG_FILE_NAME = "ecs-pulse.log"
+DEFAULT_QUEUE_SIZE = 10000
+DEFAULT_ERROR_SUPPRESSION_WINDOW = 60
+MAX_SUPPRESSED_ERRORS = 1000
 
 
 class _Logger(object):
@@ -17,51 +26,213 @@ class _Logger(object):
     __metaclass__ = abc.ABCMeta
 
     @abc.abstractmethod
-    def debug(self, msg):
+    def debug(self, msg, *args):
         pass
 
     @abc.abstractmethod
-    def info(self, msg):
+    def info(self, msg, *args):
         pass
 
     @abc.abstractmethod
-    def warning(self, msg):
+    def warning(self, msg, *args):
         pass
 
     @abc.abstractmethod
-    def error(self, msg):
+    def error(self, msg, *args, exc_info=False):
         pass
 
+    @abc.abstractmethod
+    def is_enabled_for(self, level):
+        pass
+
+
+class _ECSQueueHandler(QueueHandler):
+    """
+    Hands records to a bounded queue.  When the queue is full a record is either dropped and counted
+    or the logging thread waits for the listener to make room.
+    """
+
+    def __init__(self, log_queue, block):
+        QueueHandler.__init__(self, log_queue)
+        self.block = block
+        self.dropped = 0
+        self.dropped_lock = threading.Lock()
+
+    def enqueue(self, record):
+        if self.block:
+            self.queue.put(record)
+            return
+
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self.dropped_lock:
+                self.dropped += 1
+
+
+class _ECSQueueListener(QueueListener):
+    """
+    Waits for room in a full queue to hand over the stop request rather than failing.
+    """
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
 
 class ECSLogger(_Logger):
+    """
+    Messages are %-style format strings.  The arguments are only formatted into the message when a
+    record is actually emitted at the configured logging level.  In asynchronous mode records are put
+    on a bounded in memory queue and written to the log file by a single background listener so the
+    logging threads never wait on disk I/O or log file rollover.
+
+    An error that repeats within the error suppression window is only logged once, the number of
+    repeats is logged when the window closes.  Its traceback is only formatted for the logged occurrence.
+    """
     _PREFIX = '[DellEMCECSDataCollection] '
 
-    def __init__(self, module_name, logging_level, log_file=DEFAULT_LOG_FILE_NAME):
+    def __init__(self, module_name, logging_level, log_file=DEFAULT_LOG_FILE_NAME, async_logging=False,
+                 queue_size=DEFAULT_QUEUE_SIZE, queue_full_policy='drop',
+                 error_suppression_window=DEFAULT_ERROR_SUPPRESSION_WINDOW):
         fullLogFilePath = os.path.abspath(os.path.join(os.getcwd(), DEFAULT_LOG_FILE_NAME))
         handler = RotatingFileHandler(log_file, maxBytes=1024*1024, backupCount=100)
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s : %(message)s')
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s : ' + ECSLogger._PREFIX + '%(message)s')
         handler.setFormatter(formatter)
         handler.setLevel(logging_level)
         self.logger = logging.getLogger(module_name)
         self.logger.propagate = False
         self.logger.setLevel(logging_level)
-        self.logger.addHandler(handler)
+        self.queue_handler = None
+        self.listener = None
+
+        # Errors logged within the suppression window keyed by message, oldest first, with the
+        # time they were logged and the number of repeats suppressed since
+        self.error_suppression_window = float(error_suppression_window)
+        self.error_lock = threading.Lock()
+        self.errors = collections.OrderedDict()
+
+        if async_logging:
+            self.queue_handler = _ECSQueueHandler(queue.Queue(int(queue_size)), queue_full_policy == 'block')
+            self.listener = _ECSQueueListener(self.queue_handler.queue, handler, respect_handler_level=True)
+            self.listener.start()
+            self.logger.addHandler(self.queue_handler)
+        else:
+            self.logger.addHandler(handler)
+
+    def debug(self, msg, *args):
+        self.logger.debug(msg, *args)
+
+    def info(self, msg, *args):
+        self.logger.info(msg, *args)
+
+    def warning(self, msg, *args):
+        self.logger.warning(msg, *args)
+
+    def error(self, msg, *args, exc_info=False):
+        if self.error_suppression_window <= 0:
+            self.logger.error(msg, *args, exc_info=exc_info)
+            return
+
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+
+        message = msg % args if args else msg
+        now = time.monotonic()
+
+        with self.error_lock:
+            expired = self._expire_errors(now)
+
+            entry = self.errors.get(message)
+            if entry is not None:
+                entry[1] += 1
+            else:
+                self.errors[message] = [now, 0]
+
+        self._log_suppressed(expired)
+
+        if entry is None:
+            self.logger.error(message, exc_info=exc_info)
+
+    def _expire_errors(self, now):
+        # Entries are kept in the order they were logged so only the front of the dictionary has to be checked
+        expired = []
+
+        while self.errors:
+            message, entry = next(iter(self.errors.items()))
+            if now - entry[0] < self.error_suppression_window and len(self.errors) < MAX_SUPPRESSED_ERRORS:
+                break
+
+            del self.errors[message]
+            if entry[1]:
+                expired.append((message, entry[1], now - entry[0]))
+
+        return expired
+
+    def _log_suppressed(self, expired):
+        for message, count, elapsed in expired:
+            self.logger.error('The following error was repeated %s more times in the last %d seconds: %s',
+                              count, elapsed, message)
+
+    def flush_suppressed_errors(self):
+        """
+        Logs the repeat counts of all errors that are still within their suppression window.
+        """
+        with self.error_lock:
+            expired = [(message, entry[1], time.monotonic() - entry[0])
+                       for message, entry in self.errors.items() if entry[1]]
+            self.errors.clear()
+
+        self._log_suppressed(expired)
+
+    def is_enabled_for(self, level):
+        """
+        Returns True if records of the given level are emitted.  Used to skip building debug
+        arguments that are expensive to compute.
+        """
+        return self.logger.isEnabledFor(level)
+
+    def get_dropped_count(self):
+        """
+        Returns the number of records dropped because the asynchronous logging queue was full.
+        """
+        if self.queue_handler is None:
+            return 0
+
+        with self.queue_handler.dropped_lock:
+            return self.queue_handler.dropped
+
+    def close(self):
+        """
+        Flushes all queued records to the log file and stops the background listener.  The logger
+        writes synchronously from then on.
+        """
+        self.flush_suppressed_errors()
+
+        if self.listener is None:
+            return
+
+        dropped = self.get_dropped_count()
+        self.logger.removeHandler(self.queue_handler)
 
-    def debug(self, msg):
-        self.logger.debug(ECSLogger._PREFIX + msg)
+        # Stopping the listener writes every record that is still queued
+        self.listener.stop()
 
-    def info(self, msg):
-        self.logger.info(ECSLogger._PREFIX + msg)
+        for handler in self.listener.handlers:
+            self.logger.addHandler(handler)
 
-    def warning(self, msg):
-        self.logger.warning(ECSLogger._PREFIX + msg)
+        self.listener = None
+        self.queue_handler = None
 
-    def error(self, msg):
-        self.logger.error(ECSLogger._PREFIX + msg)
+        if dropped:
+            self.logger.warning('ECSLogger::close()::%s log records were dropped because the logging queue was full.',
+                                dropped)
 
 
-def get_logger(module_name=None, logging_level=logging.INFO, log_file=DEFAULT_LOG_FILE_NAME):
+def get_logger(module_name=None, logging_level=logging.INFO, log_file=DEFAULT_LOG_FILE_NAME, async_logging=False,
+               queue_size=DEFAULT_QUEUE_SIZE, queue_full_policy='drop',
+               error_suppression_window=DEFAULT_ERROR_SUPPRESSION_WINDOW):
     """
     Provides the default logger for the application.
     """
-    return ECSLogger(module_name, logging_level, log_file)
\ No newline at end of file
+    return ECSLogger(module_name, logging_level, log_file, async_logging, queue_size, queue_full_policy,
+                     error_suppression_window)
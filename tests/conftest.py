@@ -0,0 +1,8 @@
+"""
+DELL EMC ECS API Data Collection Module.
+"""
+import os
+import sys
+
+# The modules are imported from the repository root the same way ecs-pulse.py imports them
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
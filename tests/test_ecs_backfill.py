@@ -0,0 +1,115 @@
+"""
+DELL EMC ECS API Data Collection Module.
+
+Tests of the gap backfill thread.  Polls that succeed or fail while an ECS is being backfilled must neither
+backfill it a second time nor lose the gap they open.
+"""
+import importlib.util
+import os
+import threading
+import unittest
+
+from ecs.ecs import ECS_ENDPOINTS, ECSWatermarks
+
+spec = importlib.util.spec_from_file_location(
+    'ecs_pulse', os.path.join(os.path.dirname(__file__), os.pardir, 'ecs-pulse.py'))
+ecs_pulse = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(ecs_pulse)
+
+ENDPOINTS = [ECS_ENDPOINTS['local_zone'], ECS_ENDPOINTS['local_zone_node'], ECS_ENDPOINTS['local_zone_disk']]
+
+
+class RecordingLogger(object):
+    def __init__(self):
+        self.errors = []
+
+    def error(self, msg, *args, **kwargs):
+        self.errors.append(msg % args if args else msg)
+
+    def info(self, msg, *args, **kwargs):
+        pass
+
+    debug = warning = info
+
+
+class Shutdown(object):
+    """
+    Stands in for the signal handler and requests a shutdown once the backfill thread runs out of work
+    """
+    kill_now = False
+
+    def __init__(self):
+        self.event = threading.Event()
+
+    def wait(self, timeout):
+        self.kill_now = True
+        self.event.set()
+        return True
+
+
+class Response(object):
+    status = 200
+    data = {}
+
+
+class Authentication(object):
+    host = 'ecs1'
+
+
+class ECSConnection(object):
+    """
+    Answers every history request and runs a live poll of the ECS while the first one is in progress
+    """
+    def __init__(self, live_poll):
+        self.authentication = Authentication()
+        self.live_poll = live_poll
+        self.requests = []
+
+    def request(self, endpoint, params=None):
+        self.requests.append(endpoint.measurement)
+        if len(self.requests) == 1:
+            self.live_poll(self)
+        return Response()
+
+
+class ECSBackfillTest(unittest.TestCase):
+
+    def setUp(self):
+        self.logger = RecordingLogger()
+        ecs_pulse._ecsWatermarks = ECSWatermarks(None, self.logger)
+        ecs_pulse.controlledShutdown = Shutdown()
+
+    def run_backfill(self, live_poll):
+        ecsconnection = ECSConnection(lambda connection: live_poll(backfill, connection))
+        backfill = ecs_pulse.ECSBackfill(None, self.logger, [ecsconnection], ENDPOINTS, 100, 0)
+        backfill.backfill_endpoint = lambda connection, endpoint, data, floor: True
+        backfill.start()
+        backfill.join(10)
+
+        self.assertFalse(backfill.is_alive())
+        self.assertEqual([], self.logger.errors)
+        return backfill, ecsconnection
+
+    def test_successful_poll_during_startup_backfill(self):
+        backfill, ecsconnection = self.run_backfill(lambda backfill, connection: backfill.poll_succeeded(connection))
+
+        self.assertEqual([endpoint.measurement for endpoint in ENDPOINTS], ecsconnection.requests)
+        self.assertEqual({}, backfill.floors)
+        self.assertEqual(0, len(backfill.pending))
+
+    def test_failed_poll_during_startup_backfill(self):
+        def live_poll(backfill, connection):
+            backfill.poll_failed(connection)
+            backfill.poll_succeeded(connection)
+
+        backfill, ecsconnection = self.run_backfill(live_poll)
+
+        # The gap of the failed poll is kept and backfilled after the next successful poll
+        self.assertEqual([endpoint.measurement for endpoint in ENDPOINTS], ecsconnection.requests)
+        self.assertIn(ecsconnection, backfill.floors)
+        backfill.poll_succeeded(ecsconnection)
+        self.assertEqual([ecsconnection], list(backfill.pending))
+
+
+if __name__ == '__main__':
+    unittest.main()
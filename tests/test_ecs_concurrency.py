@@ -0,0 +1,164 @@
+"""
+DELL EMC ECS API Data Collection Module.
+
+Concurrency stress test of ECSManagementAPI against a local mock ECS.  Many threads share one API object
+and interleave calls to different endpoints while the mock ECS expires their token now and then.  Every
+response has to carry the payload of its own call.
+"""
+import concurrent.futures
+import json
+import logging
+import random
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from ecs.ecs import ECS_ENDPOINTS, ECSAuthentication, ECSManagementAPI
+from logger import ecs_logger
+
+THREADS = 16
+CALLS_PER_THREAD = 150
+TOKEN_ROTATION_REQUESTS = 200                 # The mock ECS expires all tokens after this many requests
+INSTANCES = 40
+
+JSON_ENDPOINTS = ['local_zone', 'local_zone_node', 'local_zone_disk', 'local_zone_replication']
+
+
+def mock_payload(path, call):
+    """
+    Returns the JSON payload the mock ECS answers a dashboard call with
+    """
+    if path.endswith('localzone'):
+        return {'path': path, 'call': call, 'values': [{'t': str(i), 'Percent': call} for i in range(INSTANCES)]}
+
+    return {'_embedded': {'_instances': [{'displayName': '{0}-{1}-{2}'.format(path, call, i), 'call': call}
+                                         for i in range(INSTANCES)]}}
+
+
+class MockECSHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        server = self.server
+
+        if url.path == '/login':
+            with server.lock:
+                server.logins += 1
+                token = 'token-{0}'.format(server.logins)
+                server.tokens.add(token)
+            self._send(200, b'', {'X-SDS-AUTH-TOKEN': token})
+            return
+
+        with server.lock:
+            server.requests += 1
+            if server.requests % TOKEN_ROTATION_REQUESTS == 0:
+                server.tokens.clear()
+            valid = self.headers.get('X-SDS-AUTH-TOKEN', '').strip("'") in server.tokens
+
+        if not valid:
+            self._send(497, b'')
+            return
+
+        # Hold the response back for a moment so calls from different threads interleave
+        time.sleep(random.random() * 0.002)
+
+        call = parse_qs(url.query).get('call', [''])[0]
+        if url.path.startswith('/object/billing/'):
+            namespace, bucket = url.path.split('/')[4:6]
+            body = ('<bucket_billing_info><namespace>{0}</namespace><name>{1}</name><call>{2}</call>'
+                    '</bucket_billing_info>'.format(namespace, bucket, call)).encode('utf-8')
+            self._send(200, body, {'Content-Type': 'application/xml'})
+        else:
+            body = json.dumps(mock_payload(url.path.lstrip('/'), call)).encode('utf-8')
+            self._send(200, body, {'Content-Type': 'application/json'})
+
+    def _send(self, status, body, headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ECSConcurrencyTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), MockECSHandler)
+        cls.server.daemon_threads = True
+        cls.server.lock = threading.Lock()
+        cls.server.tokens = set()
+        cls.server.logins = 0
+        cls.server.requests = 0
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever)
+        cls.server_thread.daemon = True
+        cls.server_thread.start()
+
+        cls.log_dir = tempfile.TemporaryDirectory()
+        cls.logger = ecs_logger.get_logger('test_ecs_concurrency', logging.ERROR,
+                                           cls.log_dir.name + '/test_ecs_concurrency.log')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.logger.close()
+        cls.log_dir.cleanup()
+
+    def test_interleaved_calls_never_cross_contaminate(self):
+        authentication = ECSAuthentication('http', '127.0.0.1', 'user', 'password', self.server.server_address[1],
+                                           self.logger, poolsize=THREADS)
+        authentication.connect()
+        api = ECSManagementAPI(authentication, 15, 60, self.logger)
+
+        def worker(thread):
+            mismatches = []
+            rng = random.Random(thread)
+
+            for i in range(CALLS_PER_THREAD):
+                call = '{0}-{1}'.format(thread, i)
+
+                if rng.random() < 0.2:
+                    namespace, bucket = 'ns{0}'.format(thread), 'bucket{0}'.format(i)
+                    response = api.request(ECS_ENDPOINTS['bucket_billing'], {'call': call},
+                                           namespace=namespace, bucket=bucket)
+                    actual = (response.data.findtext('namespace'), response.data.findtext('name'),
+                              response.data.findtext('call'))
+                    expected = (namespace, bucket, call)
+                else:
+                    endpoint = ECS_ENDPOINTS[rng.choice(JSON_ENDPOINTS)]
+                    response = api.request(endpoint, {'call': call})
+                    expected = mock_payload(endpoint.path, call)
+                    if endpoint.shape == 'instances':
+                        expected = expected['_embedded']['_instances']
+                        actual = list(response.data) if endpoint.stream else \
+                            response.data['_embedded']['_instances']
+                    else:
+                        actual = response.data
+
+                if response.status != 200 or actual != expected:
+                    mismatches.append((call, response.status))
+
+            return mismatches
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=THREADS) as executor:
+            results = list(executor.map(worker, range(THREADS)))
+
+        self.assertEqual([], [mismatch for mismatches in results for mismatch in mismatches])
+
+        # Calls that found their token expired at the same time shared a single login
+        rotations = self.server.requests // TOKEN_ROTATION_REQUESTS
+        self.assertGreater(rotations, 0)
+        self.assertLessEqual(self.server.logins, rotations + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+DELL EMC ECS API Data Collection Module.
+
+Tests of the concurrent dashboard polls.  An ECS that stalls must only lose its own data points, every other
+ECS has to be written every cycle.
+"""
+import importlib.util
+import os
+import threading
+import types
+import unittest
+
+from ecs.ecs import ECS_ENDPOINTS, ECSWatermarks
+
+spec = importlib.util.spec_from_file_location(
+    'ecs_pulse', os.path.join(os.path.dirname(__file__), os.pardir, 'ecs-pulse.py'))
+ecs_pulse = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(ecs_pulse)
+
+CYCLES = 5
+HOSTS = ['ecs1', 'ecs2', 'ecs3']
+STALLED_HOST = 'ecs1'
+
+
+class RecordingLogger(object):
+    def __init__(self):
+        self.errors = []
+
+    def error(self, msg, *args, **kwargs):
+        self.errors.append(msg % args if args else msg)
+
+    def info(self, msg, *args, **kwargs):
+        pass
+
+    def is_enabled_for(self, level):
+        return False
+
+    debug = warning = info
+
+
+class RecordingInfluxClient(object):
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.writes = dict((host, 0) for host in HOSTS)
+
+    def write_points(self, points, time_precision=None):
+        with self.lock:
+            self.writes[points[0]['tags']['vdc']] += 1
+        return True
+
+
+class Response(object):
+    status = 200
+    bytes = 0
+    latency = 0.0
+
+    def __init__(self):
+        self.data = {'totalProvisioned_gb': 100, 'totalFree_gb': 40}
+
+
+class ECSConnection(object):
+    """
+    Answers every dashboard call right away, except on the stalled ECS which never answers until released
+    """
+    polltimeout = 0.2
+
+    def __init__(self, host, release):
+        self.authentication = types.SimpleNamespace(host=host)
+        self.release = release
+        self.requests = 0
+
+    def request(self, endpoint, params=None):
+        self.requests += 1
+        if self.authentication.host == STALLED_HOST:
+            self.release.wait()
+        return Response()
+
+
+class ECSPollConnectionsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.logger = RecordingLogger()
+        ecs_pulse._configuration = types.SimpleNamespace(ecsconnections=HOSTS, database_time_precision='s')
+        ecs_pulse._ecsVDCLookup = types.SimpleNamespace(vdc_json=dict((host, host) for host in HOSTS))
+        ecs_pulse._ecsWatermarks = ECSWatermarks(None, self.logger)
+        ecs_pulse._ecsBackfill = None
+
+    def test_stalled_ecs_does_not_starve_the_others(self):
+        release = threading.Event()
+        influxclient = RecordingInfluxClient()
+        ecsconnections = [ECSConnection(host, release) for host in HOSTS]
+        executor = ecs_pulse.ecs_poll_executor()
+        outstanding = {}
+
+        try:
+            for cycle in range(CYCLES):
+                ecs_pulse.ecs_poll_connections(influxclient, self.logger, 'ecs_collect_capacity_data()',
+                                               ecsconnections, executor, ECS_ENDPOINTS['capacity'], outstanding)
+        finally:
+            release.set()
+            executor.shutdown(wait=True)
+
+        self.assertEqual({'ecs1': 0, 'ecs2': CYCLES, 'ecs3': CYCLES}, influxclient.writes)
+
+        # The stalled ECS was polled once and then skipped while its poll was in flight
+        self.assertEqual([1, CYCLES, CYCLES], [ecsconnection.requests for ecsconnection in ecsconnections])
+        self.assertEqual(CYCLES, len([error for error in self.logger.errors if STALLED_HOST in error]))
+        self.assertEqual([], [error for error in self.logger.errors if STALLED_HOST not in error])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+"""
+DELL EMC ECS API Data Collection Module.
+
+Property test of InfluxLineProtocolWriter against the influxdb client.  The writer has to produce exactly the
+lines the client's own make_line() produces, so that an upgrade of the client that changes its serialization
+shows up here instead of as silently different data in Influx.
+"""
+import datetime
+import unittest
+
+from influxdb.line_protocol import make_line
+
+from influx.influx import InfluxLineProtocolWriter
+
+try:
+    from hypothesis import given, settings, strategies as st
+except ImportError:
+    st = None
+
+PRECISIONS = [None, 'n', 'u', 'ms', 's', 'm', 'h']
+
+if st is not None:
+    # Free text plus the names and the characters the line protocol has to escape
+    text = st.text(st.characters(codec='utf-8', exclude_categories=('Cs',)), max_size=8) | \
+        st.sampled_from(['vdc', 'NodeID', 'a b', 'x,y=z', 'q\\', '"', '\n'])
+    values = st.none() | st.booleans() | st.integers(-2 ** 63, 2 ** 63) | st.floats(allow_nan=False) | text | \
+        text.map(lambda value: value.encode('utf-8'))
+    timestamps = st.none() | st.integers(0, 2 ** 62) | \
+        st.datetimes(min_value=datetime.datetime(1971, 1, 1), max_value=datetime.datetime(2100, 1, 1)).map(
+            lambda value: value.strftime("%Y-%m-%dT%H:%M:%S")) | \
+        st.just('2020-01-01 10:00:00+02:00')
+    points = st.fixed_dictionaries({'measurement': text, 'tags': st.dictionaries(text, text, max_size=4),
+                                    'fields': st.dictionaries(text, values, max_size=5), 'time': timestamps})
+
+
+@unittest.skipIf(st is None, 'hypothesis is not installed')
+class InfluxLineProtocolWriterTest(unittest.TestCase):
+
+    def setUp(self):
+        # A small cache so that the writer also evicts and refills its caches while the examples run
+        self.writer = InfluxLineProtocolWriter(None, cachesize=50)
+
+    if st is not None:
+        @settings(max_examples=1000, deadline=None)
+        @given(points, st.sampled_from(PRECISIONS))
+        def test_make_line_matches_influxdb_client(self, point, precision):
+            expected = make_line(point['measurement'], point['tags'], point['fields'], point['time'], precision)
+            self.assertEqual(expected, self.writer.make_line(point, precision))
+
+
+if __name__ == '__main__':
+    unittest.main()